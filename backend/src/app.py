@@ -83,38 +83,22 @@ def create_app(config: object | None = None) -> Flask:
     # Database initialization
     db.init_app(app)
 
+    # ---- Password Hashing ----
+    # Fork the hashing workers now, before the server starts its threads
+    from backend.src.services import password_hasher
+
+    password_hasher.init_app(app)
+
     # ---- Models Registration ----
     # Import models so SQLAlchemy knows about them
 
     # ---- Cache & Sessions ----
-    # Initialize cache service (auto-detects Redis/Filesystem/Memory)
-    from backend.src.services.cache_service import CacheBackend, cache_service
-
-    # Configure Flask-Session based on cache backend
-    if cache_service.backend == CacheBackend.REDIS:
-        # Use Redis for sessions (distributed, persistent)
-        app.config["SESSION_TYPE"] = "redis"
-        app.config["SESSION_REDIS"] = cache_service.client.redis
-        app.logger.info("Sessions: Using Redis backend")
-    elif cache_service.backend == CacheBackend.FILESYSTEM:
-        # Use Filesystem for sessions (cPanel compatible)
-        app.config["SESSION_TYPE"] = "filesystem"
-        # Use Flask's instance_path to ensure correct path resolution
-        session_dir = os.path.join(app.instance_path, "sessions")
-        app.config["SESSION_FILE_DIR"] = session_dir
-        # Create directory if it doesn't exist
-        os.makedirs(session_dir, exist_ok=True)
-        app.logger.info(f"Sessions: Using Filesystem backend at {session_dir}")
-    else:
-        # Fallback to default Flask sessions (memory, not persistent)
-        app.config["SESSION_TYPE"] = "null"
-        app.logger.warning("Sessions: Using Memory backend (not persistent!)")
+    # The cache service (auto-detects Redis/Mmap/Filesystem/Memory) is set up
+    # on import; the session store follows its choice of Redis
 
     # Common session config
-    app.config["SESSION_PERMANENT"] = False
-    app.config["SESSION_USE_SIGNER"] = True
     app.config["SESSION_KEY_PREFIX"] = "xf:"
-    app.config["PERMANENT_SESSION_LIFETIME"] = 86400  # 24 hours
+    app.config["PERMANENT_SESSION_LIFETIME"] = 86400  # 24 hours, sliding
 
     # Cookie security settings
     app.config["SESSION_COOKIE_SECURE"] = False  # Set to True in HTTPS only
@@ -123,10 +107,11 @@ def create_app(config: object | None = None) -> Flask:
     app.config["SESSION_COOKIE_PATH"] = "/"  # Ensure cookie is sent to all paths
     # Note: Don't set DOMAIN for localhost/development
 
-    # Initialize Flask-Session
-    from flask_session import Session
+    # Server-side sessions: Redis when the cache uses Redis, SQLite otherwise
+    from backend.src.services import session_store
 
-    Session(app)
+    store = session_store.init_app(app)
+    app.logger.info(f"Sessions: Using {store.name} store")
 
     # ---- Compression ----
     # Enable Gzip compression for responses
@@ -153,6 +138,12 @@ def create_app(config: object | None = None) -> Flask:
     app.after_request(add_security_headers)
     app.after_request(add_cache_headers)
 
+    # ---- Query Instrumentation ----
+    # Opt-in (QUERY_STATS_ENABLED): Server-Timing, N+1 and slow-query logs
+    from backend.src.services import query_stats
+
+    query_stats.init_app(app)
+
     # ---- Logging ----
     logging.basicConfig(
         level=logging.INFO,
@@ -192,11 +183,20 @@ def create_app(config: object | None = None) -> Flask:
     login_manager.login_message = "Veuillez vous connecter pour accéder à cette page."
     login_manager.login_message_category = "info"
 
+    from backend.src.services import principal_service
+    from backend.src.services.principal_service import PrincipalService
+
+    principal_service.init_app(app)
+
+    # Failed-login counters in the cache, buffered last_login writes
+    from backend.src.services import login_tracker
+
+    login_tracker.init_app(app)
+
     @login_manager.user_loader
-    def load_user(user_id: int) -> Any:
-        """Load user by ID for Flask-Login"""
-        from backend.src.models.user import User
-        return User.query.get(int(user_id))
+    def load_user(user_id: str) -> Any:
+        """Load the session principal for Flask-Login (no query while it is current)"""
+        return PrincipalService.load(*PrincipalService.parse_id(user_id))
 
     # ---- Translations (i18n) ----
     from backend.src.utils.i18n import init_translations, t
@@ -221,12 +221,10 @@ def inject_language() -> dict[str, object]:
         lang = session.get("lang")
 
         if not lang and _translations:
-            # Détecte depuis le navigateur si pas en session
+            # Détecte depuis le navigateur si pas en session. Pas de sauvegarde :
+            # la détection est refaite à chaque requête, sans créer de session
             lang = _translations.detect_browser_language()
-            logger.info(f"Language detected from browser: {lang}")
-            # Sauvegarde dans la session
-            session["lang"] = lang
-            session.modified = True
+            logger.debug(f"Language detected from browser: {lang}")
 
         logger.debug(f"Context language: {lang}")
         return {"lang": lang or "en"}
@@ -347,9 +345,12 @@ def generate_csrf() -> str:
 
     # ---- CLI Commands ----
     try:
-        from backend.src.cli import admin
+        from backend.src.cli import admin, password, search, settings
 
         admin.init_app(app)
+        password.init_app(app)
+        search.init_app(app)
+        settings.init_app(app)
     except ImportError:
         app.logger.warning("CLI commands not available")
 
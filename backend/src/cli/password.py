@@ -0,0 +1,67 @@
+"""
+Commande Flask CLI pour calibrer le coût du hachage des mots de passe
+
+Usage:
+    flask benchmark-password-hash [--target-ms 250] [--rounds 3]
+
+Mesure scrypt (N = 2^14 à 2^18) et pbkdf2 sur cette machine, puis propose
+la valeur de PASSWORD_HASH_METHOD la plus coûteuse sous la latence visée.
+Les hachages existants sont mis à jour à la prochaine connexion.
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from backend.src.services.password_hasher import password_hasher
+
+SCRYPT_CANDIDATES = [f"scrypt:{2 ** exp}:8:1" for exp in range(14, 19)]
+PBKDF2_CANDIDATES = [
+    f"pbkdf2:sha256:{n}" for n in (300_000, 600_000, 1_000_000, 2_000_000)
+]
+
+
+@click.command("benchmark-password-hash")
+@click.option(
+    "--target-ms", default=250, show_default=True, help="Latence visée par hachage (ms)"
+)
+@click.option(
+    "--rounds", default=3, show_default=True, help="Mesures par méthode (médiane)"
+)
+@with_appcontext
+def benchmark_password_hash_command(target_ms, rounds):
+    """Mesurer le coût des méthodes de hachage des mots de passe"""
+    click.echo(f"Méthode actuelle : {password_hasher.method}")
+    click.echo(f"Workers : {password_hasher.workers}")
+    click.echo("")
+
+    timings = {}
+    for method in [*SCRYPT_CANDIDATES, *PBKDF2_CANDIDATES]:
+        try:
+            timings[method] = password_hasher.benchmark(method, rounds=rounds) * 1000
+        except (ValueError, MemoryError) as e:
+            click.echo(f"  {method:<26} indisponible ({e})")
+            continue
+        marker = " *" if method == password_hasher.method else ""
+        click.echo(f"  {method:<26} {timings[method]:8.1f} ms{marker}")
+
+    # Prefer scrypt (memory-hard); pbkdf2 only when no scrypt cost fits
+    def fits(method):
+        return timings.get(method, float("inf")) <= target_ms
+
+    fitting = [m for m in SCRYPT_CANDIDATES if fits(m)]
+    if not fitting:
+        fitting = [m for m in PBKDF2_CANDIDATES if fits(m)]
+
+    click.echo("")
+    if not fitting:
+        raise click.ClickException(
+            f"Aucune méthode sous {target_ms} ms sur cette machine."
+        )
+
+    click.echo(f"✓ Recommandé pour {target_ms} ms :")
+    click.echo(f"  PASSWORD_HASH_METHOD={fitting[-1]}")
+
+
+def init_app(app):
+    """Enregistrer la commande dans l'app Flask"""
+    app.cli.add_command(benchmark_password_hash_command)
@@ -0,0 +1,32 @@
+"""
+Commande Flask CLI pour reconstruire l'index de recherche plein texte
+
+Usage:
+    flask rebuild-search-index
+
+Crée l'index s'il manque (base existante, migration) puis le repeuple
+depuis la table content.
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from backend.src.services.search_service import SearchService
+
+
+@click.command("rebuild-search-index")
+@with_appcontext
+def rebuild_search_index_command():
+    """Reconstruire l'index de recherche du contenu"""
+    try:
+        count = SearchService.rebuild()
+    except RuntimeError as e:
+        raise click.ClickException(str(e)) from None
+
+    click.echo(f"✓ Index de recherche reconstruit ({SearchService.dialect()}).")
+    click.echo(f"  {count} contenu(s) indexé(s).")
+
+
+def init_app(app):
+    """Enregistrer la commande dans l'app Flask"""
+    app.cli.add_command(rebuild_search_index_command)
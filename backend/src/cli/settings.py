@@ -0,0 +1,36 @@
+"""
+Commande Flask CLI pour la rotation de la clé de chiffrement des paramètres
+
+Usage:
+    1. Déployer la nouvelle FLASK_SECRET_KEY avec l'ancienne dans
+       FLASK_SECRET_KEY_FALLBACKS (l'application continue de lire les valeurs)
+    2. flask rotate-settings-key
+    3. Retirer l'ancienne clé de FLASK_SECRET_KEY_FALLBACKS
+"""
+
+import click
+from cryptography.fernet import InvalidToken
+from flask.cli import with_appcontext
+
+from backend.src.models.settings import Settings
+
+
+@click.command("rotate-settings-key")
+@with_appcontext
+def rotate_settings_key_command():
+    """Re-chiffrer les paramètres sensibles avec la SECRET_KEY actuelle"""
+    try:
+        count = Settings.rotate_encryption()
+    except InvalidToken as e:
+        raise click.ClickException(
+            f"{e}. Ajoutez l'ancienne clé à FLASK_SECRET_KEY_FALLBACKS. "
+            "Aucune valeur n'a été modifiée."
+        ) from None
+
+    click.echo(f"✓ {count} paramètre(s) re-chiffré(s) avec la clé actuelle.")
+    click.echo("  Vous pouvez retirer l'ancienne clé de FLASK_SECRET_KEY_FALLBACKS.")
+
+
+def init_app(app):
+    """Enregistrer la commande dans l'app Flask"""
+    app.cli.add_command(rotate_settings_key_command)
@@ -105,9 +105,13 @@ class Config:
 
     Environment Variables:
         FLASK_SECRET_KEY: Secret key for session signing (REQUIRED in production)
+        FLASK_SECRET_KEY_FALLBACKS: Previous secret keys (comma-separated), still
+            accepted for sessions and encrypted settings during a key rotation
         FLASK_DEBUG: Enable debug mode (default: False)
         FLASK_ENV: Environment name (development, testing, production)
         SQLALCHEMY_DATABASE_URI: Full database connection string
+        QUERY_STATS_ENABLED: Per-request SQL statement counts and timings
+            (Server-Timing header, N+1 and slow-query warnings)
         DB_TYPE: Database type (sqlite, mysql, postgresql)
         DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_NAME: DB connection params
         DEPLOYMENT_TARGET: Deployment platform (development, cpanel, vps, docker)
@@ -156,6 +160,11 @@ class Config:
         # Dev default (NOT for production)
         SECRET_KEY = "dev-key-change-in-production-immediately"  # noqa: S105
 
+    # Previous keys, accepted for verification/decryption only (rotation)
+    SECRET_KEY_FALLBACKS = [
+        key for key in os.getenv("FLASK_SECRET_KEY_FALLBACKS", "").split(",") if key
+    ]
+
     DEBUG = os.getenv("FLASK_DEBUG", "False").lower() in ("true", "1", "yes")
 
     # Database
@@ -166,6 +175,12 @@ class Config:
         "1",
         "yes",
     )
+    # Server-Timing header + N+1 / slow-query warnings (services/query_stats.py)
+    QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "False").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
     SQLALCHEMY_ENGINE_OPTIONS = {
         "pool_pre_ping": True,  # Verify connections before using
         "pool_recycle": 3600,  # Recycle connections after 1 hour
@@ -57,13 +57,12 @@ def dashboard():
 
     @wraps(f)
     def decorated_function(*args: Any, **kwargs: Any):  # type: ignore[no-untyped-def]
-        from backend.src.services.user_service import UserService
+        from backend.src.services.principal_service import PrincipalService
 
-        # Dev-safe admin check: try to load 'admin' from DB; if it exists and
-        # is admin, allow access
+        # Session principal: no users query while its auth_version is current
         try:
-            user = UserService.get_by_username("admin")
-            if not user or not user.is_admin:
+            principal = PrincipalService.current()
+            if not principal or not principal.is_active or not principal.is_admin:
                 current_app.logger.warning("Unauthorized admin access attempt")
                 abort(403)
         except OperationalError:
@@ -98,12 +97,11 @@ def preferences():
 
     @wraps(f)
     def decorated_function(*args: Any, **kwargs: Any):  # type: ignore[no-untyped-def]
-        from backend.src.services.user_service import UserService
+        from backend.src.services.principal_service import PrincipalService
 
-        # Dev-safe auth check: treat 'admin' as logged in if exists and active
         try:
-            user = UserService.get_by_username("admin")
-            if not user or not user.is_active:
+            principal = PrincipalService.current()
+            if not principal or not principal.is_active:
                 current_app.logger.warning("Unauthorized access attempt")
                 abort(401)
         except OperationalError:
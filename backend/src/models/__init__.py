@@ -27,8 +27,9 @@
 """
 
 # Import all models for SQLAlchemy registration
+from backend.src.models.backup_code import BackupCode
 from backend.src.models.content import Content
 from backend.src.models.preferences import UserPreferences
 from backend.src.models.user import User
 
-__all__ = ["User", "UserPreferences", "Content"]
+__all__ = ["User", "UserPreferences", "Content", "BackupCode"]
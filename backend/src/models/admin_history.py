@@ -39,6 +39,10 @@ class AdminHistory(db.Model):
     """
 
     __tablename__ = "admin_history"
+    __table_args__ = (
+        # Per-admin history, newest first (AdminService.get_history)
+        db.Index("ix_admin_history_admin_timestamp", "admin_id", "timestamp"),
+    )
 
     # Primary Key
     id = db.Column(db.Integer, primary_key=True)
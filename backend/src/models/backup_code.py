@@ -0,0 +1,78 @@
+"""
+------------------------------------------------------------------------------
+Purpose: Backup Code model
+Description: 2FA recovery codes, one row per code
+
+File: backend/src/models/backup_code.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T22:00:00+00:00
+Last modified (Git): TBD | Commit: TBD
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+
+Notes:
+- lookup = HMAC-SHA256(SECRET_KEY, code), truncated: finds the row for a
+  submitted code without trying every hash, and is useless without the key
+- code_hash = slow password hash, checked once for the matching row
+- A code is consumed by a single conditional UPDATE of used_at
+  (TOTPService.verify_backup_code)
+------------------------------------------------------------------------------
+"""
+
+from datetime import datetime
+
+from backend.src.extensions import db
+
+
+class BackupCode(db.Model):  # type: ignore[name-defined]
+    """
+    Backup Code model
+
+    One 2FA recovery code of a user (see TOTPService).
+    """
+
+    __tablename__ = "backup_codes"
+    __table_args__ = (
+        db.Index("ix_backup_codes_user_lookup", "user_id", "lookup"),
+    )
+
+    # Primary Key
+    id = db.Column(db.Integer, primary_key=True)
+
+    # Foreign Keys
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # Code
+    lookup = db.Column(db.String(32), nullable=False)
+    code_hash = db.Column(db.String(255), nullable=False)
+
+    # Timestamps
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    used_at = db.Column(db.DateTime, nullable=True)
+
+    # Relationships
+    user = db.relationship(
+        "User",
+        backref=db.backref(
+            "backup_code_rows",
+            cascade="all, delete-orphan",
+            passive_deletes=True,
+            lazy="dynamic",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation"""
+        used = self.used_at is not None
+        return f"<BackupCode {self.id} user_id={self.user_id} used={used}>"
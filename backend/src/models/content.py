@@ -23,8 +23,18 @@
 
 from datetime import datetime
 
+from sqlalchemy import DDL, event
+
 from backend.src.extensions import db
 
+EXCERPT_LENGTH = 200
+
+
+def make_excerpt(body: str | None) -> str:
+    """Excerpt shown in listings (first EXCERPT_LENGTH chars, "..." if cut)"""
+    body = body or ""
+    return body[:EXCERPT_LENGTH] + "..." if len(body) > EXCERPT_LENGTH else body
+
 
 class Content(db.Model):  # type: ignore[name-defined]
     """
@@ -34,6 +44,17 @@ class Content(db.Model):  # type: ignore[name-defined]
     """
 
     __tablename__ = "content"
+    __table_args__ = (
+        # Listings are filtered by type/status/author and ordered by
+        # (created_at, id): one index per access path serves both the filter
+        # and the order (see ContentService and tests/test_query_plans.py)
+        db.Index("ix_content_created_at_id", "created_at", "id"),
+        db.Index(
+            "ix_content_type_status_created_at", "type", "status", "created_at", "id"
+        ),
+        db.Index("ix_content_status_created_at", "status", "created_at", "id"),
+        db.Index("ix_content_author_created_at", "author_id", "created_at", "id"),
+    )
 
     # Primary Key
     id = db.Column(db.Integer, primary_key=True)
@@ -43,20 +64,22 @@ class Content(db.Model):  # type: ignore[name-defined]
         db.Integer,
         db.ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
 
     # Content Data
     title = db.Column(db.String(200), nullable=False, index=True)
     body = db.Column(db.Text, nullable=False)
+    # First EXCERPT_LENGTH characters of body, kept in sync on every body
+    # assignment so list views never need to load body
+    excerpt = db.Column(db.String(EXCERPT_LENGTH + 3), nullable=True)
 
     # Metadata
     type = db.Column(
-        db.String(50), default="post", nullable=False, index=True
+        db.String(50), default="post", nullable=False
     )  # post, page, article
 
     status = db.Column(
-        db.String(20), default="draft", nullable=False, index=True
+        db.String(20), default="draft", nullable=False
     )  # draft, published, archived
 
     # Timestamps
@@ -95,11 +118,63 @@ def to_dict(self, include_body: bool = False) -> dict:
         if include_body:
             data["body"] = self.body
         else:
-            # Include excerpt (first 200 chars)
-            excerpt = self.body[:200]
-            data["excerpt"] = excerpt + "..." if len(self.body) > 200 else self.body
+            # Stored excerpt (rows written before the column existed fall back
+            # to body)
+            data["excerpt"] = (
+                self.excerpt if self.excerpt is not None else make_excerpt(self.body)
+            )
 
         if self.author:
             data["author"] = {"id": self.author.id, "username": self.author.username}
 
         return data
+
+
+@event.listens_for(Content.body, "set")
+def _sync_excerpt(
+    target: Content, value: str | None, _old: object, _initiator: object
+) -> None:
+    """Keep the stored excerpt in sync with body"""
+    target.excerpt = make_excerpt(value)
+
+
+# ---- Full-text search index ----
+# One index per database backend, created with the table (db.create_all) and
+# queried by services/search_service.py. PostgreSQL and MySQL maintain their
+# index themselves; the SQLite FTS5 table is kept in sync by ContentService.
+
+FTS_TABLE = "content_fts"
+FTS_INDEX = "ix_content_search"
+
+# Title terms rank above body terms (weight A vs B)
+PG_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(body, '')), 'B')"
+)
+
+SEARCH_DDL = {
+    "sqlite": (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        "title, body, tokenize = 'unicode61 remove_diacritics 2')",
+        f"DROP TABLE IF EXISTS {FTS_TABLE}",
+    ),
+    "postgresql": (
+        f"CREATE INDEX IF NOT EXISTS {FTS_INDEX} ON content "
+        f"USING GIN (({PG_SEARCH_VECTOR}))",
+        f"DROP INDEX IF EXISTS {FTS_INDEX}",
+    ),
+    "mysql": (
+        f"CREATE FULLTEXT INDEX {FTS_INDEX} ON content (title, body)",
+        None,  # dropped with the table
+    ),
+}
+SEARCH_DDL["mariadb"] = SEARCH_DDL["mysql"]
+
+for _dialect, (_create, _drop) in SEARCH_DDL.items():
+    event.listen(
+        Content.__table__, "after_create", DDL(_create).execute_if(dialect=_dialect)
+    )
+    if _drop:
+        event.listen(
+            Content.__table__, "before_drop", DDL(_drop).execute_if(dialect=_dialect)
+        )
@@ -19,18 +19,58 @@
 - Classification: Internal
 Notes:
 - Supports encryption for sensitive fields (passwords, API keys)
-- Uses Fernet symmetric encryption with Flask SECRET_KEY
+- Uses Fernet symmetric encryption with Flask SECRET_KEY (cipher cached per
+  key; SECRET_KEY_FALLBACKS still decrypt during a key rotation)
+- Reads are served from a per-app snapshot (decoded, decrypted), reloaded
+  when any worker commits a settings change (cache tag "settings")
 """
 
 import base64
+import copy
+import hashlib
 import json
+import logging
+import os
+import time
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
 
 from backend.src.extensions import db
 
+logger = logging.getLogger(__name__)
+
+# Ciphers keyed by a hash of (SECRET_KEY, *SECRET_KEY_FALLBACKS)
+_ciphers: dict[str, MultiFernet] = {}
+
+# Bumped on every settings commit/rollback in this process, so the worker
+# that made a change never serves its own stale snapshot
+_local_generation = 0
+
+
+class SettingsSnapshot:
+    """Decoded view of every settings row, shared by one app's requests"""
+
+    __slots__ = ("values", "version", "generation", "checked_at")
+
+    def __init__(
+        self,
+        values: Mapping[str, Any],
+        version: str | None,
+        generation: int,
+        checked_at: float,
+    ):
+        """Initialize snapshot"""
+        self.values = values
+        self.version = version
+        self.generation = generation
+        self.checked_at = checked_at
+
 
 class Settings(db.Model):
     """
@@ -61,6 +101,12 @@ class Settings(db.Model):
         db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
 
+    # Cache tag whose version token changes on every settings commit
+    CACHE_TAG = "settings"
+
+    # Seconds between two checks of the cross-worker version token
+    SNAPSHOT_CHECK_INTERVAL = float(os.getenv("SETTINGS_CACHE_CHECK_INTERVAL", 1.0))
+
     # List of fields that should be encrypted
     ENCRYPTED_FIELDS = [
         "smtp_password",
@@ -171,17 +217,42 @@ def __repr__(self) -> str:
         return f"<Settings {self.key}={self.value[:50]}{suffix}>"
 
     @staticmethod
-    def _get_fernet_key(app=None) -> Fernet:
-        """Get Fernet cipher using Flask SECRET_KEY."""
+    def _get_fernet_key(app=None) -> MultiFernet:
+        """
+        Get the cipher for Flask SECRET_KEY (cached).
+
+        Encrypts with SECRET_KEY; also decrypts values written under any of
+        SECRET_KEY_FALLBACKS, so a new key can be deployed before the stored
+        values are re-encrypted (see rotate_encryption).
+        """
         from flask import current_app
 
         app = app or current_app
-        secret_key = app.config.get("SECRET_KEY", "").encode()
+        secret_key = app.config.get("SECRET_KEY", "")
 
-        # Ensure key is 32 bytes for Fernet
         if not secret_key:
             raise RuntimeError("SECRET_KEY not configured")
 
+        keys = [secret_key, *(app.config.get("SECRET_KEY_FALLBACKS") or [])]
+        fingerprint = hashlib.sha256(
+            b"\x00".join(
+                key.encode() if isinstance(key, str) else key for key in keys
+            )
+        ).hexdigest()
+
+        cipher = _ciphers.get(fingerprint)
+        if cipher is None:
+            cipher = _ciphers[fingerprint] = MultiFernet(
+                [Settings._derive_fernet(key) for key in keys]
+            )
+        return cipher
+
+    @staticmethod
+    def _derive_fernet(secret_key: str | bytes) -> Fernet:
+        """Build a Fernet from a secret key (first 32 bytes, zero padded)."""
+        if isinstance(secret_key, str):
+            secret_key = secret_key.encode()
+
         key_bytes = base64.urlsafe_b64encode(secret_key[:32].ljust(32, b"\x00"))
         return Fernet(key_bytes)
 
@@ -193,22 +264,23 @@ def _encrypt_value(value: str, app=None) -> str:
         return encrypted.decode()
 
     @staticmethod
-    def _decrypt_value(encrypted_value: str, app=None) -> str:
+    def _decrypt_value(encrypted_value: str, app=None, cipher=None) -> str:
         """Decrypt value using Fernet."""
         try:
-            cipher = Settings._get_fernet_key(app)
+            cipher = cipher or Settings._get_fernet_key(app)
             decrypted = cipher.decrypt(encrypted_value.encode())
             return decrypted.decode()
         except Exception:
             # Return encrypted value if decryption fails
             return encrypted_value
 
-    def get_value(self, app=None) -> Any:
+    def get_value(self, app=None, cipher=None) -> Any:
         """
         Get setting value with type conversion and decryption if needed.
 
         Args:
             app: Flask app instance (uses current_app if None)
+            cipher: Cipher to reuse across rows (see decode_rows)
 
         Returns:
             Decrypted and type-converted value
@@ -217,7 +289,7 @@ def get_value(self, app=None) -> Any:
 
         # Decrypt if encrypted
         if self.encrypted:
-            value = self._decrypt_value(value, app)
+            value = self._decrypt_value(value, app, cipher)
 
         # Try to parse as JSON first
         try:
@@ -225,6 +297,32 @@ def get_value(self, app=None) -> Any:
         except (json.JSONDecodeError, ValueError):
             return value
 
+    @classmethod
+    def decode_rows(cls, rows: list["Settings"], app=None) -> dict[str, Any]:
+        """
+        Decode (and decrypt) several rows with a single cipher lookup.
+
+        Args:
+            rows: Settings rows
+            app: Flask app instance
+
+        Returns:
+            Dict of key → value
+        """
+        cipher = None
+        if any(row.encrypted for row in rows):
+            cipher = cls._get_fernet_key(app)
+        return {row.key: row.get_value(app, cipher) for row in rows}
+
+    @staticmethod
+    def _serialize_value(value: Any) -> str:
+        """Serialize complex types to JSON, everything else with str()"""
+        return json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+
+    def _stored_text(self, app=None) -> str:
+        """Stored value as plain text (decrypted if needed)"""
+        return self._decrypt_value(self.value, app) if self.encrypted else self.value
+
     def set_value(self, value: Any, app=None) -> None:
         """
         Set setting value with encryption if field requires it.
@@ -233,8 +331,7 @@ def set_value(self, value: Any, app=None) -> None:
             value: Value to set
             app: Flask app instance (uses current_app if None)
         """
-        # Serialize complex types to JSON
-        value_str = json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+        value_str = self._serialize_value(value)
 
         # Encrypt if field is in ENCRYPTED_FIELDS
         if self.key in self.ENCRYPTED_FIELDS:
@@ -259,12 +356,14 @@ def get(cls, key: str, default: Any = None, app=None) -> Any:
         Returns:
             Setting value or default
         """
-        setting = cls.query.filter_by(key=key).first()
+        values = cls.snapshot(app)
 
-        if setting is None:
+        if key not in values:
             return default
 
-        return setting.get_value(app)
+        value = values[key]
+        # The snapshot is shared: never hand out its mutable containers
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
 
     @classmethod
     def set(cls, key: str, value: Any, description: str = None, app=None) -> "Settings":
@@ -280,44 +379,191 @@ def set(cls, key: str, value: Any, description: str = None, app=None) -> "Settin
         Returns:
             Settings instance
         """
-        setting = cls.query.filter_by(key=key).first()
+        descriptions = {key: description} if description else None
+        return cls.set_many({key: value}, descriptions, app=app)[key]
+
+    @classmethod
+    def set_many(
+        cls,
+        values: dict[str, Any],
+        descriptions: dict[str, str | None] | None = None,
+        overwrite: bool = True,
+        app=None,
+    ) -> dict[str, "Settings"]:
+        """
+        Set several settings in one transaction.
 
-        if setting is None:
-            setting = cls(key=key, description=description)
-            db.session.add(setting)
+        Existing rows are loaded with a single IN query, all rows are
+        upserted, then committed once (one settings version bump). Rows
+        whose value does not change are left untouched.
 
-        setting.set_value(value, app)
-        db.session.commit()
+        Args:
+            values: Setting key → value
+            descriptions: Descriptions for keys created by this call
+            overwrite: False to only create missing keys (existing values kept)
+            app: Flask app instance
 
-        return setting
+        Returns:
+            Dict of key → Settings instance
+        """
+        if not values:
+            return {}
+
+        descriptions = descriptions or {}
+        try:
+            rows = {
+                row.key: row
+                for row in cls.query.filter(cls.key.in_(list(values))).all()
+            }
+
+            for key, value in values.items():
+                setting = rows.get(key)
+                if setting is None:
+                    setting = cls(key=key, description=descriptions.get(key))
+                    rows[key] = setting
+                    db.session.add(setting)
+                elif not overwrite or (
+                    setting._stored_text(app) == cls._serialize_value(value)
+                    and setting.encrypted == (key in cls.ENCRYPTED_FIELDS)
+                ):
+                    continue
+
+                setting.set_value(value, app)
+
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        return rows
 
     @classmethod
     def get_all(cls) -> dict:
         """Get all settings as dictionary."""
-        settings = cls.query.all()
-        return {s.key: s.get_value() for s in settings}
+        return copy.deepcopy(dict(cls.snapshot()))
+
+    # ---- Snapshot Cache ----
 
     @classmethod
-    def init_defaults(cls) -> None:
-        """Initialize default settings in database."""
+    def snapshot(cls, app=None) -> Mapping[str, Any]:
+        """
+        Read-only mapping of every setting, decoded and decrypted.
 
-        for key, config in cls.DEFAULTS.items():
-            existing = cls.query.filter_by(key=key).first()
+        Built once per app and worker, then reused until a settings commit
+        is detected: immediately for commits made by this worker, within
+        SNAPSHOT_CHECK_INTERVAL seconds for commits made by other workers.
 
-            if existing is None:
-                setting = cls(
-                    key=key,
-                    value=config["value"],
-                    description=config.get("description"),
-                )
+        Args:
+            app: Flask app instance (uses current_app if None)
 
-                # Encrypt if needed
-                if key in cls.ENCRYPTED_FIELDS and config["value"]:
-                    setting.set_value(config["value"])
+        Returns:
+            Immutable dict of key → value
+        """
+        from flask import current_app
+
+        app = app or current_app._get_current_object()
+        holder = app.extensions.get("settings_snapshot")
+        now = time.monotonic()
+
+        if holder is not None and holder.generation == _local_generation:
+            if now - holder.checked_at < cls.SNAPSHOT_CHECK_INTERVAL:
+                return holder.values
+
+            version = cls._snapshot_version()
+            if version is not None and version == holder.version:
+                holder.checked_at = now
+                return holder.values
+        else:
+            version = cls._snapshot_version()
+
+        # Version and generation are read before the rows: a change landing
+        # while loading makes the next check reload again, never the reverse
+        generation = _local_generation
+        values = MappingProxyType(cls.decode_rows(cls.query.all(), app))
+        app.extensions["settings_snapshot"] = SettingsSnapshot(
+            values, version, generation, now
+        )
+        return values
 
-                db.session.add(setting)
+    @classmethod
+    def invalidate_snapshot(cls) -> None:
+        """Force every worker to reload its settings snapshot"""
+        global _local_generation
+        _local_generation += 1
+
+        from backend.src.services.cache_service import cache_service
+
+        try:
+            cache_service.invalidate_tags([cls.CACHE_TAG])
+        except Exception as e:
+            logger.error(f"Settings cache invalidation failed: {str(e)}")
 
-        db.session.commit()
+    @classmethod
+    def _snapshot_version(cls) -> str | None:
+        """Current cross-worker version token (None if the cache is unusable)"""
+        from backend.src.services.cache_service import cache_service
+
+        try:
+            return cache_service.tag_versions([cls.CACHE_TAG])[cls.CACHE_TAG]
+        except Exception as e:
+            logger.debug(f"Settings version lookup failed: {str(e)}")
+            return None
+
+    @classmethod
+    def rotate_encryption(cls, app=None) -> int:
+        """
+        Re-encrypt every encrypted setting with the current SECRET_KEY.
+
+        Run after deploying a new SECRET_KEY with the previous one listed in
+        SECRET_KEY_FALLBACKS: values written under any configured key are
+        re-encrypted in one transaction, after which the fallback can be
+        removed. ENCRYPTED_FIELDS rows still stored in clear are encrypted.
+
+        Args:
+            app: Flask app instance
+
+        Returns:
+            Number of rows rewritten
+
+        Raises:
+            InvalidToken: A value was encrypted with a key no longer
+                configured (nothing is written)
+        """
+        cipher = cls._get_fernet_key(app)
+        rows = cls.query.filter(
+            db.or_(cls.encrypted.is_(True), cls.key.in_(cls.ENCRYPTED_FIELDS))
+        ).all()
+
+        try:
+            for row in rows:
+                if row.encrypted:
+                    try:
+                        row.value = cipher.rotate(row.value.encode()).decode()
+                    except InvalidToken:
+                        raise InvalidToken(
+                            f"Cannot decrypt setting '{row.key}'"
+                        ) from None
+                else:
+                    row.set_value(row.value, app)
+                row.updated_at = datetime.utcnow()
+
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        return len(rows)
+
+    @classmethod
+    def init_defaults(cls) -> None:
+        """Initialize default settings in database (missing keys only)."""
+        cls.set_many(
+            {key: config["value"] for key, config in cls.DEFAULTS.items()},
+            descriptions={
+                key: config.get("description") for key, config in cls.DEFAULTS.items()
+            },
+            overwrite=False,
+        )
 
     def to_dict(self, include_encrypted: bool = False) -> dict:
         """
@@ -349,3 +595,43 @@ def to_dict(self, include_encrypted: bool = False) -> dict:
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
+
+
+# ---- Change Tracking ----
+
+
+def _mark_settings_changed(mapper: Any, connection: Any, target: Settings) -> None:
+    """Flag the session: a settings row was written in this transaction"""
+    session = object_session(target)
+    if session is not None:
+        session.info["settings_changed"] = True
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(Settings, _event_name, _mark_settings_changed)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_settings_bulk_change(orm_execute_state: Any) -> None:
+    """Bulk query.update()/delete() bypass the mapper events above"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+
+    if any(mapper.class_ is Settings for mapper in orm_execute_state.all_mappers):
+        orm_execute_state.session.info["settings_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _settings_committed(session: Session) -> None:
+    """Publish committed settings changes to every worker"""
+    if session.info.pop("settings_changed", False):
+        Settings.invalidate_snapshot()
+
+
+@event.listens_for(Session, "after_rollback")
+def _settings_rolled_back(session: Session) -> None:
+    """Drop snapshots that may contain flushed but rolled back values"""
+    global _local_generation
+
+    if session.info.pop("settings_changed", False):
+        _local_generation += 1
@@ -25,11 +25,10 @@
 from enum import Enum
 from typing import Optional, cast
 
-from werkzeug.security import check_password_hash, generate_password_hash
-
 from flask_login import UserMixin
 
 from backend.src.extensions import db
+from backend.src.services.password_hasher import password_hasher
 
 
 class UserRole(str, Enum):
@@ -48,6 +47,10 @@ class User(UserMixin, db.Model):
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination of admin listings (UserService.list_page)
+        db.Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     # Primary Key
     id = db.Column(db.Integer, primary_key=True)
@@ -61,6 +64,10 @@ class User(UserMixin, db.Model):
     is_admin = db.Column(db.Boolean, default=False, nullable=False)
     is_active = db.Column(db.Boolean, default=True, nullable=False)
     role = db.Column(db.String(20), default=UserRole.MEMBER.value, nullable=False)
+    # Bumped on any change to the fields above (see services.principal_service)
+    auth_version = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+    # Bumped to end every login of the user, remember-me cookies included
+    session_epoch = db.Column(db.Integer, default=0, server_default="0", nullable=False)
 
     # 2FA / Security
     totp_secret = db.Column(db.String(32), nullable=True)  # Base32 encoded secret
@@ -111,19 +118,27 @@ def set_password(self, password: str) -> None:
         Args:
             password: Plain text password
         """
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password: str) -> bool:
         """
         Check if password matches
 
+        A matching password stored with an outdated method or cost
+        (PASSWORD_HASH_METHOD changed) is rehashed; the caller commits.
+
         Args:
             password: Plain text password to check
 
         Returns:
             True if password matches, False otherwise
         """
-        return check_password_hash(self.password_hash, password)
+        if not password_hasher.verify(self.password_hash, password):
+            return False
+
+        if password_hasher.needs_rehash(self.password_hash):
+            self.set_password(password)
+        return True
 
     def is_locked(self) -> bool:
         """
@@ -205,10 +220,14 @@ def enable_2fa(self, secret: str) -> None:
         self.totp_enabled = True
 
     def disable_2fa(self) -> None:
-        """Disable 2FA"""
+        """Disable 2FA (backup codes are deleted)"""
+        from backend.src.models.backup_code import BackupCode
+
         self.totp_secret = None
         self.totp_enabled = False
         self.backup_codes = None
+        if self.id is not None:
+            BackupCode.query.filter_by(user_id=self.id).delete(synchronize_session=False)
 
     def verify_totp(self, code: str) -> bool:
         """
@@ -353,6 +372,10 @@ def is_authenticated(self) -> bool:
         """Check if user is authenticated"""
         return True
 
+    def get_id(self) -> str:
+        """Flask-Login ID: "<id>:<session_epoch>", so revoked logins stop loading"""
+        return f"{self.id}:{self.session_epoch or 0}"
+
     @staticmethod
     def get_by_username(username: str) -> Optional["User"]:
         """
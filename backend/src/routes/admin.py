@@ -34,6 +34,7 @@
 from backend.src.models.settings import Settings
 from backend.src.services.content_service import ContentService
 from backend.src.services.email_service import EmailService
+from backend.src.services.stats_service import StatsService
 from backend.src.services.user_service import UserService
 from backend.src.utils.i18n import t
 
@@ -55,35 +56,13 @@ def dashboard() -> str:
     Returns:
         Rendered admin/dashboard.html template
     """
-    from datetime import datetime, timedelta
+    from backend.src.services.admin_service import AdminService
 
-    from backend.src.models.admin_history import AdminHistory
-
-    # Get real stats from database
-    all_users = UserService.get_all(active_only=False)
-    active_users = [u for u in all_users if u.is_active]
-    admin_users = [u for u in all_users if u.is_admin]
-    users_2fa = [u for u in all_users if u.totp_enabled]
-
-    all_content, total_content = ContentService.get_all(page=1, per_page=1)
+    # Counts computed in SQL (one aggregate query, cached briefly)
+    stats = StatsService.get_overview()
 
     # Get recent admin actions (last 10)
-    recent_actions = (
-        AdminHistory.query.order_by(AdminHistory.timestamp.desc()).limit(10).all()
-    )
-
-    # Get users with recent logins (last 24h)
-    yesterday = datetime.utcnow() - timedelta(days=1)
-    recent_logins = [u for u in all_users if u.last_login and u.last_login > yesterday]
-
-    stats = {
-        "total_users": len(all_users),
-        "active_users": len(active_users),
-        "admin_users": len(admin_users),
-        "users_2fa": len(users_2fa),
-        "content_items": total_content,
-        "recent_logins_24h": len(recent_logins),
-    }
+    recent_actions = AdminService.get_history(limit=10)
 
     return render_template(
         "admin/dashboard.html", stats=stats, recent_actions=recent_actions
@@ -103,8 +82,20 @@ def users() -> str:
     Returns:
         Rendered admin/users.html template
     """
-    # Get all users
-    all_users = UserService.get_all(active_only=False)
+    # One keyset page of users (newest first), optionally prefix-searched
+    search = request.args.get("q", "").strip()
+    per_page = request.args.get("per_page", 50, type=int)
+    page = UserService.list_page(
+        per_page=per_page,
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+        search=search,
+    )
+
+    # Cursor links keep the search and the page size
+    cursor_args: dict[str, Any] = {"per_page": per_page}
+    if search:
+        cursor_args["q"] = search
 
     # Convert to dict for template
     users_data = [
@@ -120,10 +111,18 @@ def users() -> str:
             "login_attempts": u.login_attempts,
             "is_locked": u.is_locked(),
         }
-        for u in all_users
+        for u in page["items"]
     ]
 
-    return render_template("admin/users.html", users=users_data)
+    return render_template(
+        "admin/users.html",
+        users=users_data,
+        search=search,
+        next_cursor=page["next_cursor"],
+        prev_cursor=page["prev_cursor"],
+        url_base=url_for("admin.users"),
+        cursor_args=cursor_args,
+    )
 
 
 @admin.route("/settings", methods=["GET"])
@@ -164,48 +163,42 @@ def save_settings() -> Any:
     Returns:
         Redirect to settings page with success message
     """
+    form = request.form
     try:
-        # SMTP Settings
-        Settings.set("smtp_host", request.form.get("smtp_host", ""))
-        Settings.set("smtp_port", request.form.get("smtp_port", "465"))
-        Settings.set("smtp_user", request.form.get("smtp_user", ""))
-        Settings.set("smtp_password", request.form.get("smtp_password", ""))
-        Settings.set("smtp_tls_enabled", request.form.get("smtp_tls_enabled") == "on")
-        Settings.set("smtp_from_email", request.form.get("smtp_from_email", ""))
-        Settings.set("smtp_from_name", request.form.get("smtp_from_name", ""))
-
-        # Email Verification Settings
-        Settings.set(
-            "email_verification_required",
-            request.form.get("email_verification_required") == "on",
-        )
-        Settings.set(
-            "email_verification_token_expiry_hours",
-            request.form.get("email_verification_token_expiry_hours", "24"),
+        Settings.set_many(
+            {
+                # SMTP Settings
+                "smtp_host": form.get("smtp_host", ""),
+                "smtp_port": form.get("smtp_port", "465"),
+                "smtp_user": form.get("smtp_user", ""),
+                "smtp_password": form.get("smtp_password", ""),
+                "smtp_tls_enabled": form.get("smtp_tls_enabled") == "on",
+                "smtp_from_email": form.get("smtp_from_email", ""),
+                "smtp_from_name": form.get("smtp_from_name", ""),
+                # Email Verification Settings
+                "email_verification_required": (
+                    form.get("email_verification_required") == "on"
+                ),
+                "email_verification_token_expiry_hours": form.get(
+                    "email_verification_token_expiry_hours", "24"
+                ),
+                "password_reset_token_expiry_minutes": form.get(
+                    "password_reset_token_expiry_minutes", "60"
+                ),
+                "password_reset_rate_limit_per_hour": form.get(
+                    "password_reset_rate_limit_per_hour", "2"
+                ),
+                "email_format": form.get("email_format", "html_with_fallback"),
+                # Feature Flags
+                "registration_enabled": form.get("registration_enabled") == "on",
+                "2fa_required": form.get("2fa_required") == "on",
+                # Site Configuration
+                "site_name": form.get("site_name", "X-Filamenta"),
+                "site_url": form.get("site_url", "http://localhost:5000"),
+                "logo_url": form.get("logo_url", "/static/logo.png"),
+                "footer_text": form.get("footer_text", ""),
+            }
         )
-        Settings.set(
-            "password_reset_token_expiry_minutes",
-            request.form.get("password_reset_token_expiry_minutes", "60"),
-        )
-        Settings.set(
-            "password_reset_rate_limit_per_hour",
-            request.form.get("password_reset_rate_limit_per_hour", "2"),
-        )
-        Settings.set(
-            "email_format", request.form.get("email_format", "html_with_fallback")
-        )
-
-        # Feature Flags
-        Settings.set(
-            "registration_enabled", request.form.get("registration_enabled") == "on"
-        )
-        Settings.set("2fa_required", request.form.get("2fa_required") == "on")
-
-        # Site Configuration
-        Settings.set("site_name", request.form.get("site_name", "X-Filamenta"))
-        Settings.set("site_url", request.form.get("site_url", "http://localhost:5000"))
-        Settings.set("logo_url", request.form.get("logo_url", "/static/logo.png"))
-        Settings.set("footer_text", request.form.get("footer_text", ""))
 
         flash(t("admin.settings.success_flash"), "success")
         return redirect(url_for("admin.settings"))
@@ -240,7 +233,7 @@ def test_smtp_settings() -> Any:
         ), 500
 
 
-# ...existing code...
+@admin.route("/content")
 @require_admin
 def content() -> str:
     """
@@ -253,8 +246,26 @@ def content() -> str:
     Returns:
         Rendered admin/content.html template
     """
-    # Get all content from database
-    content_items, total = ContentService.get_all(page=1, per_page=50)
-    content_list = [item.to_dict(include_body=False) for item in content_items]
+    # One keyset page of content (newest first)
+    page = ContentService.list_page(
+        content_type=request.args.get("type") or None,
+        status=request.args.get("status") or None,
+        per_page=request.args.get("per_page", 50, type=int),
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+    )
+    content_list = [item.to_dict(include_body=False) for item in page["items"]]
 
-    return render_template("admin/content.html", content=content_list, total=total)
+    return render_template(
+        "admin/content.html",
+        content=content_list,
+        total=page["total"],
+        next_cursor=page["next_cursor"],
+        prev_cursor=page["prev_cursor"],
+        url_base=url_for("admin.content"),
+        cursor_args={
+            key: request.args[key]
+            for key in ("type", "status", "per_page")
+            if request.args.get(key)
+        },
+    )
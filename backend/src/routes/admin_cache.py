@@ -20,12 +20,17 @@
 - Admin cache configuration interface
 - Cache statistics and monitoring
 - Cache clearing operations
+- Prometheus text metrics at /admin/cache/metrics (admin session, or
+  "Authorization: Bearer <CACHE_METRICS_TOKEN>" for scrapers)
 """
 
-from flask import Blueprint, jsonify, render_template, request, session
+import hmac
+import os
+
+from flask import Blueprint, Response, jsonify, render_template, request, session
 
 from backend.src.decorators import require_admin
-from backend.src.services.cache_service import CacheService
+from backend.src.services.cache_service import cache_service
 
 admin_cache = Blueprint("admin_cache", __name__, url_prefix="/admin/cache")
 
@@ -42,11 +47,9 @@ def cache_settings():
     - Statistics
     - Actions (clear cache, test connection)
     """
-    cache_svc = CacheService()
-
-    # Get cache info
-    info = cache_svc.get_info()
-    backend = cache_svc.backend.value
+    # Process-wide service: a fresh instance would report empty metrics
+    info = cache_service.get_info()
+    backend = cache_service.backend.value
 
     # Get current configuration (from wizard state or defaults)
     from backend.src.services.install_service import InstallService
@@ -85,8 +88,7 @@ def test_redis():
     """
     data = request.get_json()
 
-    cache_svc = CacheService()
-    success, message, info = cache_svc.test_redis_connection(
+    success, message, info = cache_service.test_redis_connection(
         host=data.get("host", "localhost"),
         port=int(data.get("port", 6379)),
         password=data.get("password") or None,
@@ -110,8 +112,7 @@ def test_redis_advanced():
     """
     data = request.get_json()
 
-    cache_svc = CacheService()
-    success, message, info = cache_svc.test_redis_advanced(
+    success, message, info = cache_service.test_redis_advanced(
         host=data.get("host", "localhost"),
         port=int(data.get("port", 6379)),
         password=data.get("password") or None,
@@ -134,8 +135,7 @@ def clear_cache():
         JSON with success status
     """
     try:
-        cache_svc = CacheService()
-        cache_svc.flush()
+        cache_service.flush()
 
         return jsonify({"success": True, "message": "Cache cleared successfully"})
     except Exception as e:
@@ -150,10 +150,53 @@ def cache_stats():
     """
     Get cache statistics (AJAX endpoint).
 
+    Metrics are those of the worker process serving the request.
+
+    Returns:
+        JSON with cache stats and per-namespace metrics
+    """
+    info = cache_service.get_info()
+
+    return jsonify(
+        {
+            "success": True,
+            "backend": cache_service.backend.value,
+            "info": info,
+            "metrics": cache_service.get_metrics(),
+        }
+    )
+
+
+@admin_cache.route("/metrics", methods=["GET"])
+def cache_metrics():
+    """
+    Cache metrics in the Prometheus text exposition format.
+
+    Scrapers authenticate with "Authorization: Bearer <CACHE_METRICS_TOKEN>";
+    without a valid token the admin check applies.
+
     Returns:
-        JSON with cache stats
+        text/plain metrics (hits, misses, hit ratio, latency histograms)
     """
-    cache_svc = CacheService()
-    info = cache_svc.get_info()
+    if _scrape_token_valid():
+        return _prometheus_response()
+
+    return require_admin(_prometheus_response)()
 
-    return jsonify({"success": True, "backend": cache_svc.backend.value, "info": info})
+
+def _scrape_token_valid() -> bool:
+    """Check the Bearer token against CACHE_METRICS_TOKEN (if configured)"""
+    expected = os.getenv("CACHE_METRICS_TOKEN", "")
+    header = request.headers.get("Authorization", "")
+    if not expected or not header.startswith("Bearer "):
+        return False
+
+    return hmac.compare_digest(header[len("Bearer ") :].encode(), expected.encode())
+
+
+def _prometheus_response() -> Response:
+    """Render the metrics of this worker as Prometheus text"""
+    return Response(
+        cache_service.metrics.render_prometheus(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -35,8 +35,12 @@
 from backend.src.decorators import require_admin
 from backend.src.models.user import User
 from backend.src.services.admin_service import AdminService
+from backend.src.services.principal_service import PrincipalService
+from backend.src.services.session_store import current_store
+from backend.src.services.stats_service import StatsService
 from backend.src.services.user_service import UserService
 from backend.src.utils.i18n import t
+from backend.src.utils.pagination import flag_arg
 
 # ---- Blueprint ----
 admin_users = Blueprint("admin_users", __name__, url_prefix="/admin/users")
@@ -48,33 +52,51 @@
 @admin_users.route("/")
 @require_admin
 def list_users():
-    """List all users with pagination."""
-    page = request.args.get("page", 1, type=int)
+    """List users one keyset page at a time, filtered in SQL."""
+    status = request.args.get("active", "all")
+    filters = {
+        "admin": flag_arg(request.args.get("admin")),
+        "totp": flag_arg(request.args.get("totp")),
+        "locked": flag_arg(request.args.get("locked")),
+    }
+    search = request.args.get("q", "").strip()
     per_page = request.args.get("per_page", 20, type=int)
-    active_only = request.args.get("active", "all")
-
-    # Get users
-    if active_only == "active":
-        users = UserService.get_all(active_only=True)
-    elif active_only == "inactive":
-        users_all = UserService.get_all(active_only=False)
-        users = [u for u in users_all if not u.is_active]
+    active = {"active": True, "inactive": False}.get(status)
+
+    page = UserService.list_page(
+        per_page=per_page,
+        after=request.args.get("after"),
+        before=request.args.get("before"),
+        active=active,
+        search=search,
+        **filters,
+    )
+
+    # Unfiltered: the dashboard's cached count; otherwise count the matches
+    if active is None and not search and all(v is None for v in filters.values()):
+        total = StatsService.get_overview()["total_users"]
     else:
-        users = UserService.get_all(active_only=False)
+        total = UserService.count(active=active, search=search, **filters)
 
-    # Pagination (simple)
-    total = len(users)
-    start = (page - 1) * per_page
-    end = start + per_page
-    users_page = users[start:end]
+    # Links keep the current filters and page size, and only swap the cursor
+    query_args = {
+        key: value
+        for key, value in request.args.items()
+        if key not in ("after", "before", "page") and value not in ("", "all")
+    }
+    query_args["per_page"] = per_page
 
     return render_template(
         "admin/users_list.html",
-        users=users_page,
-        page=page,
-        per_page=per_page,
+        users=page["items"],
+        next_cursor=page["next_cursor"],
+        prev_cursor=page["prev_cursor"],
+        url_base=url_for("admin_users.list_users"),
+        cursor_args=query_args,
         total=total,
-        active_filter=active_only,
+        active_filter=status,
+        filters=filters,
+        search=search,
     )
 
 
@@ -85,11 +107,8 @@ def list_users():
 @require_admin
 def create_user():
     """Create new user (admin action)."""
-    from backend.src.services.user_service import UserService
-
-    # Get current admin user (assumes "admin" username for now)
-    # TODO: Replace with proper session-based current_user when implemented
-    admin_user = UserService.get_by_username("admin")
+    # Get current admin user
+    admin_user = PrincipalService.current()
 
     if request.method == "GET":
         return render_template("admin/users_create.html")
@@ -154,15 +173,16 @@ def create_user():
 @require_admin
 def edit_user(user_id: int):
     """Edit existing user."""
-    from backend.src.services.user_service import UserService
-
     # Get current admin user
-    admin_user = UserService.get_by_username("admin")
+    admin_user = PrincipalService.current()
 
     user = User.query.get_or_404(user_id)
+    session_count = len(current_store().user_sessions(user.id))
 
     if request.method == "GET":
-        return render_template("admin/users_edit.html", user=user)
+        return render_template(
+            "admin/users_edit.html", user=user, session_count=session_count
+        )
 
     # POST: Update user
     updates = {}
@@ -180,7 +200,9 @@ def edit_user(user_id: int):
     if new_password:
         if len(new_password) < 8:
             flash(t("admin.users.edit.error.password_short"), "error")
-            return render_template("admin/users_edit.html", user=user)
+            return render_template(
+                "admin/users_edit.html", user=user, session_count=session_count
+            )
         updates["password"] = new_password
 
     # Update via AdminService
@@ -200,7 +222,9 @@ def edit_user(user_id: int):
 
     except ValueError as e:
         flash(str(e), "error")
-        return render_template("admin/users_edit.html", user=user)
+        return render_template(
+            "admin/users_edit.html", user=user, session_count=session_count
+        )
 
 
 # ---- Delete User ----
@@ -210,10 +234,8 @@ def edit_user(user_id: int):
 @require_admin
 def delete_user(user_id: int):
     """Delete user (soft or hard)."""
-    from backend.src.services.user_service import UserService
-
     # Get current admin user
-    admin_user = UserService.get_by_username("admin")
+    admin_user = PrincipalService.current()
 
     hard_delete = request.form.get("hard_delete") == "true"
 
@@ -236,3 +258,25 @@ def delete_user(user_id: int):
 
     return redirect(url_for("admin_users.list_users"))
 
+
+# ---- Revoke Sessions ----
+
+
+@admin_users.route("/<int:user_id>/sessions/revoke", methods=["POST"])
+@require_admin
+def revoke_sessions(user_id: int):
+    """Log a user out of every session (remember-me cookies included)."""
+    admin_user = PrincipalService.current()
+
+    try:
+        revoked = AdminService.revoke_sessions(
+            user_id=user_id,
+            admin_user=admin_user,
+            ip_address=request.remote_addr,
+        )
+        flash(t("admin.users.sessions.revoked").format(count=revoked), "success")
+
+    except ValueError as e:
+        flash(str(e), "error")
+
+    return redirect(url_for("admin_users.edit_user", user_id=user_id))
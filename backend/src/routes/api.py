@@ -31,6 +31,8 @@
 
 from flask import Blueprint, current_app, jsonify, request
 
+from backend.src.extensions import db
+
 # ---- Blueprint Definition ----
 api = Blueprint("api", __name__, url_prefix="/api")
 
@@ -151,12 +153,28 @@ def stats() -> Any:
         JSON: Statistics data
         HTTP 200
     """
-    # Placeholder stats - to be replaced with real data
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from backend.src.services.stats_service import StatsService
+
+    try:
+        overview = StatsService.get_overview()
+    except SQLAlchemyError as e:
+        # Schema not created yet (before installation): report empty stats
+        current_app.logger.warning(f"Stats unavailable: {e.__class__.__name__}")
+        db.session.rollback()
+        overview = dict.fromkeys(
+            ("total_users", "active_users", "recent_logins_24h", "content_items"), 0
+        )
+
+    # Errors and visits are not recorded yet
     return jsonify(
         {
             "stats": {
-                "users_total": 0,
-                "content_items": 0,
+                "users_total": overview["total_users"],
+                "users_active": overview["active_users"],
+                "logins_24h": overview["recent_logins_24h"],
+                "content_items": overview["content_items"],
                 "errors_24h": 0,
                 "visits_24h": 0,
             },
@@ -46,7 +46,9 @@
 from backend.src.extensions import db
 from backend.src.models.user import User
 from backend.src.services.email_service import EmailService
+from backend.src.services.login_tracker import login_tracker
 from backend.src.services.rate_limiter import login_rate_limit
+from backend.src.services.stats_service import StatsService
 from backend.src.services.user_service import UserService
 from backend.src.utils.i18n import t
 
@@ -176,6 +178,7 @@ def register() -> Any:
 
         db.session.add(user)
         db.session.commit()
+        StatsService.invalidate_cache()
 
         # Send verification email if required
         settings_service = current_app.config.get("SETTINGS_SERVICE")
@@ -233,9 +236,8 @@ def login() -> Any:
     if not username or not password:
         return jsonify({"error": "Nom d'utilisateur et mot de passe requis"}), 400
 
-    # Get user first to check existence
-    user_service = UserService()
-    user = user_service.get_by_username(username) or user_service.get_by_email(username)
+    # Live row (not the cached snapshot): password_hash is never cached
+    user = User.get_by_username(username) or User.get_by_email(username)
 
     if not user:
         return jsonify({"error": "Identifiants invalides"}), 401
@@ -244,12 +246,20 @@ def login() -> Any:
     if not user.is_active:
         return jsonify({"error": "Compte désactivé"}), 401
 
-    # Check password
+    if user.is_locked():
+        return jsonify({"error": "Compte temporairement verrouillé"}), 403
+
+    # Check password (upgrades an outdated hash in place)
     if not user.check_password(password):
+        # Counted in the cache; the row is only written when the account locks
+        login_tracker.record_failure(user)
         return jsonify({"error": "Identifiants invalides"}), 401
+    if db.session.is_modified(user):
+        db.session.commit()
 
     # Login user with Flask-Login (pass User object, not ID)
     login_user(user, remember=True)
+    login_tracker.record_login(user.id, request.remote_addr)
 
     # TODO: Check if 2FA is enabled, redirect to 2FA verification if needed
 
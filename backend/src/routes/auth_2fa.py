@@ -39,7 +39,10 @@
 )
 
 from backend.src.extensions import db
+from backend.src.models.user import User
+from backend.src.services.login_tracker import login_tracker
 from backend.src.services.rate_limiter import strict_rate_limit, two_fa_rate_limit
+from backend.src.services.session_store import regenerate_session
 from backend.src.services.totp_service import TOTPService
 from backend.src.services.user_service import UserService
 
@@ -61,7 +64,8 @@ def get_current_user_id() -> int | None:
 
 
 def login_user(user_id: int) -> None:
-    """Set user as logged in"""
+    """Set user as logged in (under a new session ID)"""
+    regenerate_session()
     session["user_id"] = user_id
     session.permanent = True
 
@@ -127,7 +131,7 @@ def setup_2fa() -> Response | tuple[Response, int]:
         return jsonify({"error": "Non authentifié"}), 401
 
     user_id = get_current_user_id()
-    user = UserService.get_by_id(user_id)
+    user = User.query.get(user_id)
 
     if not user:
         return jsonify({"error": "Utilisateur non trouvé"}), 404
@@ -151,9 +155,10 @@ def setup_2fa() -> Response | tuple[Response, int]:
 
     # Code valid, enable 2FA
     user.enable_2fa(secret)
-    user.backup_codes = backup_codes_json
+    TOTPService.save_backup_codes(user, backup_codes_json)
 
     db.session.commit()
+    UserService.invalidate_cache(user)
 
     # Clear session setup data
     session.pop("totp_setup_secret", None)
@@ -202,7 +207,7 @@ def verify_2fa() -> Response | tuple[Response, int]:
     if not pending_user_id:
         return jsonify({"error": "Session invalide"}), 400
 
-    user = UserService.get_by_id(pending_user_id)
+    user = User.query.get(pending_user_id)
 
     if not user or not user.totp_enabled:
         return jsonify({"error": "Configuration 2FA invalide"}), 400
@@ -229,9 +234,8 @@ def verify_2fa() -> Response | tuple[Response, int]:
     login_user(pending_user_id)
     session.pop("pending_2fa_user_id", None)
 
-    # Update last login
-    user.update_last_login(request.remote_addr)
-    db.session.commit()
+    # Update last login (buffered, see login_tracker)
+    login_tracker.record_login(user.id, request.remote_addr)
 
     # HTMX redirect
     if request.headers.get("HX-Request"):
@@ -256,7 +260,7 @@ def disable_2fa() -> Response | tuple[Response, int]:
         return jsonify({"error": "Non authentifié"}), 401
 
     user_id = get_current_user_id()
-    user = UserService.get_by_id(user_id)
+    user = User.query.get(user_id)
 
     if not user:
         return jsonify({"error": "Utilisateur non trouvé"}), 404
@@ -264,6 +268,7 @@ def disable_2fa() -> Response | tuple[Response, int]:
     # Disable 2FA
     user.disable_2fa()
     db.session.commit()
+    UserService.invalidate_cache(user)
 
     # HTMX response
     if request.headers.get("HX-Request"):
@@ -324,11 +324,9 @@ def render_full_page(extra_context: dict[str, Any] | None = None) -> str:
             )
 
             # Test Redis connection (simple ping)
-            from backend.src.services.cache_service import CacheService
+            from backend.src.services.cache_service import cache_service
 
-            cache_svc = CacheService()
-
-            success, message, info = cache_svc.test_redis_connection(
+            success, message, info = cache_service.test_redis_connection(
                 host=redis_host,
                 port=redis_port,
                 password=redis_password or None,
@@ -373,6 +371,7 @@ def render_full_page(extra_context: dict[str, Any] | None = None) -> str:
             try:
                 # Ensure all models are loaded in metadata
                 from backend.src.models.admin_history import AdminHistory  # noqa: F401
+                from backend.src.models.backup_code import BackupCode  # noqa: F401
                 from backend.src.models.content import Content  # noqa: F401
                 from backend.src.models.preferences import UserPreferences  # noqa: F401
                 from backend.src.models.user import User  # noqa: F401
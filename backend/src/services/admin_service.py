@@ -22,7 +22,7 @@
 - Includes audit logging via AdminHistory
 """
 
-from typing import Any
+from typing import Any, cast
 
 from flask import current_app
 
@@ -89,7 +89,9 @@ def create_user(
             AdminService._log_action(
                 admin_user=admin_user,
                 action="user_created",
-                description=f"Created user: {username} ({email})",
+                target_type="user",
+                target_id=user.id,
+                details={"username": username, "email": email},
                 ip_address=ip_address,
             )
 
@@ -157,7 +159,9 @@ def update_user(
             AdminService._log_action(
                 admin_user=admin_user,
                 action="user_updated",
-                description=f"Updated user {user.username}: {', '.join(changes)}",
+                target_type="user",
+                target_id=user.id,
+                details={"username": user.username, "changes": changes},
                 ip_address=ip_address,
             )
 
@@ -214,12 +218,52 @@ def delete_user(
             AdminService._log_action(
                 admin_user=admin_user,
                 action=action,
-                description=f"Deleted user: {username} (ID: {user_id})",
+                target_type="user",
+                target_id=user_id,
+                details={"username": username},
                 ip_address=ip_address,
             )
 
         return True
 
+    @staticmethod
+    def revoke_sessions(
+        user_id: int,
+        admin_user: User | None = None,
+        ip_address: str | None = None,
+    ) -> int:
+        """
+        Log a user out everywhere.
+
+        Args:
+            user_id: User whose sessions are revoked
+            admin_user: Admin performing action
+            ip_address: Admin IP address
+
+        Returns:
+            Number of live sessions deleted
+
+        Raises:
+            ValueError: If user not found
+        """
+        user = User.query.get(user_id)
+        if not user:
+            raise ValueError(f"User {user_id} not found")
+
+        revoked = UserService.revoke_sessions(user)
+
+        if admin_user:
+            AdminService._log_action(
+                admin_user=admin_user,
+                action="user_sessions_revoked",
+                target_type="user",
+                target_id=user.id,
+                details={"username": user.username, "revoked": revoked},
+                ip_address=ip_address,
+            )
+
+        return revoked
+
     # ---- Content CRUD ----
 
     @staticmethod
@@ -252,7 +296,9 @@ def create_content(
             AdminService._log_action(
                 admin_user=admin_user,
                 action="content_created",
-                description=f"Created content: {key} ({language})",
+                target_type="content",
+                target_id=content.id,
+                details={"key": key, "language": language},
                 ip_address=ip_address,
             )
 
@@ -299,7 +345,9 @@ def update_content(
             AdminService._log_action(
                 admin_user=admin_user,
                 action="content_updated",
-                description=f"Updated content {content.key}: {', '.join(changes)}",
+                target_type="content",
+                target_id=content.id,
+                details={"key": content.key, "changes": changes},
                 ip_address=ip_address,
             )
 
@@ -338,7 +386,9 @@ def delete_content(
             AdminService._log_action(
                 admin_user=admin_user,
                 action="content_deleted",
-                description=f"Deleted content: {key} (ID: {content_id})",
+                target_type="content",
+                target_id=content_id,
+                details={"key": key},
                 ip_address=ip_address,
             )
 
@@ -350,7 +400,9 @@ def delete_content(
     def _log_action(
         admin_user: User,
         action: str,
-        description: str,
+        target_type: str | None = None,
+        target_id: int | None = None,
+        details: dict[str, Any] | None = None,
         ip_address: str | None = None,
     ) -> None:
         """
@@ -359,19 +411,41 @@ def _log_action(
         Args:
             admin_user: Admin performing action
             action: Action type
-            description: Action description
+            target_type: Type of the affected entity ("user", "content")
+            target_id: ID of the affected entity
+            details: Additional info (stored as JSON)
             ip_address: IP address
         """
         try:
-            history = AdminHistory(
+            AdminHistory.log_action(
                 admin_id=admin_user.id,
                 action=action,
-                description=description,
+                target_type=target_type,
+                target_id=target_id,
+                details=details,
                 ip_address=ip_address or "unknown",
             )
-            db.session.add(history)
             db.session.commit()
         except Exception as e:
             current_app.logger.error(f"Failed to log admin action: {e}")
             db.session.rollback()
 
+    @staticmethod
+    def get_history(admin_id: int | None = None, limit: int = 10) -> list[AdminHistory]:
+        """
+        Get the most recent admin actions, newest first.
+
+        Args:
+            admin_id: Only actions by this admin (None for all admins)
+            limit: Maximum number of entries
+
+        Returns:
+            List of AdminHistory entries
+        """
+        query = AdminHistory.query
+        if admin_id is not None:
+            query = query.filter(AdminHistory.admin_id == admin_id)
+        return cast(
+            list[AdminHistory],
+            query.order_by(AdminHistory.timestamp.desc()).limit(limit).all(),
+        )
@@ -0,0 +1,280 @@
+"""
+Purpose: Cache serialization layer
+Description: Pluggable codecs (msgpack/JSON) and ORM model rehydration registry
+
+File: backend/src/services/cache_codec.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T10:00:00+00:00
+Last modified (Git): TBD | Commit: TBD
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+Notes:
+- msgpack is optional (pip install msgpack); JSON is always available
+- Registered models (User, Content, Settings) are cached as column snapshots
+  and rehydrated into detached, read-only instances
+- No pickle: a compromised Redis must not lead to code execution
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+# Marker byte prefixed to msgpack payloads. It can never start a JSON
+# document, so values written by either codec (or by older releases, which
+# stored plain JSON) are always decodable.
+MSGPACK_MARKER = b"\x01"
+
+# Instance attribute flagging a rehydrated snapshot
+SNAPSHOT_FLAG = "_cache_snapshot"
+
+
+class ReadOnlySnapshotError(RuntimeError):
+    """Raised when a cached model snapshot is modified or attached to a session"""
+
+
+# ---- Model Registry ----
+
+
+class ModelRegistry:
+    """
+    Registry of ORM models that may be stored in the cache.
+
+    Each model is cached as a snapshot of its column values (minus excluded
+    sensitive columns) plus optional to-one relations. Rehydrated objects are
+    detached from any session: reading them never hits the database, and
+    modifying them raises ReadOnlySnapshotError. Excluded columns are left
+    unloaded, so accessing them raises DetachedInstanceError instead of
+    silently returning None.
+    """
+
+    def __init__(self):
+        """Initialize empty registry"""
+        self._models: dict[str, tuple[type, list[str], tuple[str, ...]]] = {}
+        self._defaults_loaded = False
+
+    def register(
+        self,
+        model: type,
+        exclude: tuple[str, ...] = (),
+        relations: tuple[str, ...] = (),
+    ) -> None:
+        """
+        Register a model for caching.
+
+        Args:
+            model: SQLAlchemy model class
+            exclude: Column names never written to the cache
+            relations: To-one relationship names cached alongside the row
+        """
+        columns = [
+            attr.key
+            for attr in model.__mapper__.column_attrs
+            if attr.key not in exclude
+        ]
+        self._models[model.__name__] = (model, columns, relations)
+
+        for key in [*columns, *relations]:
+            event.listen(getattr(model, key), "set", _reject_snapshot_write)
+
+    def load_defaults(self) -> None:
+        """Register the application models (lazy, avoids import cycles)"""
+        if self._defaults_loaded:
+            return
+        self._defaults_loaded = True
+
+        from backend.src.models.content import Content
+        from backend.src.models.settings import Settings
+        from backend.src.models.user import User
+
+        self.register(
+            User,
+            exclude=(
+                "password_hash",
+                "totp_secret",
+                "backup_codes",
+                "email_verification_token",
+                "password_reset_token",
+            ),
+        )
+        self.register(Content, relations=("author",))
+        self.register(Settings)
+
+    def encode(self, obj: Any) -> dict[str, Any]:
+        """
+        Convert a registered model instance to a tagged dict.
+
+        Raises:
+            TypeError: If the model is not registered
+        """
+        self.load_defaults()
+        entry = self._models.get(type(obj).__name__)
+        if entry is None or entry[0] is not type(obj):
+            raise TypeError(f"Model {type(obj).__name__} is not cacheable")
+
+        _model, columns, relations = entry
+        return {
+            "__model__": type(obj).__name__,
+            "fields": {key: getattr(obj, key) for key in columns},
+            "relations": {key: getattr(obj, key) for key in relations},
+        }
+
+    def rehydrate(self, data: dict[str, Any]) -> Any:
+        """
+        Build a detached, read-only instance from a tagged dict.
+
+        Returns:
+            Model instance, or the dict unchanged for unknown models
+        """
+        self.load_defaults()
+        entry = self._models.get(data["__model__"])
+        if entry is None:
+            return data
+
+        model, columns, relations = entry
+        obj = model.__mapper__.class_manager.new_instance()
+        fields = data.get("fields", {})
+        for key in columns:
+            if key in fields:
+                set_committed_value(obj, key, fields[key])
+        for key in relations:
+            set_committed_value(obj, key, data.get("relations", {}).get(key))
+
+        make_transient_to_detached(obj)
+        obj.__dict__[SNAPSHOT_FLAG] = True
+        return obj
+
+
+def _reject_snapshot_write(
+    target: Any, value: Any, oldvalue: Any, initiator: Any
+) -> Any:
+    """Attribute 'set' listener: cached snapshots are read-only"""
+    if target.__dict__.get(SNAPSHOT_FLAG):
+        raise ReadOnlySnapshotError(
+            f"{type(target).__name__} comes from the cache and is read-only; "
+            "load it from the database to modify it"
+        )
+    return value
+
+
+@event.listens_for(Session, "before_attach")
+def _reject_snapshot_attach(session: Session, instance: Any) -> None:
+    """Never let a (possibly stale) snapshot be flushed back to the database"""
+    if instance.__dict__.get(SNAPSHOT_FLAG):
+        raise ReadOnlySnapshotError(
+            f"{type(instance).__name__} comes from the cache and cannot be "
+            "added to a session"
+        )
+
+
+model_registry = ModelRegistry()
+
+
+# ---- Tagging Hooks (shared by all codecs) ----
+
+
+def _default(obj: Any) -> Any:
+    """Encode non-native values as tagged dicts"""
+    if isinstance(obj, datetime):
+        return {"__dt__": obj.isoformat()}
+    if hasattr(obj, "__mapper__"):
+        return model_registry.encode(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not cacheable")
+
+
+def _object_hook(data: dict[str, Any]) -> Any:
+    """Decode tagged dicts back into rich values"""
+    if "__dt__" in data and len(data) == 1:
+        return datetime.fromisoformat(data["__dt__"])
+    if "__model__" in data:
+        return model_registry.rehydrate(data)
+    return data
+
+
+# ---- Codecs ----
+
+
+class JsonCodec:
+    """JSON codec (always available, human-readable)"""
+
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode value to bytes"""
+        return json.dumps(value, default=_default, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode bytes produced by any codec"""
+        return _loads(data)
+
+
+class MsgpackCodec:
+    """Compact binary codec (requires the optional msgpack package)"""
+
+    name = "msgpack"
+
+    def __init__(self):
+        """Import msgpack lazily (raises ImportError if not installed)"""
+        import msgpack
+
+        self.msgpack = msgpack
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode value to marker-prefixed bytes"""
+        return MSGPACK_MARKER + self.msgpack.packb(
+            value, default=_default, use_bin_type=True
+        )
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode bytes produced by any codec"""
+        return _loads(data)
+
+
+def _loads(data: bytes | str) -> Any:
+    """Decode a payload, dispatching on the msgpack marker"""
+    if isinstance(data, str):
+        return json.loads(data, object_hook=_object_hook)
+
+    if data[:1] == MSGPACK_MARKER:
+        import msgpack
+
+        return msgpack.unpackb(data[1:], object_hook=_object_hook, raw=False)
+
+    return json.loads(data, object_hook=_object_hook)
+
+
+def get_codec(name: str | None = None) -> Any:
+    """
+    Get the configured codec.
+
+    Args:
+        name: "msgpack", "json" or "auto" (default: CACHE_CODEC env, "auto").
+              "auto" picks msgpack when installed, JSON otherwise.
+
+    Returns:
+        Codec instance
+    """
+    name = (name or os.getenv("CACHE_CODEC", "auto")).lower()
+
+    if name in ("auto", "msgpack"):
+        try:
+            return MsgpackCodec()
+        except ImportError:
+            if name == "msgpack":
+                raise
+    return JsonCodec()
@@ -0,0 +1,238 @@
+"""
+Purpose: Cache metrics
+Description: Per-namespace cache counters and latency histograms (JSON, Prometheus)
+
+File: backend/src/services/cache_metrics.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T12:00:00+00:00
+Last modified (Git): TBD | Commit: TBD
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+Notes:
+- Namespace = key prefix before the first ":" (user, content, tag, ...)
+- Metrics are per worker process (each process exposes its own counters)
+- Disable with CACHE_METRICS_ENABLED=false
+"""
+
+import os
+import threading
+from typing import Any
+
+# Latency histogram upper bounds, in seconds (Prometheus "le" labels)
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+COUNTERS = ("hits", "misses", "sets", "deletes", "computes", "serialization_failures")
+
+
+def namespace_of(key: str) -> str:
+    """Namespace of a cache key ("user:id:1" → "user")"""
+    prefix, sep, _rest = key.partition(":")
+    return prefix if sep and prefix else "default"
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (cumulative on export)"""
+
+    def __init__(self):
+        """Initialize empty histogram"""
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one observation (caller holds the metrics lock)"""
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q: float) -> float | None:
+        """Approximate quantile (upper bound of the bucket reaching q)"""
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary for the JSON stats endpoint (milliseconds)"""
+        p50 = self.quantile(0.5)
+        p95 = self.quantile(0.95)
+        return {
+            "count": self.count,
+            "avg_ms": round(self.sum / self.count * 1000, 3) if self.count else None,
+            "p50_ms": round(p50 * 1000, 3) if p50 not in (None, float("inf")) else None,
+            "p95_ms": round(p95 * 1000, 3) if p95 not in (None, float("inf")) else None,
+        }
+
+
+class CacheMetrics:
+    """
+    Thread-safe per-namespace cache metrics.
+
+    Counters: hits, misses, sets, deletes, computes (get_or_compute misses)
+    and serialization failures. Latency histograms per operation (get, set,
+    get_many, compute).
+    """
+
+    # Cap label cardinality: unexpected prefixes are folded into "other"
+    MAX_NAMESPACES = 64
+
+    def __init__(self, enabled: bool | None = None):
+        """Initialize empty metrics"""
+        if enabled is None:
+            enabled = os.getenv("CACHE_METRICS_ENABLED", "True").lower() in (
+                "true",
+                "1",
+                "yes",
+            )
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[str, int]] = {}
+        self._latency: dict[tuple[str, str], Histogram] = {}
+
+    def incr(self, key: str, counter: str, amount: int = 1) -> None:
+        """Increment a counter for the namespace of `key`"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._namespace(key)[counter] += amount
+
+    def observe(self, key: str, operation: str, seconds: float) -> None:
+        """Record the latency of one operation on `key`"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            namespace = self._resolve(key)
+            self._namespace(key)
+            histogram = self._latency.get((namespace, operation))
+            if histogram is None:
+                histogram = self._latency[(namespace, operation)] = Histogram()
+            histogram.observe(seconds)
+
+    def reset(self) -> None:
+        """Drop every counter and histogram"""
+        with self._lock:
+            self._counters.clear()
+            self._latency.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Metrics for the JSON stats endpoint.
+
+        Returns:
+            Dict of namespace → counters, hit_ratio and latency summaries
+        """
+        with self._lock:
+            result: dict[str, Any] = {}
+            for namespace, counters in sorted(self._counters.items()):
+                lookups = counters["hits"] + counters["misses"]
+                result[namespace] = {
+                    **counters,
+                    "hit_ratio": (
+                        round(counters["hits"] / lookups, 4) if lookups else None
+                    ),
+                    "latency": {
+                        operation: histogram.to_dict()
+                        for (ns, operation), histogram in sorted(self._latency.items())
+                        if ns == namespace
+                    },
+                }
+            return result
+
+    def render_prometheus(self, prefix: str = "xf_cache") -> str:
+        """
+        Render metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Text body (content type text/plain; version=0.0.4)
+        """
+        lines: list[str] = []
+
+        with self._lock:
+            for counter in COUNTERS:
+                name = f"{prefix}_{counter}_total"
+                lines.append(f"# HELP {name} Cache {counter.replace('_', ' ')}")
+                lines.append(f"# TYPE {name} counter")
+                for namespace, counters in sorted(self._counters.items()):
+                    value = counters[counter]
+                    lines.append(f'{name}{{namespace="{namespace}"}} {value}')
+
+            name = f"{prefix}_hit_ratio"
+            lines.append(f"# HELP {name} Cache hit ratio since worker start")
+            lines.append(f"# TYPE {name} gauge")
+            for namespace, counters in sorted(self._counters.items()):
+                lookups = counters["hits"] + counters["misses"]
+                if lookups:
+                    ratio = counters["hits"] / lookups
+                    lines.append(f'{name}{{namespace="{namespace}"}} {ratio:.6f}')
+
+            name = f"{prefix}_operation_duration_seconds"
+            lines.append(f"# HELP {name} Cache operation latency")
+            lines.append(f"# TYPE {name} histogram")
+            for (namespace, operation), histogram in sorted(self._latency.items()):
+                labels = f'namespace="{namespace}",operation="{operation}"'
+                cumulative = 0
+                # The last bucket counts values above every bound (+Inf)
+                finite = histogram.buckets[:-1]
+                for bound, count in zip(LATENCY_BUCKETS, finite, strict=True):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum:.6f}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def _resolve(self, key: str) -> str:
+        """Namespace label for `key` (lock held)"""
+        namespace = namespace_of(key)
+        known = namespace in self._counters
+        if not known and len(self._counters) >= self.MAX_NAMESPACES:
+            return "other"
+        return namespace
+
+    def _namespace(self, key: str) -> dict[str, int]:
+        """Counters of the namespace of `key`, created on demand (lock held)"""
+        namespace = self._resolve(key)
+        counters = self._counters.get(namespace)
+        if counters is None:
+            counters = self._counters[namespace] = dict.fromkeys(COUNTERS, 0)
+        return counters
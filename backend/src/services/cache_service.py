@@ -18,21 +18,50 @@
 - Status: Stable
 - Classification: Internal
 Notes:
-- Multi-backend cache service (Redis, Filesystem, Memory)
+- Multi-backend cache service (Redis, Mmap, Filesystem, Memory)
 - Auto-detection with fallback strategy
 - Support for both standard and advanced connection tests
+- Optional in-process L1 tier (CACHE_L1_ENABLED) in front of Redis/Filesystem
+- Batched multi-key API (get_many / set_many / delete_many)
+- Tag invalidation via versioned namespaces (no key scanning)
+- Filesystem backend: sharded directories, atomic writes, SQLite expiry/LRU
+  index and a background sweeper (CACHE_FS_MAX_BYTES / CACHE_FS_MAX_ENTRIES)
+- Memory backend bounded (entries/bytes, LRU or LFU) with a background reaper
+- Read-through get_or_compute() with single-flight locking and probabilistic
+  early refresh (cache stampede protection)
+- Atomic fixed-window counters (incr / counter): Redis INCRBY, key-locked
+  read-modify-write on the other backends
+- Values encoded by a pluggable codec (msgpack when installed, JSON otherwise);
+  User/Content/Settings rows come back as detached read-only snapshots
+- Per-namespace metrics (hits, misses, latency histograms, serialization
+  failures), see cache_metrics.py
+- Redis: shared BlockingConnectionPool with socket timeouts and a circuit
+  breaker degrading to an in-process memory tier during outages
 """
 
 import hashlib
+import heapq
 import json
 import logging
+import math
 import os
+import random
+import struct
+import sys
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from backend.src.services.cache_codec import JsonCodec, get_codec
+from backend.src.services.cache_metrics import CacheMetrics
+
 # ---- Backend Detection & Selection ----
 
 
@@ -40,6 +69,7 @@ class CacheBackend(str, Enum):
     """Supported cache backends"""
 
     REDIS = "redis"
+    MMAP = "mmap"
     FILESYSTEM = "filesystem"
     MEMORY = "memory"
 
@@ -50,15 +80,31 @@ class CacheService:
 
     Priority:
     1. Redis (if available)
-    2. Filesystem (if writable)
-    3. Memory (fallback)
+    2. Mmap (shared file in the instance directory, POSIX only)
+    3. Filesystem (if writable)
+    4. Memory (fallback)
     """
 
+    # Tag version tokens must outlive every entry written under them
+    TAG_TTL = 7 * 86400
+
+    # get_or_compute: max time a worker may hold a key's compute lock, poll
+    # interval of workers waiting for it, and early refresh aggressiveness
+    LOCK_TIMEOUT = 10
+    LOCK_POLL_INTERVAL = 0.05
+    EARLY_REFRESH_BETA = 1.0
+
     def __init__(self):
         """Initialize cache service with auto-detection"""
         self.logger = logging.getLogger(__name__)
+        self.codec = get_codec()
+        self.metrics = CacheMetrics()
         self.backend = self._detect_backend()
         self.client = self._init_client()
+        self.client.metrics = self.metrics
+        self.local, self.invalidator = self._init_local_tier()
+        self._flights: dict[str, threading.Lock] = {}
+        self._flights_lock = threading.Lock()
         self.logger.info(f"Cache backend initialized: {self.backend.value}")
 
     # ---- Backend Detection ----
@@ -69,8 +115,9 @@ def _detect_backend(self) -> CacheBackend:
 
         Priority:
         1. Redis available? → REDIS
-        2. Filesystem writable? → FILESYSTEM
-        3. Fallback → MEMORY
+        2. fcntl + instance dir writable? → MMAP
+        3. Filesystem writable? → FILESYSTEM
+        4. Fallback → MEMORY
 
         Returns:
             CacheBackend enum value
@@ -80,6 +127,11 @@ def _detect_backend(self) -> CacheBackend:
             self.logger.debug("Redis detected, using Redis backend")
             return CacheBackend.REDIS
 
+        # Shared memory-mapped table (multi-process, no external service)
+        if self._mmap_available():
+            self.logger.debug("Instance dir writable, using Mmap backend")
+            return CacheBackend.MMAP
+
         # Fallback to Filesystem
         if self._filesystem_writable():
             self.logger.debug("Filesystem writable, using Filesystem backend")
@@ -99,18 +151,36 @@ def _redis_available(self) -> bool:
         try:
             import redis
 
-            r = redis.Redis(
-                host=os.getenv("REDIS_HOST", "localhost"),
-                port=int(os.getenv("REDIS_PORT", 6379)),
-                decode_responses=True,
-                socket_connect_timeout=2,
-            )
+            # Shared pool: bounded connect timeout, connection reused by
+            # the backend afterwards
+            r = redis.Redis(connection_pool=redis_pool())
             r.ping()
             return True
         except Exception as e:
             self.logger.debug(f"Redis not available: {str(e)}")
             return False
 
+    def _mmap_available(self) -> bool:
+        """
+        Check if the mmap backend can be used.
+
+        Requires fcntl (POSIX) and a writable directory for the shared file
+        (CACHE_MMAP_PATH, default: instance/cache.mmap).
+
+        Returns:
+            True if the mmap file can be created, False otherwise
+        """
+        try:
+            import fcntl  # noqa: F401
+
+            mmap_path = Path(os.getenv("CACHE_MMAP_PATH", "./instance/cache.mmap"))
+            mmap_dir = mmap_path.parent
+            mmap_dir.mkdir(parents=True, exist_ok=True)
+            return os.access(mmap_dir, os.W_OK)
+        except Exception as e:
+            self.logger.debug(f"Mmap backend not available: {str(e)}")
+            return False
+
     def _filesystem_writable(self) -> bool:
         """
         Check if filesystem cache directory is writable.
@@ -139,36 +209,463 @@ def _init_client(self) -> Any:
         Initialize cache client based on detected backend.
 
         Returns:
-            Cache client (RedisCache, FilesystemCache, or MemoryCache)
+            Cache client (RedisCache, MmapCache, FilesystemCache, or MemoryCache)
         """
         if self.backend == CacheBackend.REDIS:
-            return RedisCache()
+            return RedisCache(self.codec)
+        elif self.backend == CacheBackend.MMAP:
+            return MmapCache(self.codec)
         elif self.backend == CacheBackend.FILESYSTEM:
-            return FilesystemCache()
+            return FilesystemCache(self.codec)
+        else:
+            return MemoryCache(self.codec)
+
+    def _init_local_tier(self) -> tuple["LocalCache | None", Any]:
+        """
+        Initialize the optional in-process L1 tier.
+
+        Enabled with CACHE_L1_ENABLED=true. Skipped for the Memory backend,
+        which is already in-process.
+
+        Returns:
+            Tuple: (LocalCache or None, invalidator or None)
+        """
+        enabled = os.getenv("CACHE_L1_ENABLED", "False").lower() in ("true", "1", "yes")
+        if not enabled or self.backend == CacheBackend.MEMORY:
+            return None, None
+
+        local = LocalCache(
+            max_entries=int(os.getenv("CACHE_L1_MAX_ENTRIES", 1024)),
+            max_bytes=int(os.getenv("CACHE_L1_MAX_BYTES", 8 * 1024 * 1024)),
+            ttl=int(os.getenv("CACHE_L1_TTL", 30)),
+        )
+
+        if self.backend == CacheBackend.REDIS:
+            invalidator: Any = RedisInvalidator(self.client.redis, local)
         else:
-            return MemoryCache()
+            invalidator = GenerationInvalidator(self.client.cache_dir, local)
+
+        self.logger.info("Cache L1 tier enabled (in-process LRU)")
+        return local, invalidator
+
+    def _local_tier(self) -> "LocalCache | None":
+        """Return the L1 tier if enabled and coherent with other workers."""
+        if self.local is None:
+            return None
+
+        self.invalidator.sync()
+        return self.local if self.invalidator.healthy else None
 
     # ---- Public Cache API ----
 
-    def get(self, key: str) -> Any | None:
-        """Get value from cache"""
-        return self.client.get(key)
+    def get(self, key: str, tags: list[str] | None = None) -> Any | None:
+        """Get value from cache (L1 first when enabled)"""
+        key = self._tagged_key(key, tags)
+        start = time.perf_counter()
+        value = self._get(key)
+        self.metrics.observe(key, "get", time.perf_counter() - start)
+        self.metrics.incr(key, "misses" if value is None else "hits")
+        return value
+
+    def _get(self, key: str) -> Any | None:
+        """Uninstrumented lookup of a (tagged) key"""
+        local = self._local_tier()
+        if local is not None:
+            value = local.get(key)
+            if value is not None:
+                return value
+
+        value = self.client.get(key)
+
+        # Only values read back from the backend are promoted, so L1 always
+        # returns the same (deserialized) shape as the backend does.
+        if local is not None and value is not None:
+            local.set(key, value)
+
+        return value
+
+    def set(
+        self, key: str, value: Any, ttl: int = 300, tags: list[str] | None = None
+    ) -> None:
+        """Set value in cache with TTL (optionally under tags)"""
+        key = self._tagged_key(key, tags)
+        self._fill(key, value, ttl)
+        if self.local is not None:
+            # Other workers may hold the previous value in their L1
+            self.invalidator.publish([key])
+
+    def _fill(self, key: str, value: Any, ttl: int) -> None:
+        """
+        Store a (tagged) key without notifying other workers.
 
-    def set(self, key: str, value: Any, ttl: int = 300) -> None:
-        """Set value in cache with TTL"""
+        Used for values computed on a miss or refresh (get_or_compute, tag
+        tokens): they do not change what the key stands for, so other
+        workers' L1 copies stay valid. On the file backends every
+        notification empties all L1 tiers, which fills must not trigger.
+        """
+        start = time.perf_counter()
         self.client.set(key, value, ttl)
+        self.metrics.observe(key, "set", time.perf_counter() - start)
+        self.metrics.incr(key, "sets")
+        if self.local is not None:
+            self.local.delete(key)
 
     def delete(self, key: str) -> None:
-        """Delete key from cache"""
+        """Delete key from cache (and from every worker's L1)"""
         self.client.delete(key)
+        self.metrics.incr(key, "deletes")
+        if self.local is not None:
+            self.local.delete(key)
+            self.invalidator.publish([key])
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Get several keys in one backend round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dict of key → value for keys found (misses are omitted)
+        """
+        found: dict[str, Any] = {}
+        missing = list(dict.fromkeys(keys))
+
+        local = self._local_tier()
+        if local is not None:
+            for key in missing:
+                value = local.get(key)
+                if value is not None:
+                    found[key] = value
+            missing = [key for key in missing if key not in found]
+
+        if missing:
+            start = time.perf_counter()
+            fetched = self.client.get_many(missing)
+            # One round trip, attributed to the namespace of the first key
+            self.metrics.observe(missing[0], "get_many", time.perf_counter() - start)
+            if local is not None:
+                for key, value in fetched.items():
+                    local.set(key, value)
+            found.update(fetched)
+
+        for key in dict.fromkeys(keys):
+            self.metrics.incr(key, "hits" if key in found else "misses")
+
+        return found
+
+    def set_many(self, mapping: dict[str, Any], ttl: int = 300) -> None:
+        """Set several values with the same TTL in one backend round trip"""
+        if not mapping:
+            return
+
+        self._fill_many(mapping, ttl)
+        if self.local is not None:
+            self.invalidator.publish(list(mapping))
+
+    def _fill_many(self, mapping: dict[str, Any], ttl: int) -> None:
+        """Batched _fill (no notification of other workers)"""
+        start = time.perf_counter()
+        self.client.set_many(mapping, ttl)
+        elapsed = time.perf_counter() - start
+        self.metrics.observe(next(iter(mapping)), "set_many", elapsed)
+        for key in mapping:
+            self.metrics.incr(key, "sets")
+        if self.local is not None:
+            for key in mapping:
+                self.local.delete(key)
+
+    def delete_many(self, keys: list[str]) -> None:
+        """Delete several keys in one backend round trip"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return
+
+        self.client.delete_many(keys)
+        for key in keys:
+            self.metrics.incr(key, "deletes")
+        if self.local is not None:
+            for key in keys:
+                self.local.delete(key)
+            self.invalidator.publish(keys)
+
+    # ---- Counters ----
+
+    def incr(self, key: str, amount: int = 1, ttl: int = 300) -> int:
+        """
+        Atomically add `amount` to a counter and return the new value.
+
+        Fixed window: the TTL starts with the first increment and is not
+        extended by later ones. Redis uses INCRBY (one round trip); other
+        backends serialize updates of the key on its compute lock (per-key
+        thread lock plus the backend lock, as in get_or_compute).
+
+        Args:
+            key: Counter key (not shared with regular values)
+            amount: Increment
+            ttl: Window length in seconds
+
+        Returns:
+            Counter value after the increment
+        """
+        start = time.perf_counter()
+        native = getattr(self.client, "incr", None)
+        value = native(key, amount, ttl) if native is not None else None
+        if value is None:
+            value = self._locked_incr(key, amount, ttl)
+        self.metrics.observe(key, "set", time.perf_counter() - start)
+        self.metrics.incr(key, "sets")
+        return value
+
+    def counter(self, key: str) -> int:
+        """Current value of a counter (0 if unset or expired)"""
+        native = getattr(self.client, "counter", None)
+        value = native(key) if native is not None else None
+        if value is None:
+            entry = self.client.get(key)
+            value = entry["__counter__"] if self._live_counter(entry) else 0
+        return int(value)
+
+    @staticmethod
+    def _live_counter(entry: Any) -> bool:
+        """Whether a stored value is an unexpired counter envelope"""
+        return (
+            isinstance(entry, dict)
+            and "__counter__" in entry
+            and entry["expires_at"] > time.time()
+        )
+
+    def _locked_incr(self, key: str, amount: int, ttl: int) -> int:
+        """Read-modify-write of a counter envelope under the key's locks"""
+        lock_key = f"counter:{key}"
+        flight = self._flight(lock_key)
+        token = None
+
+        flight.acquire()
+        try:
+            token = self.client.acquire_lock(lock_key, self.LOCK_TIMEOUT)
+            deadline = time.monotonic() + self.LOCK_TIMEOUT
+            while token is None and time.monotonic() < deadline:
+                time.sleep(self.LOCK_POLL_INTERVAL)
+                token = self.client.acquire_lock(lock_key, self.LOCK_TIMEOUT)
+
+            now = time.time()
+            entry = self.client.get(key)
+            if self._live_counter(entry):
+                value, expires_at = entry["__counter__"] + amount, entry["expires_at"]
+            else:
+                value, expires_at = amount, now + ttl
+
+            self.client.set(
+                key,
+                {"__counter__": value, "expires_at": expires_at},
+                max(1, math.ceil(expires_at - now)),
+            )
+            return int(value)
+        finally:
+            if token:
+                self.client.release_lock(lock_key, token)
+            flight.release()
+            with self._flights_lock:
+                if self._flights.get(lock_key) is flight:
+                    del self._flights[lock_key]
+
+    def get_or_compute(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        ttl: int = 300,
+        tags: list[str] | None = None,
+    ) -> Any:
+        """
+        Read-through lookup with cache stampede protection.
+
+        On a miss, only one caller computes the value: threads of this
+        process serialize on a per-key lock, other processes on a backend
+        lock (SET NX on Redis, lock file on the filesystem). Waiters pick up
+        the freshly cached value instead of recomputing it.
+
+        Entries are also refreshed probabilistically before they expire
+        (XFetch): the closer to expiry and the slower `fn` was, the more
+        likely a read triggers a refresh, while other callers keep being
+        served the current value.
+
+        Args:
+            key: Cache key
+            fn: Zero-argument callable computing the value
+            ttl: Time to live in seconds
+            tags: Optional tags (see invalidate_tags)
+
+        Returns:
+            Cached or computed value (None results are not cached)
+        """
+        key = self._tagged_key(key, tags)
+        entry = self._get_entry(key)
+        if entry is not None and not self._should_refresh(entry):
+            return entry["value"]
+
+        flight = self._flight(key)
+
+        # Early refresh is best effort: if another thread is already on it,
+        # keep serving the current value instead of queueing up
+        if not flight.acquire(blocking=entry is None):
+            return entry["value"]
+
+        token = None
+        try:
+            if entry is None:
+                # The thread we waited for has most likely filled the key
+                entry = self._get_entry(key)
+                if entry is not None:
+                    return entry["value"]
+
+            token = self.client.acquire_lock(key, self.LOCK_TIMEOUT)
+            if token is None:
+                if entry is not None:
+                    # Another worker is refreshing, current value still valid
+                    return entry["value"]
+
+                deadline = time.monotonic() + self.LOCK_TIMEOUT
+                while token is None and time.monotonic() < deadline:
+                    time.sleep(self.LOCK_POLL_INTERVAL)
+                    entry = self._get_entry(key)
+                    if entry is not None:
+                        return entry["value"]
+                    token = self.client.acquire_lock(key, self.LOCK_TIMEOUT)
+
+                # Lock holder is stuck: compute anyway rather than fail
+
+            return self._compute(key, fn, ttl)
+        finally:
+            if token:
+                self.client.release_lock(key, token)
+            flight.release()
+            with self._flights_lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+    def _flight(self, key: str) -> threading.Lock:
+        """Per-key in-process lock (created on demand)"""
+        with self._flights_lock:
+            return self._flights.setdefault(key, threading.Lock())
+
+    def _get_entry(self, key: str) -> dict[str, Any] | None:
+        """Read a get_or_compute envelope (anything else counts as a miss)"""
+        entry = self.get(key)
+        if isinstance(entry, dict) and "__xfetch__" in entry:
+            return entry
+        return None
+
+    def _should_refresh(self, entry: dict[str, Any]) -> bool:
+        """XFetch: refresh early with probability rising towards expiry"""
+        # Statistical jitter only, not a secret
+        jitter = -math.log(1.0 - random.random())  # noqa: S311
+        head_start = entry["delta"] * self.EARLY_REFRESH_BETA * jitter
+        return time.time() + head_start >= entry["expires_at"]
+
+    def _compute(self, key: str, fn: Callable[[], Any], ttl: int) -> Any:
+        """Run `fn` and cache its result with the recompute cost"""
+        start = time.monotonic()
+        value = fn()
+        delta = time.monotonic() - start
+        self.metrics.incr(key, "computes")
+        self.metrics.observe(key, "compute", delta)
+
+        if value is not None:
+            self._fill(
+                key,
+                {
+                    "__xfetch__": 1,
+                    "value": value,
+                    "delta": delta,
+                    "expires_at": time.time() + ttl,
+                },
+                ttl,
+            )
+        return value
+
+    def invalidate_tags(self, tags: list[str]) -> None:
+        """
+        Logically drop every entry written under any of `tags`.
+
+        O(1) per tag: the tag's version token is deleted, so keys built with
+        the old token are never looked up again and simply expire by TTL.
+
+        Args:
+            tags: Tag names (e.g. ["content"])
+        """
+        self.delete_many([f"tag:{tag}" for tag in tags])
+
+    def _tagged_key(self, key: str, tags: list[str] | None) -> str:
+        """
+        Embed the current version token of each tag into the key.
+
+        Tokens are random rather than counters, so a token recreated after
+        invalidation (or expiry) can never collide with an older one.
+
+        Args:
+            key: Base cache key
+            tags: Tag names or None
+
+        Returns:
+            Key suffixed with "|tag=token,..." (unchanged when no tags)
+        """
+        if not tags:
+            return key
+
+        versions = self.tag_versions(tags)
+        suffix = ",".join(f"{tag}={versions[tag]}" for tag in sorted(versions))
+        return f"{key}|{suffix}"
+
+    def tag_versions(self, tags: list[str]) -> dict[str, str]:
+        """
+        Current version token of each tag (created when missing).
+
+        The token changes whenever the tag is invalidated, so callers keeping
+        derived state outside the cache can compare tokens to detect changes.
+
+        Args:
+            tags: Tag names
+
+        Returns:
+            Dict of tag → version token
+        """
+        tag_keys = [f"tag:{tag}" for tag in sorted(set(tags))]
+        versions = self.get_many(tag_keys)
+
+        missing = {
+            tag_key: uuid.uuid4().hex[:12]
+            for tag_key in tag_keys
+            if tag_key not in versions
+        }
+        if missing:
+            # Missing tokens were deleted (already announced) or expired
+            self._fill_many(missing, self.TAG_TTL)
+            versions.update(missing)
+
+        return {tag_key[4:]: token for tag_key, token in versions.items()}
 
     def flush(self) -> None:
         """Clear all cache"""
         self.client.flush()
+        if self.local is not None:
+            self.local.clear()
+            self.invalidator.publish(None)
 
     def get_info(self) -> dict[str, Any]:
         """Get cache backend info"""
-        return {"backend": self.backend.value, "info": self.client.get_info()}
+        info = {
+            "backend": self.backend.value,
+            "codec": self.codec.name,
+            "info": self.client.get_info(),
+        }
+        if self.local is not None:
+            info["local"] = self.local.get_info()
+        return info
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get per-namespace metrics of this worker (see CacheMetrics.snapshot)"""
+        return self.metrics.snapshot()
 
     # ---- Connection Testing ----
 
@@ -201,6 +698,7 @@ def test_redis_connection(
                 db=db,
                 decode_responses=True,
                 socket_connect_timeout=5,
+                socket_timeout=5,
             )
 
             # Test ping
@@ -254,6 +752,7 @@ def test_redis_advanced(
                 db=db,
                 decode_responses=True,
                 socket_connect_timeout=5,
+                socket_timeout=5,
             )
 
             # Test write
@@ -289,67 +788,441 @@ def test_redis_advanced(
             return False, f"Advanced test error: {str(e)}", None
 
 
+# ---- Serialization Failures ----
+
+
+def _serialization_failed(backend: Any, key: str, value: Any, error: Exception) -> None:
+    """
+    Report a value the codec could not encode (or a payload it could not decode).
+
+    The write is dropped rather than raising, but the failure is logged and
+    counted: a model missing from the registry silently disables caching
+    for every caller otherwise. Backends delete the key's previous value,
+    which would be stale from then on.
+    """
+    backend.logger.warning(
+        f"Cache serialization failed (key={key}, type={type(value).__name__}): "
+        f"{str(error)}"
+    )
+    if backend.metrics is not None:
+        backend.metrics.incr(key, "serialization_failures")
+
+
 # ---- Redis Backend ----
 
 
+_REDIS_POOLS: dict[tuple[Any, ...], Any] = {}
+_REDIS_POOLS_LOCK = threading.Lock()
+
+
+def redis_pool() -> Any:
+    """
+    Process-wide, size-limited Redis connection pool.
+
+    Every client of the configured server (cache, sessions, detection probe)
+    shares it, so the number of sockets per worker is bounded by
+    REDIS_POOL_MAX_CONNECTIONS. When all connections are busy, callers wait
+    at most REDIS_POOL_TIMEOUT seconds and then fail fast with a
+    ConnectionError instead of queueing indefinitely.
+
+    Returns:
+        redis.BlockingConnectionPool
+    """
+    import redis
+
+    settings = (
+        os.getenv("REDIS_HOST", "localhost"),
+        int(os.getenv("REDIS_PORT", 6379)),
+        os.getenv("REDIS_PASSWORD", None) or None,
+        int(os.getenv("REDIS_DB", 0)),
+    )
+
+    with _REDIS_POOLS_LOCK:
+        pool = _REDIS_POOLS.get(settings)
+        if pool is None:
+            host, port, password, db = settings
+            pool = _REDIS_POOLS[settings] = redis.BlockingConnectionPool(
+                host=host,
+                port=port,
+                password=password,
+                db=db,
+                max_connections=int(os.getenv("REDIS_POOL_MAX_CONNECTIONS", 20)),
+                timeout=float(os.getenv("REDIS_POOL_TIMEOUT", 1.0)),
+                socket_connect_timeout=float(os.getenv("REDIS_CONNECT_TIMEOUT", 1.0)),
+                socket_timeout=float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.5)),
+                health_check_interval=30,
+            )
+        return pool
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with a background recovery probe.
+
+    Closed: calls go through. After `threshold` consecutive failures the
+    breaker opens and callers skip the remote service entirely (no timeout
+    paid per request). While open, a daemon thread runs `probe` every
+    `cooldown` seconds; the first successful probe closes the breaker.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[], bool],
+        threshold: int = 5,
+        cooldown: float = 10.0,
+        name: str = "redis",
+    ):
+        """Initialize a closed breaker"""
+        self.probe = probe
+        self.threshold = max(threshold, 1)
+        self.cooldown = cooldown
+        self.name = name
+        self.failures = 0
+        self.trips = 0
+        self.opened_at: float | None = None
+        self.last_error: str | None = None
+        self._lock = threading.Lock()
+        self._probe_pid: int | None = None
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls must be short-circuited"""
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        """Check whether a call may go to the remote service"""
+        if self.opened_at is None:
+            return True
+
+        # A forked worker inherits the open state but not the probe thread
+        if self._probe_pid != os.getpid():
+            self._start_probe()
+        return False
+
+    def record_success(self) -> None:
+        """Reset the consecutive failure count"""
+        if self.failures:
+            self.failures = 0
+
+    def record_failure(self, error: Exception) -> None:
+        """Count a failure; open the breaker once the threshold is reached"""
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error)
+            if self.opened_at is not None or self.failures < self.threshold:
+                return
+
+            self.opened_at = time.time()
+            self.trips += 1
+
+        self.logger.warning(
+            f"Cache circuit breaker opened ({self.name}) after "
+            f"{self.failures} consecutive errors: {self.last_error}"
+        )
+        self._start_probe()
+
+    def get_info(self) -> dict[str, Any]:
+        """Breaker state for the admin page"""
+        return {
+            "state": "open" if self.is_open else "closed",
+            "failures": self.failures,
+            "trips": self.trips,
+            "opened_at": self.opened_at,
+            "last_error": self.last_error,
+        }
+
+    def _start_probe(self) -> None:
+        """Start the recovery probe thread of this process"""
+        with self._lock:
+            if self._probe_pid == os.getpid():
+                return
+            self._probe_pid = os.getpid()
+
+        threading.Thread(
+            target=self._probe_loop, name=f"cache-breaker-{self.name}", daemon=True
+        ).start()
+
+    def _probe_loop(self) -> None:
+        """Probe until the remote service recovers (runs in a daemon thread)"""
+        pid = os.getpid()
+        while self.opened_at is not None and self._probe_pid == pid:
+            time.sleep(self.cooldown)
+            try:
+                recovered = self.probe()
+            except Exception as e:
+                self.last_error = str(e)
+                recovered = False
+
+            if recovered:
+                with self._lock:
+                    self.opened_at = None
+                    self.failures = 0
+                    self._probe_pid = None
+                self.logger.info(f"Cache circuit breaker closed ({self.name})")
+                return
+
+
 class RedisCache:
-    """Redis cache backend wrapper"""
+    """
+    Redis cache backend wrapper.
 
-    def __init__(self):
+    Uses the shared connection pool (see redis_pool) with per-operation
+    socket timeouts. Connection errors and timeouts feed a circuit breaker:
+    once open, operations are served by an in-process MemoryCache instead of
+    waiting on Redis. Keys written or deleted meanwhile are remembered and
+    deleted from Redis when it comes back, so no stale value reappears.
+    """
+
+    # Keys remembered during an outage; beyond this the whole DB is flushed
+    # on recovery instead
+    MAX_DIRTY_KEYS = 10_000
+
+    def __init__(self, codec: Any = None):
         """Initialize Redis connection"""
         import redis
 
-        self.redis = redis.Redis(
-            host=os.getenv("REDIS_HOST", "localhost"),
-            port=int(os.getenv("REDIS_PORT", 6379)),
-            password=os.getenv("REDIS_PASSWORD", None) or None,
-            db=int(os.getenv("REDIS_DB", 0)),
-            decode_responses=True,
-        )
+        # Binary-safe client: values are codec bytes, not text
+        self.redis = redis.Redis(connection_pool=redis_pool())
+        self.codec = codec or get_codec()
+        self.metrics: CacheMetrics | None = None
         self.logger = logging.getLogger(__name__)
 
+        # Availability errors only: a command error (wrong type, script
+        # error) says nothing about the health of the server
+        self._outage_errors = (redis.ConnectionError, redis.TimeoutError)
+        self.breaker = CircuitBreaker(
+            self._recover,
+            threshold=int(os.getenv("CACHE_BREAKER_THRESHOLD", 5)),
+            cooldown=float(os.getenv("CACHE_BREAKER_COOLDOWN", 10)),
+        )
+        self.fallback = MemoryCache(self.codec)
+        self._dirty: set[str] = set()
+        self._dirty_overflow = False
+        self._dirty_lock = threading.Lock()
+
     def get(self, key: str) -> Any | None:
         """Get value from Redis"""
+        if not self.breaker.allow():
+            return self.fallback.get(key)
+
         try:
             value = self.redis.get(key)
-            return json.loads(value) if value else None
         except Exception as e:
-            self.logger.error(f"Redis get error: {str(e)}")
+            self._failed("get", e)
+            return None
+        self.breaker.record_success()
+
+        if not value:
+            return None
+
+        try:
+            return self.codec.loads(value)
+        except Exception as e:
+            _serialization_failed(self, key, value, e)
             return None
 
     def set(self, key: str, value: Any, ttl: int = 300) -> None:
         """Set value in Redis with TTL"""
+        if not self.breaker.allow():
+            self._mark_dirty([key])
+            self.fallback.set(key, value, ttl)
+            return
+
         try:
-            # Serialize SQLAlchemy models if needed
-            serializable_value = value
-            if hasattr(value, 'to_dict') and callable(value.to_dict):
-                serializable_value = value.to_dict(include_email=True)
+            serialized = self.codec.dumps(value)
+        except (TypeError, ValueError) as e:
+            # Non-serializable objects (unregistered models, etc.) are not
+            # cached, and the previous value must not be served instead
+            _serialization_failed(self, key, value, e)
+            self.delete(key)
+            return
 
-            # Try to serialize the value
-            serialized = json.dumps(serializable_value)
+        try:
             self.redis.setex(key, ttl, serialized)
-        except (TypeError, ValueError) as e:
-            # Ignore non-serializable objects (SQLAlchemy models, etc.)
-            self.logger.debug(f"Skipping cache for non-serializable object: {type(value).__name__}")
         except Exception as e:
-            self.logger.error(f"Redis set error: {str(e)}")
+            # The old value may still be served once Redis answers again
+            self._mark_dirty([key])
+            self._failed("set", e)
+            return
+        self.breaker.record_success()
 
     def delete(self, key: str) -> None:
         """Delete key from Redis"""
+        self.delete_many([key])
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values from Redis (single MGET)"""
+        if not self.breaker.allow():
+            return self.fallback.get_many(keys)
+
+        try:
+            values = self.redis.mget(keys)
+        except Exception as e:
+            self._failed("mget", e)
+            return {}
+        self.breaker.record_success()
+
+        found = {}
+        for key, value in zip(keys, values, strict=True):
+            if not value:
+                continue
+            try:
+                found[key] = self.codec.loads(value)
+            except Exception as e:
+                _serialization_failed(self, key, value, e)
+        return found
+
+    def set_many(self, mapping: dict[str, Any], ttl: int = 300) -> None:
+        """Set several values in Redis (pipelined SETEX)"""
+        if not self.breaker.allow():
+            self._mark_dirty(list(mapping))
+            self.fallback.set_many(mapping, ttl)
+            return
+
         try:
-            self.redis.delete(key)
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in mapping.items():
+                try:
+                    pipe.setex(key, ttl, self.codec.dumps(value))
+                except (TypeError, ValueError) as e:
+                    _serialization_failed(self, key, value, e)
+                    pipe.delete(key)
+            pipe.execute()
         except Exception as e:
-            self.logger.error(f"Redis delete error: {str(e)}")
+            # The old values may still be served once Redis answers again
+            self._mark_dirty(list(mapping))
+            self._failed("set_many", e)
+            return
+        self.breaker.record_success()
+
+    def delete_many(self, keys: list[str]) -> None:
+        """Delete several keys from Redis (single DEL)"""
+        if not self.breaker.allow():
+            self._mark_dirty(keys)
+            self.fallback.delete_many(keys)
+            return
+
+        try:
+            self.redis.delete(*keys)
+        except Exception as e:
+            # The old value may still be served once Redis answers again
+            self._mark_dirty(keys)
+            self._failed("delete", e)
+            return
+        self.breaker.record_success()
+
+    # INCRBY, with the TTL set by the increment that created the key
+    _INCR_SCRIPT = (
+        "local n = redis.call('incrby', KEYS[1], ARGV[1]) "
+        "if redis.call('ttl', KEYS[1]) < 0 then "
+        "redis.call('expire', KEYS[1], ARGV[2]) end "
+        "return n"
+    )
+
+    def incr(self, key: str, amount: int, ttl: int) -> int | None:
+        """
+        Atomic counter (INCRBY + EXPIRE in one script).
+
+        Returns:
+            New value, or None if Redis is unreachable (CacheService then
+            counts in the in-process fallback)
+        """
+        if not self.breaker.allow():
+            return None
+
+        try:
+            value = self.redis.eval(self._INCR_SCRIPT, 1, key, amount, ttl)
+        except Exception as e:
+            self._failed("incr", e)
+            return None
+        self.breaker.record_success()
+        return int(value)
+
+    def counter(self, key: str) -> int | None:
+        """Current value of a counter (None if Redis is unreachable)"""
+        if not self.breaker.allow():
+            return None
+
+        try:
+            value = self.redis.get(key)
+        except Exception as e:
+            self._failed("counter", e)
+            return None
+        self.breaker.record_success()
+        return int(value) if value else 0
+
+    # Compare-and-delete: never release a lock that expired and was taken
+    # over by another worker
+    _RELEASE_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+
+    def acquire_lock(self, key: str, timeout: float) -> str | None:
+        """
+        Try to take the compute lock of `key` (SET NX PX).
+
+        Returns:
+            Lock token, None if held by another worker, or "" if Redis is
+            unreachable (caller computes without a lock)
+        """
+        if not self.breaker.allow():
+            return ""
+
+        token = uuid.uuid4().hex
+        try:
+            acquired = self.redis.set(
+                f"lock:{key}", token, nx=True, px=int(timeout * 1000)
+            )
+        except Exception as e:
+            self._failed("lock", e)
+            return ""
+        self.breaker.record_success()
+        return token if acquired else None
+
+    def release_lock(self, key: str, token: str) -> None:
+        """Release the compute lock of `key` if we still own it"""
+        if not self.breaker.allow():
+            return
+
+        try:
+            self.redis.eval(self._RELEASE_SCRIPT, 1, f"lock:{key}", token)
+        except Exception as e:
+            self._failed("unlock", e)
 
     def flush(self) -> None:
         """Clear all keys in Redis database"""
+        self.fallback.flush()
+        if not self.breaker.allow():
+            with self._dirty_lock:
+                self._dirty_overflow = True
+            return
+
         try:
             self.redis.flushdb()
         except Exception as e:
-            self.logger.error(f"Redis flush error: {str(e)}")
+            with self._dirty_lock:
+                self._dirty_overflow = True
+            self._failed("flush", e)
 
     def get_info(self) -> dict[str, Any]:
         """Get Redis info"""
+        pool = self.redis.connection_pool
+        connections = {
+            "max": getattr(pool, "max_connections", None),
+            "open": len(getattr(pool, "_connections", [])),
+        }
+
+        if not self.breaker.allow():
+            return {
+                "type": "redis",
+                "error": "Circuit breaker open, serving from memory",
+                "breaker": self.breaker.get_info(),
+                "connections": connections,
+                "fallback": self.fallback.get_info(),
+            }
+
         try:
             info = self.redis.info()
             return {
@@ -357,170 +1230,1400 @@ def get_info(self) -> dict[str, Any]:
                 "version": info.get("redis_version", "unknown"),
                 "memory": info.get("used_memory_human", "0"),
                 "keys": self.redis.dbsize(),
+                "breaker": self.breaker.get_info(),
+                "connections": connections,
             }
         except Exception:
-            return {"type": "redis", "error": "Unable to get info"}
+            return {
+                "type": "redis",
+                "error": "Unable to get info",
+                "breaker": self.breaker.get_info(),
+            }
+
+    # ---- Circuit Breaker ----
+
+    def _failed(self, operation: str, error: Exception) -> None:
+        """Log a Redis error and feed the circuit breaker"""
+        self.logger.error(f"Redis {operation} error: {str(error)}")
+        if isinstance(error, self._outage_errors):
+            self.breaker.record_failure(error)
+
+    def _mark_dirty(self, keys: list[str]) -> None:
+        """Remember keys whose Redis copy may be stale after an outage"""
+        with self._dirty_lock:
+            if self._dirty_overflow:
+                return
+            self._dirty.update(keys)
+            if len(self._dirty) > self.MAX_DIRTY_KEYS:
+                self._dirty.clear()
+                self._dirty_overflow = True
+
+    def _recover(self) -> bool:
+        """
+        Recovery probe (breaker thread): ping, then drop stale entries.
+
+        Returns:
+            True once Redis answers and is consistent with the writes made
+            during the outage
+        """
+        self.redis.ping()
+
+        with self._dirty_lock:
+            dirty, self._dirty = list(self._dirty), set()
+            overflow, self._dirty_overflow = self._dirty_overflow, False
+
+        try:
+            if overflow:
+                self.logger.warning(
+                    "Redis recovered: flushing DB (too many stale keys)"
+                )
+                self.redis.flushdb()
+            else:
+                for start in range(0, len(dirty), 1000):
+                    self.redis.delete(*dirty[start : start + 1000])
+        except Exception:
+            # Keep the breaker open and retry the whole replay next probe
+            with self._dirty_lock:
+                self._dirty.update(dirty)
+                self._dirty_overflow = self._dirty_overflow or overflow
+            raise
+
+        self.fallback.flush()
+        return True
 
 
 # ---- Filesystem Backend ----
 
 
 class FilesystemCache:
-    """Filesystem cache backend (JSON files with TTL)"""
+    """
+    Filesystem cache backend (codec-encoded files with TTL).
+
+    Layout: `<CACHE_DIR>/<2 hex chars>/<sha256>.json`, i.e. entries are
+    spread over 256 shard directories so no directory grows unbounded.
+    Writes go to a temp file in the same shard and are renamed into place,
+    so readers never see a half-written entry.
+
+    A SQLite index (`index.sqlite3`) tracks expiry, size and last access of
+    every entry. It lets a periodic sweeper remove expired files and evict
+    least recently used ones above the size cap without scanning the
+    directory tree, and makes get_info O(1). Only one worker sweeps per
+    interval (lease row in the index).
+    """
 
-    def __init__(self):
+    SHARD_CHARS = 2
+    INDEX_NAME = "index.sqlite3"
+    SWEEP_BATCH = 1000
+
+    # Evict down to this fraction of the caps, so the next write does not
+    # immediately trigger another eviction round
+    EVICT_TARGET = 0.9
+
+    # Last-access times are buffered in memory and written to the index in
+    # batches (by the sweeper, or inline once this many are pending)
+    TOUCH_FLUSH_THRESHOLD = 4096
+
+    def __init__(self, codec: Any = None):
         """Initialize filesystem cache directory"""
         self.cache_dir = Path(os.getenv("CACHE_DIR", "./cache"))
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.codec = codec or get_codec()
+        self.max_bytes = int(os.getenv("CACHE_FS_MAX_BYTES", 512 * 1024 * 1024))
+        self.max_entries = int(os.getenv("CACHE_FS_MAX_ENTRIES", 200_000))
+        self.sweep_interval = int(os.getenv("CACHE_FS_SWEEP_INTERVAL", 60))
+        self.metrics: CacheMetrics | None = None
         self.logger = logging.getLogger(__name__)
 
+        self._index_path = self.cache_dir / self.INDEX_NAME
+        self._conns = threading.local()
+        self._touched: dict[str, float] = {}
+        self._touched_lock = threading.Lock()
+        self._sweeper_pid: int | None = None
+        self.last_sweep: dict[str, Any] = {}
+
+    # ---- Entries ----
+
     def get(self, key: str) -> Any | None:
         """Get value from filesystem cache"""
-        try:
-            file_path = self._key_to_path(key)
-            if not file_path.exists():
-                return None
+        return self.get_many([key]).get(key)
 
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Get several values in one pass over the cache directory.
 
-            # Check expiry
-            if data["expires_at"] < time.time():
-                file_path.unlink()
-                return None
+        Missing files are detected by the failed open itself (no separate
+        exists() stat per key).
+        """
+        found = {}
+        now = time.time()
 
-            return data["value"]
-        except Exception as e:
-            self.logger.debug(f"Filesystem get error: {str(e)}")
-            return None
+        for key in keys:
+            key_hash = self._hash(key)
+            file_path = self._hash_to_path(key_hash)
+            try:
+                data = self._read(file_path)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                self.logger.debug(f"Filesystem get error: {str(e)}")
+                continue
 
-    def set(self, key: str, value: Any, ttl: int = 300) -> None:
-        """Set value in filesystem cache with TTL"""
-        try:
-            # NEVER cache User objects - Flask-Session handles them
-            from backend.src.models.user import User
-            if isinstance(value, User):
-                self.logger.debug(f"Skipping cache for User object (user_id={value.id})")
-                return
+            if data["expires_at"] < now:
+                self._remove(key_hash)
+                continue
 
-            file_path = self._key_to_path(key)
+            self._touch(key_hash, now)
+            found[key] = data["value"]
 
-            # Serialize SQLAlchemy models if needed
-            serializable_value = value
-            if hasattr(value, 'to_dict') and callable(value.to_dict):
-                try:
-                    serializable_value = value.to_dict(include_email=True)
-                except TypeError:
-                    # to_dict() doesn't accept parameters, try without
-                    serializable_value = value.to_dict()
-            elif hasattr(value, '__mapper__'):
-                # SQLAlchemy mapped object without to_dict()
-                try:
-                    serializable_value = {c.name: getattr(value, c.name)
-                                         for c in value.__mapper__.columns}
-                except Exception:
-                    # Can't serialize, skip cache
-                    self.logger.debug(f"Skipping cache for non-serializable object (key={key})")
-                    return
-
-            data = {
-                "value": serializable_value,
-                "expires_at": time.time() + ttl,
-                "created_at": datetime.now().isoformat(),
-            }
+        return found
 
-            # Try to serialize - skip if not JSON serializable
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f)
-        except (TypeError, ValueError) as e:
-            # Log non-serializable values for debugging (don't error, just skip)
-            self.logger.debug(f"Skipping cache for non-serializable value (key={key}, type={type(value).__name__}, error={str(e)})")
-        except Exception as e:
-            self.logger.debug(f"Filesystem set error (non-critical): {str(e)}")
+    def set(self, key: str, value: Any, ttl: int = 300) -> None:
+        """Set value in filesystem cache with TTL"""
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, mapping: dict[str, Any], ttl: int = 300) -> None:
+        """Set several values with the same TTL (one index transaction)"""
+        now = time.time()
+        rows = []
+        dropped = []
+
+        for key, value in mapping.items():
+            try:
+                payload = self.codec.dumps(
+                    {
+                        "value": value,
+                        "expires_at": now + ttl,
+                        "created_at": datetime.now().isoformat(),
+                    }
+                )
+            except (TypeError, ValueError) as e:
+                _serialization_failed(self, key, value, e)
+                dropped.append(key)
+                continue
+
+            key_hash = self._hash(key)
+            try:
+                self._write_atomic(self._hash_to_path(key_hash), payload)
+            except Exception as e:
+                self.logger.debug(f"Filesystem set error (non-critical): {str(e)}")
+                continue
+
+            rows.append((key_hash, now + ttl, len(payload), now))
+
+        # A value the codec rejected must not leave the previous one served
+        if dropped:
+            self.delete_many(dropped)
+
+        if rows:
+            self._index_execute(
+                "INSERT OR REPLACE INTO entries (hash, expires_at, size, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._ensure_sweeper()
 
     def delete(self, key: str) -> None:
         """Delete key from filesystem cache"""
-        try:
-            file_path = self._key_to_path(key)
-            if file_path.exists():
-                file_path.unlink()
-        except Exception as e:
-            self.logger.error(f"Filesystem delete error: {str(e)}")
+        self.delete_many([key])
+
+    def delete_many(self, keys: list[str]) -> None:
+        """Delete several keys in one pass"""
+        hashes = [self._hash(key) for key in keys]
+        for key_hash in hashes:
+            try:
+                self._hash_to_path(key_hash).unlink(missing_ok=True)
+            except Exception as e:
+                self.logger.error(f"Filesystem delete error: {str(e)}")
+        self._index_execute(
+            "DELETE FROM entries WHERE hash = ?", [(key_hash,) for key_hash in hashes]
+        )
 
     def flush(self) -> None:
         """Clear all cache files"""
         try:
+            for shard in self.cache_dir.iterdir():
+                if shard.is_dir() and len(shard.name) == self.SHARD_CHARS:
+                    for file_path in shard.iterdir():
+                        file_path.unlink(missing_ok=True)
+
+            # Flat files written by releases before sharding
             for file_path in self.cache_dir.glob("*.json"):
-                file_path.unlink()
+                file_path.unlink(missing_ok=True)
+
+            self._index_execute("DELETE FROM entries")
+            with self._touched_lock:
+                self._touched.clear()
         except Exception as e:
             self.logger.error(f"Filesystem flush error: {str(e)}")
 
     def get_info(self) -> dict[str, Any]:
-        """Get filesystem cache info"""
+        """Get filesystem cache info (from the index, no directory scan)"""
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
-            total_size = sum(f.stat().st_size for f in cache_files)
-
+            entries, total_size = (
+                self._db()
+                .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries")
+                .fetchone()
+            )
             return {
                 "type": "filesystem",
                 "directory": str(self.cache_dir),
-                "entries": len(cache_files),
+                "entries": entries,
                 "size_bytes": total_size,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "last_sweep": self.last_sweep,
             }
         except Exception:
             return {"type": "filesystem", "error": "Unable to get info"}
 
+    # ---- Compute Locks ----
+
+    def acquire_lock(self, key: str, timeout: float) -> str | None:
+        """
+        Try to take the compute lock of `key` (O_EXCL lock file).
+
+        Lock files older than `timeout` are considered abandoned by a
+        crashed worker and are taken over.
+
+        Returns:
+            Lock token, None if held by another worker, or "" on I/O error
+        """
+        lock_path = self._hash_to_path(self._hash(key)).with_suffix(".lock")
+        token = uuid.uuid4().hex
+
+        for _attempt in range(2):
+            try:
+                lock_path.parent.mkdir(exist_ok=True)
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    if time.time() - lock_path.stat().st_mtime < timeout:
+                        return None
+                    lock_path.unlink(missing_ok=True)
+                except FileNotFoundError:
+                    pass
+                continue
+            except OSError as e:
+                self.logger.debug(f"Filesystem lock error: {str(e)}")
+                return ""
+
+            with os.fdopen(fd, "w") as f:
+                f.write(token)
+            return token
+
+        return None
+
+    def release_lock(self, key: str, token: str) -> None:
+        """Release the compute lock of `key` if we still own it"""
+        lock_path = self._hash_to_path(self._hash(key)).with_suffix(".lock")
+        try:
+            if lock_path.read_text() == token:
+                lock_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    # ---- Sweeper ----
+
+    def sweep(self, force: bool = False) -> dict[str, Any] | None:
+        """
+        Remove expired entries, then evict LRU entries above the caps.
+
+        Only one worker sweeps per interval: the first to move the lease in
+        the index wins, the others return immediately.
+
+        Args:
+            force: Sweep even if another worker swept within the interval
+
+        Returns:
+            Sweep stats, or None if another worker holds the lease
+        """
+        now = time.time()
+        if not force and not self._take_sweep_lease(now):
+            return None
+
+        self._flush_touched()
+        stats = {"expired": 0, "evicted": 0, "legacy": 0, "at": now}
+
+        try:
+            db = self._db()
+
+            while True:
+                rows = db.execute(
+                    "SELECT hash FROM entries WHERE expires_at < ? LIMIT ?",
+                    (now, self.SWEEP_BATCH),
+                ).fetchall()
+                if not rows:
+                    break
+                self._remove_batch([row[0] for row in rows])
+                stats["expired"] += len(rows)
+
+            entries, total_size = db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+
+            if entries > self.max_entries or total_size > self.max_bytes:
+                target_entries = int(self.max_entries * self.EVICT_TARGET)
+                target_bytes = int(self.max_bytes * self.EVICT_TARGET)
+
+                while entries > target_entries or total_size > target_bytes:
+                    rows = db.execute(
+                        "SELECT hash, size FROM entries ORDER BY accessed_at LIMIT ?",
+                        (self.SWEEP_BATCH,),
+                    ).fetchall()
+                    if not rows:
+                        break
+
+                    victims = []
+                    for key_hash, size in rows:
+                        if entries <= target_entries and total_size <= target_bytes:
+                            break
+                        victims.append(key_hash)
+                        entries -= 1
+                        total_size -= size
+
+                    self._remove_batch(victims)
+                    stats["evicted"] += len(victims)
+
+            # Flat files written by releases before sharding (not indexed)
+            for file_path in self.cache_dir.glob("*.json"):
+                file_path.unlink(missing_ok=True)
+                stats["legacy"] += 1
+        except Exception as e:
+            self.logger.error(f"Filesystem sweep error: {str(e)}")
+
+        self.last_sweep = stats
+        return stats
+
+    def _ensure_sweeper(self) -> None:
+        """Start the sweeper thread in the current process (fork-safe)"""
+        if self._sweeper_pid == os.getpid() or self.sweep_interval <= 0:
+            return
+
+        self._sweeper_pid = os.getpid()
+        threading.Thread(
+            target=self._sweep_loop, name="cache-fs-sweeper", daemon=True
+        ).start()
+
+    def _sweep_loop(self) -> None:
+        """Sweeper loop (runs in a daemon thread)"""
+        pid = os.getpid()
+        while self._sweeper_pid == pid:
+            time.sleep(self.sweep_interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                self.logger.error(f"Filesystem sweeper error: {str(e)}")
+
+    def _take_sweep_lease(self, now: float) -> bool:
+        """Atomically claim this sweep interval across workers"""
+        try:
+            cursor = self._db().execute(
+                "UPDATE meta SET value = ? WHERE key = 'swept_at' AND value <= ?",
+                (now, now - self.sweep_interval),
+            )
+            return cursor.rowcount == 1
+        except Exception as e:
+            self.logger.debug(f"Filesystem sweep lease error: {str(e)}")
+            return False
+
+    # ---- Helpers ----
+
+    def _read(self, file_path: Path) -> dict[str, Any]:
+        """Read and decode one cache file (legacy JSON files included)"""
+        with open(file_path, "rb") as f:
+            return self.codec.loads(f.read())
+
+    def _write_atomic(self, file_path: Path, payload: bytes) -> None:
+        """Write to a temp file in the same shard, then rename into place"""
+        file_path.parent.mkdir(exist_ok=True)
+        tmp_path = file_path.with_name(
+            f".{file_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _remove(self, key_hash: str) -> None:
+        """Remove one entry (file + index row)"""
+        self._remove_batch([key_hash])
+
+    def _remove_batch(self, hashes: list[str]) -> None:
+        """Remove entries (files + index rows)"""
+        for key_hash in hashes:
+            try:
+                self._hash_to_path(key_hash).unlink(missing_ok=True)
+            except OSError as e:
+                self.logger.debug(f"Filesystem unlink error: {str(e)}")
+        self._index_execute(
+            "DELETE FROM entries WHERE hash = ?", [(key_hash,) for key_hash in hashes]
+        )
+
+    def _touch(self, key_hash: str, now: float) -> None:
+        """Record an access for LRU (buffered)"""
+        with self._touched_lock:
+            self._touched[key_hash] = now
+            pending = len(self._touched)
+
+        if pending >= self.TOUCH_FLUSH_THRESHOLD:
+            self._flush_touched()
+
+    def _flush_touched(self) -> None:
+        """Write buffered access times to the index"""
+        with self._touched_lock:
+            touched, self._touched = self._touched, {}
+
+        if touched:
+            self._index_execute(
+                "UPDATE entries SET accessed_at = ? WHERE hash = ?",
+                [(accessed_at, key_hash) for key_hash, accessed_at in touched.items()],
+            )
+
+    def _db(self) -> Any:
+        """Per-thread (and per-process) connection to the index"""
+        conn = getattr(self._conns, "conn", None)
+        if conn is not None and self._conns.pid == os.getpid():
+            return conn
+
+        import sqlite3
+
+        conn = sqlite3.connect(self._index_path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "hash TEXT PRIMARY KEY, expires_at REAL NOT NULL, "
+            "size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_entries_expires_at ON entries (expires_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_entries_accessed_at ON entries (accessed_at)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL)"
+        )
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('swept_at', 0)")
+
+        self._conns.conn = conn
+        self._conns.pid = os.getpid()
+        return conn
+
+    def _index_execute(self, sql: str, rows: list[tuple] | None = None) -> None:
+        """Run an index write in one transaction (errors never fail the cache)"""
+        try:
+            db = self._db()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                if rows is None:
+                    db.execute(sql)
+                else:
+                    db.executemany(sql, rows)
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        except Exception as e:
+            self.logger.debug(f"Filesystem index error: {str(e)}")
+
+    @staticmethod
+    def _hash(key: str) -> str:
+        """Hash a cache key into a file name"""
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _hash_to_path(self, key_hash: str) -> Path:
+        """Sharded path of a hashed key"""
+        return self.cache_dir / key_hash[: self.SHARD_CHARS] / f"{key_hash}.json"
+
     def _key_to_path(self, key: str) -> Path:
         """Convert cache key to filesystem path"""
-        key_hash = hashlib.sha256(key.encode()).hexdigest()
-        return self.cache_dir / f"{key_hash}.json"
+        return self._hash_to_path(self._hash(key))
+
+
+# ---- Memory-Mapped Backend ----
+
+
+class MmapCache:
+    """
+    Shared-memory cache backend: a fixed-size hash table in one mmap'ed file.
+
+    Built for shared hosting (cPanel/Passenger) where several worker
+    processes run without Redis: every worker maps the same file, so a
+    lookup is a hash, a byte-range lock and a memcpy, with no syscall per
+    entry file and no network round trip.
+
+    Layout: a 4 KiB header followed by `slots` fixed-size slots grouped in
+    sets of WAYS. A key hashes to one set; within it a slot is reused when
+    it holds the same key, is empty or has expired, otherwise the least
+    recently used slot of the set is evicted. Values larger than a slot are
+    not cached.
+
+    Concurrency: POSIX byte-range locks (fcntl.lockf) on the set serialize
+    processes; a striped thread lock serializes threads of one process
+    (record locks are per process). Requires fcntl, i.e. not Windows.
+
+    Every process mapping the file holds a shared lock on the attach byte of
+    the header, so a file with another geometry is only replaced when no one
+    else uses it (see _open_file).
+    """
+
+    MAGIC = b"XFMC"
+    VERSION = 1
+    HEADER = struct.Struct("<4sIII")
+    HEADER_SIZE = 4096
+    # Header bytes used as locks: file (re)initialization, attached processes
+    INIT_LOCK = 0
+    ATTACH_LOCK = 1
+    # key digest, expires_at, accessed_at, payload length
+    SLOT = struct.Struct("<16sddI4x")
+    WAYS = 8
+    LOCK_STRIPES = 64
+    EMPTY = bytes(16)
+
+    def __init__(self, codec: Any = None):
+        """Open (or create) the shared cache file and map it"""
+        import fcntl
+        import mmap
+
+        self._fcntl = fcntl
+        self.path = Path(os.getenv("CACHE_MMAP_PATH", "./instance/cache.mmap"))
+        self.cache_dir = self.path.parent
+        self.slot_size = int(os.getenv("CACHE_MMAP_SLOT_SIZE", 4096))
+        slots = int(os.getenv("CACHE_MMAP_SLOTS", 16384))
+        self.groups = max(slots // self.WAYS, 1)
+        self.slots = self.groups * self.WAYS
+        self.codec = codec or get_codec()
+        self.metrics: CacheMetrics | None = None
+        self.logger = logging.getLogger(__name__)
+        self.evictions = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._size = self.HEADER_SIZE + self.slots * self.slot_size
+        self._fd = self._open_file()
+        self._mm = mmap.mmap(self._fd, self._size)
+        self._stripes = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
+
+    # ---- Entries ----
+
+    def get(self, key: str) -> Any | None:
+        """Get value from the shared table"""
+        digest = self._digest(key)
+        group = self._group(digest)
+        now = time.time()
+        payload = None
+
+        with self._locked(group, exclusive=False):
+            offset = self._find(group, digest)
+            if offset is not None:
+                _digest, expires_at, _accessed_at, length = self.SLOT.unpack_from(
+                    self._mm, offset
+                )
+                if expires_at >= now:
+                    start = offset + self.SLOT.size
+                    payload = self._mm[start : start + length]
+                    # Approximate LRU: concurrent readers may race on this
+                    # 8-byte stamp, which is harmless
+                    struct.pack_into("<d", self._mm, offset + 24, now)
+
+        if payload is None:
+            return None
+
+        try:
+            return self.codec.loads(payload)
+        except Exception as e:
+            _serialization_failed(self, key, payload, e)
+            return None
+
+    def set(self, key: str, value: Any, ttl: int = 300) -> None:
+        """Set value in the shared table with TTL"""
+        try:
+            payload = self.codec.dumps(value)
+        except (TypeError, ValueError) as e:
+            _serialization_failed(self, key, value, e)
+            self.delete(key)
+            return
+
+        if len(payload) > self.slot_size - self.SLOT.size:
+            # Not cached, and the key's previous (now stale) slot is freed
+            self.logger.debug(
+                f"Skipping cache for oversized value (key={key}, size={len(payload)})"
+            )
+            self.delete(key)
+            return
+
+        digest = self._digest(key)
+        group = self._group(digest)
+        with self._locked(group, exclusive=True):
+            self._write(group, digest, payload, time.time() + ttl)
+
+    def delete(self, key: str) -> None:
+        """Delete key from the shared table"""
+        digest = self._digest(key)
+        group = self._group(digest)
+        with self._locked(group, exclusive=True):
+            offset = self._find(group, digest)
+            if offset is not None:
+                self._mm[offset : offset + 16] = self.EMPTY
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values from the shared table"""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(self, mapping: dict[str, Any], ttl: int = 300) -> None:
+        """Set several values in the shared table"""
+        for key, value in mapping.items():
+            self.set(key, value, ttl)
+
+    def delete_many(self, keys: list[str]) -> None:
+        """Delete several keys from the shared table"""
+        for key in keys:
+            self.delete(key)
+
+    def flush(self) -> None:
+        """Clear every slot (set by set, under the same locks as writers)"""
+        try:
+            for group in range(self.groups):
+                base = self._group_offset(group)
+                with self._locked(group, exclusive=True):
+                    # Only clear used slots: writing to untouched pages would
+                    # allocate the whole sparse file
+                    for way in range(self.WAYS):
+                        offset = base + way * self.slot_size
+                        if self._mm[offset : offset + 16] != self.EMPTY:
+                            self._mm[offset : offset + 16] = self.EMPTY
+        except Exception as e:
+            self.logger.error(f"Mmap flush error: {str(e)}")
+
+    def get_info(self) -> dict[str, Any]:
+        """Get shared table info (scans slot headers, not payloads)"""
+        now = time.time()
+        entries = 0
+        size_bytes = 0
+        for index in range(self.slots):
+            digest, expires_at, _accessed_at, length = self.SLOT.unpack_from(
+                self._mm, self.HEADER_SIZE + index * self.slot_size
+            )
+            if digest != self.EMPTY and expires_at >= now:
+                entries += 1
+                size_bytes += length
+
+        return {
+            "type": "mmap",
+            "file": str(self.path),
+            "entries": entries,
+            "size_bytes": size_bytes,
+            "slots": self.slots,
+            "slot_size": self.slot_size,
+            "evictions": self.evictions,
+        }
+
+    # ---- Compute Locks ----
+
+    def acquire_lock(self, key: str, timeout: float) -> str | None:
+        """Take the compute lock of `key` (an entry in the table itself)"""
+        digest = self._digest(f"lock:{key}")
+        group = self._group(digest)
+        token = uuid.uuid4().hex
+
+        with self._locked(group, exclusive=True):
+            offset = self._find(group, digest)
+            if offset is not None:
+                expires_at = self.SLOT.unpack_from(self._mm, offset)[1]
+                if expires_at >= time.time():
+                    return None
+            self._write(group, digest, token.encode(), time.time() + timeout)
+
+        return token
+
+    def release_lock(self, key: str, token: str) -> None:
+        """Release the compute lock of `key` if we still own it"""
+        digest = self._digest(f"lock:{key}")
+        group = self._group(digest)
+
+        with self._locked(group, exclusive=True):
+            offset = self._find(group, digest)
+            if offset is None:
+                return
+            length = self.SLOT.unpack_from(self._mm, offset)[3]
+            start = offset + self.SLOT.size
+            if self._mm[start : start + length] == token.encode():
+                self._mm[offset : offset + 16] = self.EMPTY
+
+    # ---- Helpers ----
+
+    def _open_file(self) -> int:
+        """
+        Open the shared file and attach to it, (re)building it if needed.
+
+        A file with another geometry is never truncated in place (processes
+        still mapping it would fault): a new file is built under a temp name
+        and renamed over it, and only when no other process is attached.
+
+        Returns:
+            File descriptor (attach lock held)
+
+        Raises:
+            RuntimeError: If processes using another geometry hold the file
+        """
+        fcntl = self._fcntl
+        expected = self.HEADER.pack(
+            self.MAGIC, self.VERSION, self.slots, self.slot_size
+        )
+
+        while True:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.lockf(fd, fcntl.LOCK_EX, 1, self.INIT_LOCK)
+                try:
+                    current = os.stat(self.path).st_ino == os.fstat(fd).st_ino
+                except FileNotFoundError:
+                    current = False
+                if not current:
+                    # Replaced by another process while we waited
+                    os.close(fd)
+                    continue
+
+                if (
+                    os.pread(fd, self.HEADER.size, 0) == expected
+                    and os.fstat(fd).st_size == self._size
+                ):
+                    fcntl.lockf(fd, fcntl.LOCK_SH, 1, self.ATTACH_LOCK)
+                    fcntl.lockf(fd, fcntl.LOCK_UN, 1, self.INIT_LOCK)
+                    return fd
+
+                new_fd = self._replace_file(fd, expected)
+            except BaseException:
+                os.close(fd)
+                raise
+
+            # Closing drops our locks on the old file
+            os.close(fd)
+            return new_fd
+
+    def _replace_file(self, fd: int, header: bytes) -> int:
+        """Build a file with our geometry and rename it over `fd`'s file"""
+        fcntl = self._fcntl
+        try:
+            fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, self.ATTACH_LOCK)
+        except OSError:
+            raise RuntimeError(
+                f"Cache file {self.path} is in use by processes with another "
+                "layout: stop them, or use the same CACHE_MMAP_SLOTS and "
+                "CACHE_MMAP_SLOT_SIZE (or another CACHE_MMAP_PATH)"
+            ) from None
+
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        new_fd = os.open(tmp_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            # Sparse file: pages are only allocated when slots are used
+            os.ftruncate(new_fd, self._size)
+            os.pwrite(new_fd, header, 0)
+            fcntl.lockf(new_fd, fcntl.LOCK_SH, 1, self.ATTACH_LOCK)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.close(new_fd)
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return new_fd
+
+    @contextmanager
+    def _locked(self, group: int, exclusive: bool) -> Iterator[None]:
+        """Lock one set against other threads and other processes"""
+        fcntl = self._fcntl
+        length = self.WAYS * self.slot_size
+        start = self._group_offset(group)
+
+        with self._stripes[group % self.LOCK_STRIPES]:
+            fcntl.lockf(
+                self._fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH, length, start
+            )
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, length, start)
+
+    def _find(self, group: int, digest: bytes) -> int | None:
+        """Offset of the slot holding `digest` in its set (lock held)"""
+        base = self._group_offset(group)
+        for way in range(self.WAYS):
+            offset = base + way * self.slot_size
+            if self._mm[offset : offset + 16] == digest:
+                return offset
+        return None
+
+    def _write(
+        self, group: int, digest: bytes, payload: bytes, expires_at: float
+    ) -> None:
+        """Store payload in the best slot of the set (exclusive lock held)"""
+        now = time.time()
+        base = self._group_offset(group)
+        target = None
+        victim, victim_accessed = base, float("inf")
+
+        for way in range(self.WAYS):
+            offset = base + way * self.slot_size
+            slot_digest, slot_expires, slot_accessed, _length = self.SLOT.unpack_from(
+                self._mm, offset
+            )
+            if slot_digest == digest:
+                target = offset
+                break
+            if target is None and (slot_digest == self.EMPTY or slot_expires < now):
+                target = offset
+            if slot_accessed < victim_accessed:
+                victim, victim_accessed = offset, slot_accessed
+
+        if target is None:
+            target = victim
+            self.evictions += 1
+
+        start = target + self.SLOT.size
+        self._mm[start : start + len(payload)] = payload
+        self.SLOT.pack_into(self._mm, target, digest, expires_at, now, len(payload))
+
+    def _group_offset(self, group: int) -> int:
+        """Byte offset of a set"""
+        return self.HEADER_SIZE + group * self.WAYS * self.slot_size
+
+    def _group(self, digest: bytes) -> int:
+        """Set index of a key digest"""
+        return int.from_bytes(digest[:8], "little") % self.groups
+
+    @staticmethod
+    def _digest(key: str) -> bytes:
+        """128-bit key digest (never all zeros in practice)"""
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
 
 
 # ---- Memory Backend ----
 
 
 class MemoryCache:
-    """In-memory cache backend (volatile, for dev/testing)"""
+    """
+    In-memory cache backend (volatile, for dev/testing and last-resort fallback).
 
-    def __init__(self):
+    Bounded by entry count and encoded size; when full, entries are evicted
+    by LRU (default) or LFU (CACHE_MEMORY_POLICY). Expired entries are
+    removed by a background reaper driven by an expiry heap, so keys that are
+    never read again do not accumulate. Thread-safe.
+    """
+
+    POLICIES = ("lru", "lfu")
+
+    def __init__(self, codec: Any = None):
         """Initialize memory cache"""
-        self.cache: dict[str, dict[str, Any]] = {}
+        self.codec = codec or get_codec()
+        self.max_entries = int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", 10_000))
+        self.max_bytes = int(os.getenv("CACHE_MEMORY_MAX_BYTES", 64 * 1024 * 1024))
+        policy = os.getenv("CACHE_MEMORY_POLICY", "lru").lower()
+        self.policy = policy if policy in self.POLICIES else "lru"
+        self.reap_interval = int(os.getenv("CACHE_MEMORY_REAP_INTERVAL", 30))
+        self.metrics: CacheMetrics | None = None
         self.logger = logging.getLogger(__name__)
 
+        # key -> (encoded value, expires_at, size); order = recency (LRU)
+        self._entries: OrderedDict[str, tuple[bytes, float, int]] = OrderedDict()
+        # LFU bookkeeping: key -> hit count, count -> keys (oldest first)
+        self._freq: dict[str, int] = {}
+        self._buckets: dict[int, OrderedDict[str, None]] = {}
+        self._min_freq = 0
+        # (expires_at, key); stale items are skipped when popped
+        self._heap: list[tuple[float, str]] = []
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._reaper_pid: int | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        self.expirations = 0
+
     def get(self, key: str) -> Any | None:
         """Get value from memory cache"""
-        if key not in self.cache:
-            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
 
-        data = self.cache[key]
+            payload, expires_at, _size = entry
+            if expires_at < time.time():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
 
-        # Check expiry
-        if data["expires_at"] < time.time():
-            del self.cache[key]
-            return None
+            self._touch(key)
+            self.hits += 1
 
-        return data["value"]
+        # Decoded per read: callers never share (or mutate) the stored value,
+        # and behave exactly as with the Redis/Filesystem backends
+        return self.codec.loads(payload)
 
     def set(self, key: str, value: Any, ttl: int = 300) -> None:
         """Set value in memory cache with TTL"""
-        self.cache[key] = {"value": value, "expires_at": time.time() + ttl}
+        try:
+            encoded = self.codec.dumps(value)
+        except (TypeError, ValueError) as e:
+            _serialization_failed(self, key, value, e)
+            self.delete(key)
+            return
+
+        size = len(encoded) + len(key)
+        expires_at = time.time() + ttl
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            # Never worth evicting the whole cache for one value
+            if size > self.max_bytes:
+                return
+
+            # Evict before inserting, so LFU never picks the new entry itself
+            while self._entries and (
+                len(self._entries) >= self.max_entries
+                or self._bytes + size > self.max_bytes
+            ):
+                self._remove(self._victim())
+                self.evictions += 1
+
+            self._entries[key] = (encoded, expires_at, size)
+            self._bytes += size
+            self._touch(key, new=True)
+            heapq.heappush(self._heap, (expires_at, key))
+            self.sets += 1
+
+            if len(self._heap) > 2 * len(self._entries) + 1024:
+                self._rebuild_heap()
+
+        self._ensure_reaper()
 
     def delete(self, key: str) -> None:
         """Delete key from memory cache"""
-        if key in self.cache:
-            del self.cache[key]
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values from memory cache"""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(self, mapping: dict[str, Any], ttl: int = 300) -> None:
+        """Set several values in memory cache"""
+        for key, value in mapping.items():
+            self.set(key, value, ttl)
+
+    def delete_many(self, keys: list[str]) -> None:
+        """Delete several keys from memory cache"""
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._remove(key)
+
+    def acquire_lock(self, key: str, timeout: float) -> str | None:
+        """Single process: CacheService's per-key thread lock is enough"""
+        return "memory"
+
+    def release_lock(self, key: str, token: str) -> None:
+        """Nothing to release (see acquire_lock)"""
 
     def flush(self) -> None:
         """Clear all cache"""
-        self.cache.clear()
+        with self._lock:
+            self._entries.clear()
+            self._freq.clear()
+            self._buckets.clear()
+            self._min_freq = 0
+            self._heap.clear()
+            self._bytes = 0
+
+    def reap(self) -> int:
+        """
+        Remove every expired entry.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        now = time.time()
+
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                expires_at, key = heapq.heappop(self._heap)
+                entry = self._entries.get(key)
+                # Skip heap items left behind by overwrites and deletes
+                if entry is not None and entry[1] == expires_at:
+                    self._remove(key)
+                    removed += 1
+
+            self.expirations += removed
+
+        return removed
 
     def get_info(self) -> dict[str, Any]:
         """Get memory cache info"""
-        return {
-            "type": "memory",
-            "entries": len(self.cache),
-            "warning": "Memory cache is volatile (not persistent)",
-        }
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "type": "memory",
+                "entries": len(self._entries),
+                "size_bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "policy": self.policy,
+                "hits": self.hits,
+                "misses": self.misses,
+                "sets": self.sets,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "warning": "Memory cache is volatile (not persistent)",
+            }
+
+    # ---- Helpers (lock must be held) ----
+
+    def _touch(self, key: str, new: bool = False) -> None:
+        """Record an access for the eviction policy"""
+        if self.policy == "lru":
+            self._entries.move_to_end(key)
+            return
+
+        freq = self._freq.get(key, 0)
+        if freq:
+            bucket = self._buckets[freq]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[freq]
+                if self._min_freq == freq:
+                    self._min_freq = freq + 1
+
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+        if new:
+            self._min_freq = 1
+
+    def _victim(self) -> str:
+        """Key to evict: least recently (LRU) or least frequently (LFU) used"""
+        if self.policy == "lru":
+            return next(iter(self._entries))
+
+        if self._min_freq not in self._buckets:
+            self._min_freq = min(self._buckets)
+        return next(iter(self._buckets[self._min_freq]))
+
+    def _remove(self, key: str) -> None:
+        """Remove entry and update size / policy accounting"""
+        _payload, _expires_at, size = self._entries.pop(key)
+        self._bytes -= size
+
+        if self.policy == "lfu":
+            freq = self._freq.pop(key)
+            bucket = self._buckets[freq]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[freq]
+
+    def _rebuild_heap(self) -> None:
+        """Drop stale heap items (overwritten or deleted keys)"""
+        self._heap = [(entry[1], key) for key, entry in self._entries.items()]
+        heapq.heapify(self._heap)
+
+    # ---- Reaper ----
+
+    def _ensure_reaper(self) -> None:
+        """Start the reaper thread in the current process (fork-safe)"""
+        if self._reaper_pid == os.getpid() or self.reap_interval <= 0:
+            return
+
+        self._reaper_pid = os.getpid()
+        threading.Thread(
+            target=self._reap_loop, name="cache-memory-reaper", daemon=True
+        ).start()
+
+    def _reap_loop(self) -> None:
+        """Reaper loop (runs in a daemon thread)"""
+        pid = os.getpid()
+        while self._reaper_pid == pid:
+            time.sleep(self.reap_interval)
+            try:
+                self.reap()
+            except Exception as e:
+                self.logger.error(f"Memory cache reaper error: {str(e)}")
+
+
+# ---- Local (L1) Tier ----
+
+_SIZE_CODEC = JsonCodec()
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate size of a cached value in bytes"""
+    try:
+        return len(_SIZE_CODEC.dumps(value))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+class LocalCache:
+    """
+    Bounded, TTL-aware in-process LRU (L1 tier).
+
+    Sits in front of Redis/Filesystem to avoid a network or disk round trip
+    on hot keys. Bounded by entry count and estimated size; each entry also
+    expires after at most `ttl` seconds. Values are shared between threads
+    of the worker and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 8 * 1024 * 1024,
+        ttl: int = 30,
+    ):
+        """Initialize empty LRU"""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        """Get value from L1 (None on miss or expiry)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at, _size = entry
+            if expires_at < time.time():
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Store value in L1, evicting least recently used entries if full"""
+        size = _estimate_size(value)
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            # Oversized values are never worth evicting the whole tier for
+            if size > self.max_bytes or ttl <= 0:
+                return
+
+            self._entries[key] = (value, time.time() + ttl, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Delete key from L1"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every L1 entry"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_info(self) -> dict[str, Any]:
+        """Get L1 statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "type": "local",
+                "entries": len(self._entries),
+                "size_bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _remove(self, key: str) -> None:
+        """Remove entry and update size accounting (lock must be held)"""
+        _value, _expires_at, size = self._entries.pop(key)
+        self._bytes -= size
+
+
+class RedisInvalidator:
+    """
+    Cross-worker L1 invalidation over Redis pub/sub.
+
+    Each worker process runs one daemon listener thread. While the listener
+    is not subscribed, `healthy` is False and the L1 tier is bypassed so a
+    missed message can never leave a stale entry behind.
+    """
+
+    CHANNEL = "xf:cache:invalidate"
+    RETRY_DELAY = 5
+
+    def __init__(self, redis_client: Any, local: LocalCache):
+        """Bind invalidator to a Redis client and the local tier"""
+        self.redis = redis_client
+        self.local = local
+        self.origin = uuid.uuid4().hex
+        self.healthy = False
+        self._pid: int | None = None
+        self.logger = logging.getLogger(__name__)
+
+    def publish(self, keys: list[str] | None) -> None:
+        """Broadcast invalidation of `keys` (None = flush) to other workers"""
+        try:
+            message = json.dumps({"origin": self.origin, "keys": keys})
+            self.redis.publish(self.CHANNEL, message)
+        except Exception as e:
+            self.logger.error(f"Redis invalidation publish error: {str(e)}")
+
+    def sync(self) -> None:
+        """Ensure the listener runs in the current process (fork-safe)"""
+        if self._pid == os.getpid():
+            return
+
+        # First call, or we are a freshly forked worker: the parent's
+        # thread did not survive the fork, start our own.
+        self._pid = os.getpid()
+        self.origin = uuid.uuid4().hex
+        self.healthy = False
+        self.local.clear()
+        threading.Thread(
+            target=self._listen, name="cache-l1-invalidator", daemon=True
+        ).start()
+
+    def _listen(self) -> None:
+        """Listener loop with reconnect (runs in a daemon thread)"""
+        pid = os.getpid()
+        while self._pid == pid:
+            try:
+                pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.CHANNEL)
+                self.healthy = True
+                # Polling read: the pool's socket timeout would otherwise
+                # abort a blocking listen() whenever the channel is idle
+                while self._pid == pid:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message:
+                        self._handle(message.get("data"))
+            except Exception as e:
+                self.logger.debug(f"Redis invalidation listener error: {str(e)}")
+
+            # Messages may have been missed while disconnected
+            self.healthy = False
+            self.local.clear()
+            time.sleep(self.RETRY_DELAY)
+
+    def _handle(self, data: Any) -> None:
+        """Apply one invalidation message to the local tier"""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+
+        if message.get("origin") == self.origin:
+            return
+
+        if message.get("keys") is None:
+            self.local.clear()
+        else:
+            for key in message["keys"]:
+                self.local.delete(key)
+
+
+class GenerationInvalidator:
+    """
+    Cross-worker L1 invalidation for the Filesystem and Mmap backends.
+
+    Every overwrite, delete or flush appends one byte to a generation file in
+    the cache directory (fills of missing keys do not). Workers compare its
+    size and mtime (one stat call) before using L1 and drop their whole L1
+    when it changed. The offset of its own append tells a writer whether
+    anyone else bumped since it last looked, so it keeps its L1 across its
+    own bumps. The file is truncated once it reaches MAX_SIZE.
+    """
+
+    healthy = True
+    MAX_SIZE = 64 * 1024
+
+    def __init__(self, cache_dir: Path, local: LocalCache):
+        """Bind invalidator to the cache directory and the local tier"""
+        self.path = Path(cache_dir) / ".generation"
+        self.local = local
+        self._seen = self._read()
+        self.logger = logging.getLogger(__name__)
+
+    def publish(self, keys: list[str] | None) -> None:
+        """Bump the generation (atomic append)"""
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, b".")
+                end = os.lseek(fd, 0, os.SEEK_CUR)
+                rotated = end >= self.MAX_SIZE
+                if rotated:
+                    os.ftruncate(fd, 0)
+                    end = 0
+                mtime = os.fstat(fd).st_mtime_ns
+            finally:
+                os.close(fd)
+        except OSError as e:
+            self.logger.error(f"Generation bump error: {str(e)}")
+            return
+
+        # Bumps by others landed between our last sync and our append (or
+        # may have been truncated away): they are not reflected in our L1 yet
+        if rotated or self._seen is None or end != self._seen[0] + 1:
+            self.local.clear()
+        self._seen = (end, mtime)
+
+    def sync(self) -> None:
+        """Drop L1 if any worker bumped the generation since last check"""
+        current = self._read()
+        if current != self._seen:
+            self._seen = current
+            self.local.clear()
+
+    def _read(self) -> tuple[int, int] | None:
+        """Current generation identity (size, mtime) or None"""
+        try:
+            stat = os.stat(self.path)
+            return stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
 
 
 # ---- Global Instance ----
@@ -21,10 +21,39 @@
 ------------------------------------------------------------------------------
 """
 
+import hashlib
+import os
 from typing import Any, cast
 
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload, load_only
+
 from backend.src.app import db
 from backend.src.models.content import Content
+from backend.src.models.user import User
+from backend.src.services.search_service import SearchService
+from backend.src.services.stats_service import StatsService
+from backend.src.utils.pagination import clamp_per_page, keyset_page
+
+# Cached listing counts are recomputed at most this often (seconds); writes
+# drop the counts they affect, which are recomputed on the next read
+COUNT_TTL = int(os.getenv("CONTENT_COUNT_TTL", 600))
+
+# Columns loaded by list views: body stays deferred (to_dict() uses the stored
+# excerpt) and is only fetched when a detail view accesses it
+LIST_COLUMNS = (
+    load_only(
+        Content.id,
+        Content.title,
+        Content.excerpt,
+        Content.type,
+        Content.status,
+        Content.author_id,
+        Content.created_at,
+        Content.updated_at,
+    ),
+    joinedload(Content.author).load_only(User.id, User.username),
+)
 
 
 class ContentService:
@@ -63,7 +92,13 @@ def create(
             )
 
             db.session.add(content)
+            db.session.flush()
+            SearchService.index(content)
             db.session.commit()
+            ContentService.invalidate_cache()
+            ContentService._invalidate_counts(
+                content.type, content.status, content.author_id
+            )
             return content
         except Exception:
             db.session.rollback()
@@ -78,20 +113,14 @@ def get_by_id(content_id: int) -> Content | None:
         """
         from backend.src.services.cache_service import cache_service
 
-        # Try cache first
-        cache_key = f"content:id:{content_id}"
-        cached = cache_service.get(cache_key)
-        if cached:
-            return cached
-
-        # Query database
-        content = cast(Content | None, Content.query.get(content_id))
-
-        # Cache result if found
-        if content:
-            cache_service.set(cache_key, content, ttl=120)
-
-        return content
+        return cast(
+            Content | None,
+            cache_service.get_or_compute(
+                f"content:id:{content_id}",
+                lambda: Content.query.get(content_id),
+                ttl=120,
+            ),
+        )
 
     @staticmethod
     def get_all(
@@ -103,6 +132,10 @@ def get_all(
         """
         Get all content with filters and pagination with caching.
 
+        Page-number API kept for existing callers: a page costs an OFFSET
+        scan of every row before it. Listings that page deep use list_page()
+        (keyset cursors) instead.
+
         Cache TTL: 120 seconds (2 minutes)
 
         Args:
@@ -120,56 +153,192 @@ def get_all(
         cache_key = (
             f"content:all:{content_type or 'all'}:{status or 'all'}:{page}:{per_page}"
         )
-        cached = cache_service.get(cache_key)
-        if cached:
-            return cached
+        loaded: list[Content] | None = None
 
-        query = Content.query
+        def compute_page() -> dict[str, Any]:
+            nonlocal loaded
 
-        if content_type:
-            query = query.filter_by(type=content_type)
+            query = Content.query
+
+            if content_type:
+                query = query.filter_by(type=content_type)
+
+            if status:
+                query = query.filter_by(status=status)
+
+            # List projection: author eager loaded (no N+1), body deferred
+            query = query.options(*LIST_COLUMNS)
+
+            # Order by created_at desc
+            query = query.order_by(Content.created_at.desc(), Content.id.desc())
+
+            # Cached, incrementally maintained count
+            total = ContentService.count(content_type=content_type, status=status)
+
+            # Paginate
+            offset = (page - 1) * per_page
+            loaded = query.limit(per_page).offset(offset).all()
+
+            # Cache the page as ids + total; rows are re-hydrated with a
+            # single IN query on the next hit
+            return {"ids": [item.id for item in loaded], "total": total}
+
+        listing = cache_service.get_or_compute(
+            cache_key, compute_page, ttl=120, tags=["content"]
+        )
+
+        # Rows computed by this call are reused; cache hits are re-hydrated
+        items = loaded
+        if items is None:
+            items = ContentService._hydrate(listing["ids"])
+        return cast(list[Content], items), listing["total"]
 
+    @staticmethod
+    def list_page(
+        content_type: str | None = None,
+        status: str | None = None,
+        author_id: int | None = None,
+        per_page: int = 20,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get one page of content, newest first (keyset pagination).
+
+        Unlike page numbers, the cost of a page does not grow with its depth:
+        each page is one range scan on (created_at, id) from the cursor.
+
+        Args:
+            content_type: Filter by type (post, page, article)
+            status: Filter by status (draft, published, archived)
+            author_id: Filter by author
+            per_page: Page size (clamped to 1..100)
+            after: Cursor for the next page (from next_cursor)
+            before: Cursor for the previous page (from prev_cursor)
+
+        Returns:
+            Dict with items, next_cursor, prev_cursor and total (cached count)
+        """
+        query = Content.query.options(*LIST_COLUMNS)
+        if content_type:
+            query = query.filter(Content.type == content_type)
         if status:
-            query = query.filter_by(status=status)
+            query = query.filter(Content.status == status)
+        if author_id is not None:
+            query = query.filter(Content.author_id == author_id)
+
+        page = keyset_page(
+            query,
+            Content.created_at,
+            Content.id,
+            clamp_per_page(per_page),
+            after=after,
+            before=before,
+        )
+        page["total"] = ContentService.count(content_type, status, author_id)
+        return page
 
-        # Eager load author relationship to avoid N+1 queries
-        from sqlalchemy.orm import joinedload
+    # ---- Counts ----
 
-        query = query.options(joinedload(Content.author))
+    @staticmethod
+    def _count_key(
+        content_type: str | None, status: str | None, author_id: int | None
+    ) -> str:
+        """Cache key of one listing count"""
+        author = "all" if author_id is None else author_id
+        return f"content:count:{content_type or 'all'}:{status or 'all'}:{author}"
 
-        # Order by created_at desc
-        query = query.order_by(Content.created_at.desc())
+    @staticmethod
+    def count(
+        content_type: str | None = None,
+        status: str | None = None,
+        author_id: int | None = None,
+    ) -> int:
+        """
+        Number of content rows matching the filters (cached).
 
-        # Get total count
-        total = query.count()
+        The COUNT query runs once per filter combination, then again after a
+        write touching that combination (or CONTENT_COUNT_TTL seconds).
+        """
+        from backend.src.services.cache_service import cache_service
 
-        # Paginate
-        offset = (page - 1) * per_page
-        items = query.limit(per_page).offset(offset).all()
+        def compute() -> int:
+            query = Content.query
+            if content_type:
+                query = query.filter(Content.type == content_type)
+            if status:
+                query = query.filter(Content.status == status)
+            if author_id is not None:
+                query = query.filter(Content.author_id == author_id)
+            # COUNT(id) directly: Query.count() wraps a SELECT of every column
+            return int(query.with_entities(func.count(Content.id)).scalar() or 0)
+
+        key = ContentService._count_key(content_type, status, author_id)
+        return int(cache_service.get_or_compute(key, compute, ttl=COUNT_TTL))
 
-        result = (cast(list[Content], items), total)
+    @staticmethod
+    def _invalidate_counts(
+        content_type: str, status: str, author_id: int | None
+    ) -> None:
+        """
+        Drop every cached count a row with these values belongs to.
 
-        # Cache result
-        cache_service.set(cache_key, result, ttl=120)
+        Deleting (rather than adjusting the cached numbers) cannot lose
+        concurrent updates from other workers; the next read recounts. The
+        stats overview (content total) is dropped in the same round trip.
+        """
+        from backend.src.services.cache_service import cache_service
 
-        return result
+        cache_service.delete_many(
+            [
+                ContentService._count_key(type_key, status_key, author_key)
+                for type_key in (content_type, None)
+                for status_key in (status, None)
+                for author_key in {author_id, None}
+            ]
+            + [StatsService.CACHE_KEY]
+        )
+
+    @staticmethod
+    def _hydrate(ids: list[int]) -> list[Content]:
+        """
+        Load content rows for a cached page in one query.
+
+        Args:
+            ids: Content IDs in page order
+
+        Returns:
+            Content list in the same order (deleted rows are skipped)
+        """
+        if not ids:
+            return []
+
+        rows = (
+            Content.query.options(*LIST_COLUMNS)
+            .filter(Content.id.in_(ids))
+            .all()
+        )
+        by_id = {row.id: row for row in rows}
+        return [by_id[content_id] for content_id in ids if content_id in by_id]
 
     @staticmethod
     def invalidate_cache(content_id: int | None = None) -> None:
         """
         Invalidate cache for content.
 
+        Listing pages are always dropped (tag "content"), since any
+        create/update/delete can change page membership and totals.
+
         Args:
-            content_id: Specific content ID to invalidate, or None for all
+            content_id: Specific content ID to invalidate, or None for
+                listings only
         """
         from backend.src.services.cache_service import cache_service
 
         if content_id:
             cache_service.delete(f"content:id:{content_id}")
 
-        # Note: For get_all cache, we'd need to track all possible keys
-        # or use a more sophisticated cache invalidation strategy.
-        # For now, we rely on TTL expiration (120 seconds).
+        cache_service.invalidate_tags(["content"])
 
     @staticmethod
     def get_published(
@@ -187,6 +356,9 @@ def get_by_author(
         """
         Get content by author with eager loading.
 
+        Page-number API like get_all(); use list_page(author_id=...) for
+        keyset pagination.
+
         Args:
             author_id: Author user ID
             page: Page number
@@ -195,16 +367,14 @@ def get_by_author(
         Returns:
             Tuple of (content list, total count)
         """
-        from sqlalchemy.orm import joinedload
-
         query = Content.query.filter_by(author_id=author_id)
 
-        # Eager load author relationship
-        query = query.options(joinedload(Content.author))
+        # List projection: author eager loaded, body deferred
+        query = query.options(*LIST_COLUMNS)
 
-        query = query.order_by(Content.created_at.desc())
+        query = query.order_by(Content.created_at.desc(), Content.id.desc())
 
-        total = query.count()
+        total = ContentService.count(author_id=author_id)
         offset = (page - 1) * per_page
         items = query.limit(per_page).offset(offset).all()
         return cast(list[Content], items), total
@@ -226,13 +396,24 @@ def update(content_id: int, **kwargs: Any) -> Content | None:
             if not content:
                 return None
 
+            before = (content.type, content.status)
+
             # Update allowed fields
             allowed_fields = ["title", "body", "type", "status"]
             for key, value in kwargs.items():
                 if key in allowed_fields and hasattr(content, key):
                     setattr(content, key, value)
 
+            if "title" in kwargs or "body" in kwargs:
+                SearchService.index(content)
+
             db.session.commit()
+            ContentService.invalidate_cache(content_id)
+            if (content.type, content.status) != before:
+                ContentService._invalidate_counts(*before, content.author_id)
+                ContentService._invalidate_counts(
+                    content.type, content.status, content.author_id
+                )
             return cast(Content | None, content)
         except Exception:
             db.session.rollback()
@@ -254,8 +435,12 @@ def delete(content_id: int) -> bool:
             if not content:
                 return False
 
+            counted = (content.type, content.status, content.author_id)
             db.session.delete(content)
+            SearchService.remove(content_id)
             db.session.commit()
+            ContentService.invalidate_cache(content_id)
+            ContentService._invalidate_counts(*counted)
             return True
         except Exception:
             db.session.rollback()
@@ -278,7 +463,10 @@ def search(
         query: str, content_type: str | None = None, page: int = 1, per_page: int = 20
     ) -> tuple[list[Content], int]:
         """
-        Search content by title
+        Full-text search over title and body, best match first.
+
+        Results are ranked by relevance, so they page by number; the match
+        count is cached and only recomputed after content changes.
 
         Args:
             query: Search query
@@ -289,14 +477,22 @@ def search(
         Returns:
             Tuple of (content list, total count)
         """
-        search_query = Content.query.filter(Content.title.ilike(f"%{query}%"))
-
-        if content_type:
-            search_query = search_query.filter_by(type=content_type)
-
-        search_query = search_query.order_by(Content.created_at.desc())
+        from backend.src.services.cache_service import cache_service
 
-        total = search_query.count()
-        offset = (page - 1) * per_page
-        items = search_query.limit(per_page).offset(offset).all()
-        return cast(list[Content], items), total
+        # Match counts are cached per (type, query) until the next content write
+        normalized = " ".join(query.lower().split())
+        digest = hashlib.sha256(normalized.encode()).hexdigest()[:32]
+        count_key = f"content:search_count:{content_type or 'all'}:{digest}"
+        total = cache_service.get(count_key, tags=["content"])
+
+        ids, counted = SearchService.search(
+            query,
+            content_type=content_type,
+            limit=per_page,
+            offset=(page - 1) * per_page,
+            with_total=total is None,
+        )
+        if total is None:
+            total = counted
+            cache_service.set(count_key, total, ttl=COUNT_TTL, tags=["content"])
+        return ContentService._hydrate(ids), int(total)
@@ -451,6 +451,7 @@ def create_schema(db_uri: str) -> tuple[bool, str]:
         try:
             from backend.src.extensions import db  # lazy import to get metadata
             from backend.src.models.admin_history import AdminHistory  # noqa: F401
+            from backend.src.models.backup_code import BackupCode  # noqa: F401
             from backend.src.models.content import Content  # noqa: F401
             from backend.src.models.preferences import UserPreferences  # noqa: F401
 
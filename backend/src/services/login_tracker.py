@@ -0,0 +1,245 @@
+"""
+------------------------------------------------------------------------------
+Purpose: Login bookkeeping service
+Description: Failed-login counters in the cache, write-behind last_login updates
+
+File: backend/src/services/login_tracker.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T23:55:00+00:00
+Last modified (Git): TBD | Commit: TBD
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+
+Notes:
+- Failed logins are counted with cache_service.incr() (Redis INCRBY when the
+  cache uses Redis), in a LOGIN_LOCKOUT_MINUTES window: a password-guessing
+  storm costs no database write until the account actually locks
+- The LOGIN_MAX_ATTEMPTS-th failure writes users.locked_until (and
+  login_attempts) once; User.is_locked() keeps reading the row
+- Successful logins buffer (last_login, last_login_ip) in the worker; a daemon
+  thread writes the buffer every LAST_LOGIN_FLUSH_INTERVAL seconds in one
+  bulk UPDATE, which also clears login_attempts/locked_until unless the
+  account was locked after the buffered login
+- LAST_LOGIN_FLUSH_INTERVAL=0 writes in the login request (previous behavior);
+  the buffer is also flushed at exit. A worker killed hard loses at most one
+  interval of last_login values
+------------------------------------------------------------------------------
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+from flask import Flask, has_app_context
+from sqlalchemy import bindparam, case, null, or_, update
+
+from backend.src.extensions import db
+from backend.src.models.user import User
+from backend.src.services.cache_service import cache_service
+
+logger = logging.getLogger(__name__)
+
+LOGIN_MAX_ATTEMPTS = int(os.getenv("LOGIN_MAX_ATTEMPTS", 5))
+LOGIN_LOCKOUT_MINUTES = int(os.getenv("LOGIN_LOCKOUT_MINUTES", 15))
+LAST_LOGIN_FLUSH_INTERVAL = float(os.getenv("LAST_LOGIN_FLUSH_INTERVAL", 5))
+
+_users = User.__table__
+
+
+def _login_update(with_ip: bool) -> Any:
+    """
+    Executemany UPDATE writing buffered logins.
+
+    The lockout fields are only cleared when locked_until is not later than
+    the login: a lockout written between the login and the flush survives.
+    """
+    last_login = bindparam("b_last_login")
+    unlocked = or_(
+        _users.c.locked_until.is_(None), _users.c.locked_until <= last_login
+    )
+    values = {
+        "last_login": last_login,
+        "login_attempts": case((unlocked, 0), else_=_users.c.login_attempts),
+        "locked_until": case((unlocked, null()), else_=_users.c.locked_until),
+    }
+    if with_ip:
+        values["last_login_ip"] = bindparam("b_ip")
+    return update(_users).where(_users.c.id == bindparam("b_id")).values(values)
+
+
+class LoginTracker:
+    """Failed-login counters and buffered last-login writes"""
+
+    def __init__(self, interval: float = LAST_LOGIN_FLUSH_INTERVAL):
+        """Initialize tracker"""
+        self.interval = interval
+        self._app: Flask | None = None
+        self._pending: dict[int, tuple[datetime, str | None]] = {}
+        self._lock = threading.Lock()
+        self._flusher_pid: int | None = None
+        self._atexit_registered = False
+
+    def init_app(self, app: Flask) -> None:
+        """Bind the app used by the flush thread and flush at exit"""
+        self._app = app
+        if not self._atexit_registered:
+            atexit.register(self.flush)
+            self._atexit_registered = True
+
+    # ---- Failed logins ----
+
+    @staticmethod
+    def attempts_key(user_id: int) -> str:
+        """Cache key counting a user's failed logins"""
+        return f"login:attempts:{user_id}"
+
+    def attempts(self, user_id: int) -> int:
+        """Failed logins in the current window"""
+        return cache_service.counter(self.attempts_key(user_id))
+
+    def record_failure(self, user: User) -> bool:
+        """
+        Count a failed login, locking the account at LOGIN_MAX_ATTEMPTS.
+
+        Args:
+            user: Live User row
+
+        Returns:
+            True if this failure locked the account
+        """
+        key = self.attempts_key(user.id)
+        attempts = cache_service.incr(key, ttl=LOGIN_LOCKOUT_MINUTES * 60)
+        if attempts < LOGIN_MAX_ATTEMPTS:
+            return False
+
+        user.login_attempts = attempts
+        lockout = timedelta(minutes=LOGIN_LOCKOUT_MINUTES)
+        user.locked_until = datetime.utcnow() + lockout
+        db.session.commit()
+        cache_service.delete(key)
+        logger.warning(
+            f"Login: account {user.id} locked after {attempts} failed attempts"
+        )
+        return True
+
+    def reset(self, user_id: int) -> None:
+        """Forget a user's failed logins"""
+        cache_service.delete(self.attempts_key(user_id))
+
+    # ---- Successful logins ----
+
+    def record_login(self, user_id: int, ip_address: str | None = None) -> None:
+        """
+        Record a successful login (written by the next flush).
+
+        Args:
+            user_id: User ID
+            ip_address: IP address of login (optional)
+        """
+        self.reset(user_id)
+        with self._lock:
+            self._pending[user_id] = (datetime.utcnow(), ip_address)
+
+        if self.interval <= 0:
+            self.flush()
+        else:
+            self._start_flusher()
+
+    def flush(self) -> int:
+        """
+        Write buffered logins in bulk UPDATEs (one per column set).
+
+        Returns:
+            Number of users updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        if has_app_context():
+            return self._write(pending)
+        if self._app is None:
+            logger.error(
+                f"Login flush: no app bound, {len(pending)} last_login value(s) "
+                "dropped"
+            )
+            return 0
+        with self._app.app_context():
+            return self._write(pending)
+
+    def _write(self, pending: dict[int, tuple[datetime, str | None]]) -> int:
+        """
+        Bulk UPDATE by primary key; rows are kept for the next flush on error.
+
+        Runs in its own connection and transaction: a flush triggered inside
+        a request must not commit or roll back that request's session.
+        """
+        with_ip, without_ip = [], []
+        for user_id, (last_login, ip_address) in pending.items():
+            row = {"b_id": user_id, "b_last_login": last_login}
+            if ip_address:
+                with_ip.append({**row, "b_ip": ip_address})
+            else:
+                without_ip.append(row)
+
+        try:
+            with db.engine.begin() as connection:
+                for statement, rows in (
+                    (_login_update(with_ip=True), with_ip),
+                    (_login_update(with_ip=False), without_ip),
+                ):
+                    if rows:
+                        connection.execute(statement, rows)
+        except Exception as e:
+            logger.error(f"Login flush error: {str(e)}")
+            with self._lock:
+                for user_id, value in pending.items():
+                    self._pending.setdefault(user_id, value)
+            return 0
+        return len(pending)
+
+    def _start_flusher(self) -> None:
+        """Start the flush thread in the current process (fork-safe)"""
+        if self._flusher_pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+        threading.Thread(
+            target=self._flush_loop, name="login-flusher", daemon=True
+        ).start()
+
+    def _flush_loop(self) -> None:
+        """Flush loop (runs in a daemon thread)"""
+        pid = os.getpid()
+        while self._flusher_pid == pid:
+            time.sleep(self.interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Login flush error: {str(e)}")
+
+
+# Global login tracker
+login_tracker = LoginTracker()
+
+
+def init_app(app: Any) -> None:
+    """Bind the login tracker to the app"""
+    login_tracker.init_app(app)
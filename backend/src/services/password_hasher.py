@@ -0,0 +1,267 @@
+"""
+Purpose: Password hashing service
+Description: Runs password KDF work (scrypt/pbkdf2) in a bounded process pool,
+with configurable cost
+
+File: backend/src/services/password_hasher.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T21:00:00+00:00
+Last modified (Git): TBD | Commit: TBD
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+Notes:
+- Hashes use werkzeug's format ("method$salt$hash"), so existing hashes verify
+  unchanged; hashes made with another cost are upgraded on the next login
+- PASSWORD_HASH_METHOD sets the cost (calibrate with
+  `flask benchmark-password-hash`)
+- PASSWORD_HASH_WORKERS processes (default 2, 0 = hash in the calling thread).
+  Workers are forked when the app is created, before the server starts its
+  threads; platforms without fork() hash inline unless workers are set
+  explicitly
+- A pool belongs to the process that started it: a process forked afterwards
+  (gunicorn --preload workers) starts its own on first use, with forkserver
+  or spawn if it already runs other threads
+- At most QUEUE_PER_WORKER jobs per worker are in flight; other request
+  threads wait (without holding the GIL) for a free slot
+- A job not done within PASSWORD_HASH_TIMEOUT seconds is hashed inline
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Any
+
+from werkzeug.security import (
+    DEFAULT_PBKDF2_ITERATIONS,
+    check_password_hash,
+    generate_password_hash,
+)
+
+logger = logging.getLogger(__name__)
+
+_START_METHODS = multiprocessing.get_all_start_methods()
+_CAN_FORK = "fork" in _START_METHODS
+# Start method when the process is no longer single-threaded
+_THREAD_SAFE_START = "forkserver" if "forkserver" in _START_METHODS else "spawn"
+
+PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+PASSWORD_HASH_WORKERS = int(
+    os.getenv("PASSWORD_HASH_WORKERS", 2 if _CAN_FORK else 0)
+)
+PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", 10))
+QUEUE_PER_WORKER = 4
+
+
+def normalize_method(method: str) -> str:
+    """
+    Spell out werkzeug's defaults ("scrypt" → "scrypt:32768:8:1").
+
+    Stored hashes always carry the full parameters, so this is what
+    needs_rehash() compares them to.
+    """
+    name, *args = method.split(":")
+    if name == "scrypt" and not args:
+        return "scrypt:32768:8:1"
+    if name == "pbkdf2":
+        if not args:
+            return f"pbkdf2:sha256:{DEFAULT_PBKDF2_ITERATIONS}"
+        if len(args) == 1:
+            return f"pbkdf2:{args[0]}:{DEFAULT_PBKDF2_ITERATIONS}"
+    return method
+
+
+# ---- Worker functions (run in the pool processes) ----
+
+
+def _hash(password: str, method: str) -> str:
+    return generate_password_hash(password, method=method)
+
+
+def _verify(pwhash: str, password: str) -> bool:
+    return check_password_hash(pwhash, password)
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+class PasswordHasher:
+    """Password hashing backed by a bounded process pool"""
+
+    def __init__(
+        self,
+        method: str = PASSWORD_HASH_METHOD,
+        workers: int = PASSWORD_HASH_WORKERS,
+        timeout: float = PASSWORD_HASH_TIMEOUT,
+    ):
+        """Initialize hasher (the pool is started by start())"""
+        self.method = normalize_method(method)
+        self.workers = workers
+        self.timeout = timeout
+        self._pool: ProcessPoolExecutor | None = None
+        self._slots: threading.BoundedSemaphore | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    # ---- Pool lifecycle ----
+
+    def start(self) -> bool:
+        """
+        Start the worker processes (idempotent).
+
+        Called from the app factory so workers are forked while the process
+        is still single-threaded. A pool inherited through fork() is unusable
+        (its queue threads stayed in the parent): the child gets a new one.
+
+        Returns:
+            True if a pool is running, False when hashing inline
+        """
+        with self._lock:
+            pid = os.getpid()
+            if self._pool is not None and self._pid == pid:
+                return True
+            self._pool = None
+            self._slots = None
+            self._pid = pid
+            if self.workers <= 0:
+                return False
+
+            if _CAN_FORK and threading.active_count() == 1:
+                context = multiprocessing.get_context("fork")
+            else:
+                context = multiprocessing.get_context(_THREAD_SAFE_START)
+            pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            try:
+                # With fork, the first job starts every worker right away
+                pool.submit(_warm_up).result(timeout=self.timeout)
+            except (BrokenProcessPool, OSError, TimeoutError) as e:
+                logger.warning(
+                    "Password hashing pool unavailable, hashing inline: %s", e
+                )
+                pool.shutdown(wait=False, cancel_futures=True)
+                return False
+
+            self._pool = pool
+            self._slots = threading.BoundedSemaphore(self.workers * QUEUE_PER_WORKER)
+            return True
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        with self._lock:
+            # A pool inherited through fork() is the parent's to stop
+            if self._pool is not None and self._pid == os.getpid():
+                self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+            self._slots = None
+            self._pid = None
+
+    def _current(
+        self,
+    ) -> tuple[ProcessPoolExecutor | None, threading.BoundedSemaphore | None]:
+        """Pool of this process, restarted once after a fork"""
+        if self._pid is not None and self._pid != os.getpid():
+            self.start()
+        return self._pool, self._slots
+
+    def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run fn in the pool (bounded), or inline without one"""
+        pool, slots = self._current()
+        if pool is None or slots is None:
+            return fn(*args)
+
+        with slots:
+            future = pool.submit(fn, *args)
+            try:
+                return future.result(timeout=self.timeout)
+            except TimeoutError:
+                future.cancel()
+                logger.warning(
+                    "Password hashing pool busy for %ss, hashing inline", self.timeout
+                )
+                return fn(*args)
+            except BrokenProcessPool:
+                logger.error(
+                    "Password hashing pool died, hashing inline until restart"
+                )
+                with self._lock:
+                    if self._pool is pool:
+                        self._pool = None
+                        self._slots = None
+                return fn(*args)
+
+    # ---- Hashing ----
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the configured method"""
+        return str(self._run(_hash, password, self.method))
+
+    def hash_many(self, passwords: list[str]) -> list[str]:
+        """Hash several values, spread over the workers"""
+        pool, slots = self._current()
+        if pool is None or slots is None or len(passwords) < 2:
+            return [self.hash(password) for password in passwords]
+
+        with slots:
+            try:
+                return list(
+                    pool.map(
+                        _hash, passwords, repeat(self.method), timeout=self.timeout
+                    )
+                )
+            except TimeoutError:
+                logger.warning(
+                    "Password hashing pool busy for %ss, hashing inline", self.timeout
+                )
+                return [_hash(password, self.method) for password in passwords]
+            except BrokenProcessPool:
+                pass
+        return [self.hash(password) for password in passwords]
+
+    def verify(self, pwhash: str, password: str) -> bool:
+        """Check a password against a stored hash (any werkzeug method)"""
+        return bool(self._run(_verify, pwhash, password))
+
+    def needs_rehash(self, pwhash: str) -> bool:
+        """Whether a stored hash was made with another method or cost"""
+        return pwhash.split("$", 1)[0] != self.method
+
+    def benchmark(self, method: str, rounds: int = 3) -> float:
+        """
+        Time one hash with `method` in this process.
+
+        Returns:
+            Median duration in seconds
+        """
+        durations = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            generate_password_hash("benchmark-password", method=method)
+            durations.append(time.perf_counter() - start)
+        return sorted(durations)[len(durations) // 2]
+
+
+# Global instance
+password_hasher = PasswordHasher()
+
+
+def init_app(app: Any) -> None:
+    """Start the hashing workers for this process"""
+    if password_hasher.start():
+        app.logger.info(
+            f"Password hashing: {password_hasher.workers} worker process(es)"
+        )
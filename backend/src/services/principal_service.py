@@ -0,0 +1,307 @@
+"""
+------------------------------------------------------------------------------
+Purpose: Principal service
+Description: Lightweight authenticated identity for Flask-Login, cached per session
+
+File: backend/src/services/principal_service.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T23:00:00+00:00
+Last modified (Git): TBD | Commit: TBD
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+
+Notes:
+- The principal (id, username, role, is_admin, is_active, auth_version,
+  session_epoch) is stored in the Flask session; the current auth_version of
+  each user is kept in the shared cache (PRINCIPAL_VERSION_TTL seconds)
+- A request only reads the users table when the two versions differ or the
+  cached version expired, then with a 7-column SELECT
+- Flask-Login IDs are "<id>:<session_epoch>"; logins made before the user's
+  sessions were revoked (epoch bumped) no longer load
+- users.auth_version is bumped by a mapper hook whenever a PRINCIPAL_FIELDS
+  column changes; the cached version is dropped after the commit, so role
+  changes, deactivation and password changes apply on the next request
+- Other User attributes (email, preferences, ...) are still reachable on the
+  principal: the first access loads the full row for that request
+------------------------------------------------------------------------------
+"""
+
+import os
+from typing import Any
+
+from flask import Flask, session
+from flask_login import user_logged_out
+from sqlalchemy import event, inspect, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, object_session
+
+from backend.src.extensions import db
+from backend.src.models.user import User
+from backend.src.services.cache_service import cache_service
+
+PRINCIPAL_VERSION_TTL = int(os.getenv("PRINCIPAL_VERSION_TTL", 300))
+
+# Changes to these columns bump users.auth_version
+PRINCIPAL_FIELDS = (
+    "username",
+    "role",
+    "is_admin",
+    "is_active",
+    "password_hash",
+    "session_epoch",
+)
+
+SESSION_KEY = "_principal"
+_CHANGED_KEY = "principal_changed_ids"
+
+
+class Principal:
+    """Authenticated user as seen by Flask-Login and the route decorators"""
+
+    def __init__(
+        self,
+        user_id: int,
+        username: str,
+        role: str,
+        is_admin: bool,
+        is_active: bool,
+        auth_version: int,
+        session_epoch: int = 0,
+    ):
+        """Initialize principal"""
+        self.id = user_id
+        self.username = username
+        self.role = role
+        self.is_admin = is_admin
+        self.is_active = is_active
+        self.auth_version = auth_version
+        self.session_epoch = session_epoch
+        self._user: User | None = None
+
+    # ---- Flask-Login interface ----
+
+    @property
+    def is_authenticated(self) -> bool:
+        """Always True for a loaded principal"""
+        return True
+
+    @property
+    def is_anonymous(self) -> bool:
+        """Always False for a loaded principal"""
+        return False
+
+    def get_id(self) -> str:
+        """ID as stored by Flask-Login (same format as User.get_id)"""
+        return f"{self.id}:{self.session_epoch}"
+
+    # ---- Session storage ----
+
+    def to_session(self) -> dict[str, Any]:
+        """Plain dict for the session cookie"""
+        return {
+            "id": self.id,
+            "username": self.username,
+            "role": self.role,
+            "is_admin": self.is_admin,
+            "is_active": self.is_active,
+            "v": self.auth_version,
+            "e": self.session_epoch,
+        }
+
+    @classmethod
+    def from_session(cls, data: dict[str, Any]) -> "Principal":
+        """Rebuild a principal stored by to_session()"""
+        return cls(
+            data["id"],
+            data["username"],
+            data["role"],
+            data["is_admin"],
+            data["is_active"],
+            data["v"],
+            data.get("e", 0),
+        )
+
+    # ---- Full user row ----
+
+    @property
+    def user(self) -> User | None:
+        """Full User row (loaded on first access)"""
+        if self._user is None:
+            self._user = db.session.get(User, self.id)
+        return self._user
+
+    def __getattr__(self, name: str) -> Any:
+        """Fall back to the full User row for other attributes"""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.user, name)
+
+    def __eq__(self, other: object) -> bool:
+        """Same user (principal or User row)"""
+        if isinstance(other, (Principal, User)):
+            return self.id == other.id
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash by user ID"""
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        """String representation"""
+        return f"<Principal {self.username} v{self.auth_version}>"
+
+
+class PrincipalService:
+    """Resolve and invalidate principals"""
+
+    @staticmethod
+    def version_key(user_id: int) -> str:
+        """Cache key holding a user's current auth_version"""
+        return f"principal:version:{user_id}"
+
+    @staticmethod
+    def parse_id(login_id: str) -> tuple[int, int]:
+        """Split a Flask-Login ID into (user ID, session epoch)"""
+        user_id, _, epoch = str(login_id).partition(":")
+        return int(user_id), int(epoch or 0)
+
+    @staticmethod
+    def load(user_id: int, epoch: int | None = None) -> Principal | None:
+        """
+        Principal for a user ID (Flask-Login user_loader).
+
+        Uses the session copy while its version matches the cached one,
+        otherwise reads the principal columns from the database.
+
+        Args:
+            user_id: User ID
+            epoch: Session epoch the login was made under (None = not checked)
+
+        Returns:
+            Principal, or None if the user is gone, inactive or the login revoked
+        """
+        stored = session.get(SESSION_KEY)
+        version = cache_service.get(PrincipalService.version_key(user_id))
+
+        fresh = (
+            stored
+            and stored.get("id") == user_id
+            and version is not None
+            and stored.get("v") == version
+        )
+        if fresh:
+            principal = Principal.from_session(stored)
+        else:
+            principal = PrincipalService._select(user_id)
+            if principal is None:
+                session.pop(SESSION_KEY, None)
+                return None
+            cache_service.set(
+                PrincipalService.version_key(user_id),
+                principal.auth_version,
+                ttl=PRINCIPAL_VERSION_TTL,
+            )
+            session[SESSION_KEY] = principal.to_session()
+
+        if epoch is not None and epoch != principal.session_epoch:
+            return None
+        return principal if principal.is_active else None
+
+    @staticmethod
+    def _select(user_id: int) -> Principal | None:
+        """Read the principal columns of one user"""
+        try:
+            row = db.session.execute(
+                select(
+                    User.id,
+                    User.username,
+                    User.role,
+                    User.is_admin,
+                    User.is_active,
+                    User.auth_version,
+                    User.session_epoch,
+                ).where(User.id == user_id)
+            ).first()
+        except OperationalError:
+            # DB not initialized yet → nobody is logged in
+            db.session.rollback()
+            return None
+        return Principal(*row) if row else None
+
+    @staticmethod
+    def current() -> Any | None:
+        """
+        Principal of the current request.
+
+        Flask-Login's current_user first (a full User right after login),
+        then the user_id set by the 2FA login flow (utils.auth_helpers).
+
+        Returns:
+            Principal or User, or None if not authenticated
+        """
+        from flask_login import current_user
+
+        if current_user.is_authenticated:
+            return current_user
+
+        user_id = session.get("user_id")
+        return PrincipalService.load(int(user_id)) if user_id else None
+
+    @staticmethod
+    def invalidate(user_ids: list[int]) -> None:
+        """Drop cached versions so sessions reload these principals"""
+        if user_ids:
+            cache_service.delete_many(
+                [PrincipalService.version_key(uid) for uid in user_ids]
+            )
+
+
+# ---- Version tracking ----
+
+
+def _mark_changed(target: User) -> None:
+    """Remember a user whose cached version must go after the commit"""
+    session_ = object_session(target)
+    if session_ is not None and target.id is not None:
+        session_.info.setdefault(_CHANGED_KEY, set()).add(target.id)
+
+
+@event.listens_for(User, "before_update")
+def _bump_auth_version(mapper: Any, connection: Any, target: User) -> None:
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in PRINCIPAL_FIELDS):
+        target.auth_version = (target.auth_version or 0) + 1
+        _mark_changed(target)
+
+
+@event.listens_for(User, "after_delete")
+def _user_deleted(mapper: Any, connection: Any, target: User) -> None:
+    _mark_changed(target)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session_: Session) -> None:
+    PrincipalService.invalidate(list(session_.info.pop(_CHANGED_KEY, ())))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session_: Session) -> None:
+    session_.info.pop(_CHANGED_KEY, None)
+
+
+def _forget_principal(sender: Any, **extra: Any) -> None:
+    session.pop(SESSION_KEY, None)
+
+
+def init_app(app: Flask) -> None:
+    """Clear the session principal on logout"""
+    user_logged_out.connect(_forget_principal, app)
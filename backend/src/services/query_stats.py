@@ -0,0 +1,227 @@
+"""
+Purpose: SQL query instrumentation
+Description: Per-request statement counts, DB time, N+1 detection and slow-query samples
+
+File: backend/src/services/query_stats.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T20:00:00+00:00
+Last modified (Git): TBD | Commit: TBD
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+Notes:
+- Opt-in per request with QUERY_STATS_ENABLED=true: adds a Server-Timing
+  header (db time and statement count) and logs N+1 patterns / slow queries
+- count_queries() works regardless of the flag (used by the test fixture
+  max_queries in backend/tests/conftest.py)
+- Listeners are attached to the Engine class, so every engine (one per app,
+  plus scratch engines in tests) is covered; they do nothing when no log is open
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from flask import Flask, Response, current_app, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Statements slower than this (milliseconds) are logged
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 100))
+
+# Same statement shape run this many times in one request = likely N+1
+N_PLUS_ONE_THRESHOLD = int(os.getenv("QUERY_STATS_N_PLUS_ONE", 5))
+
+# Slow statements kept per request (the slowest ones)
+SLOW_QUERY_SAMPLES = 5
+
+# IN lists of bind parameters ("?", "%s", "%(name)s", ":name") and literals
+_PARAM = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+_PARAM_LIST = re.compile(rf"\(\s*{_PARAM}(?:\s*,\s*{_PARAM})+\s*\)")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+_local = threading.local()
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalize a statement so repeated executions compare equal.
+
+    Bind parameters are already placeholders; IN lists of varying length and
+    inlined literals are collapsed as well.
+    """
+    shape = _PARAM_LIST.sub("(?)", statement)
+    shape = _STRING_LITERAL.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    return " ".join(shape.split())
+
+
+class QueryLog:
+    """Statements executed while the log is open"""
+
+    def __init__(self):
+        """Initialize empty log"""
+        self.count = 0
+        self.duration = 0.0
+        self.statements: list[str] = []
+        self.shapes: Counter[str] = Counter()
+        self.slow: list[tuple[float, str]] = []
+
+    def record(self, statement: str, duration: float) -> None:
+        """Record one executed statement (duration in seconds)"""
+        self.count += 1
+        self.duration += duration
+        self.statements.append(statement)
+        self.shapes[statement_shape(statement)] += 1
+
+        if duration * 1000 >= SLOW_QUERY_MS:
+            self.slow.append((duration, statement))
+            self.slow.sort(reverse=True)
+            del self.slow[SLOW_QUERY_SAMPLES:]
+
+    def repeated(self, threshold: int | None = None) -> list[tuple[str, int]]:
+        """Statement shapes run at least `threshold` times (likely N+1)"""
+        threshold = threshold or N_PLUS_ONE_THRESHOLD
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+# ---- Engine listeners ----
+
+
+def _open_logs() -> list[QueryLog]:
+    """Logs open in the current thread (innermost last)"""
+    logs: list[QueryLog] | None = getattr(_local, "logs", None)
+    if logs is None:
+        logs = _local.logs = []
+    return logs
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Stamp the start time on the execution context while a log is open"""
+    if getattr(_local, "logs", None) and context is not None:
+        context._query_stats_start = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Record the statement and its duration in every open log"""
+    start = getattr(context, "_query_stats_start", None)
+    if start is None:
+        return
+    duration = time.perf_counter() - start
+    for log in _open_logs():
+        log.record(statement, duration)
+
+
+def install_listeners() -> None:
+    """Attach the timing listeners to all engines (idempotent)"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryLog]:
+    """
+    Record the statements executed in this thread inside the block.
+
+    Example:
+        with count_queries() as log:
+            client.get("/admin/")
+        assert log.count <= 5
+    """
+    install_listeners()
+    log = QueryLog()
+    logs = _open_logs()
+    logs.append(log)
+    try:
+        yield log
+    finally:
+        logs.remove(log)
+
+
+# ---- Flask integration ----
+
+
+def _start_request() -> None:
+    """Open the request's query log (when QUERY_STATS_ENABLED)"""
+    if not current_app.config.get("QUERY_STATS_ENABLED"):
+        return
+    log = QueryLog()
+    _open_logs().append(log)
+    g.query_log = log
+    g.query_log_started = time.perf_counter()
+
+
+def _report(response: Response) -> Response:
+    """Add the Server-Timing header and log N+1 and slow statements"""
+    log: QueryLog | None = g.get("query_log")
+    if log is None:
+        return response
+
+    elapsed = time.perf_counter() - g.query_log_started
+    response.headers.add(
+        "Server-Timing",
+        f'db;dur={log.duration * 1000:.1f};desc="{log.count} queries", '
+        f"app;dur={elapsed * 1000:.1f}",
+    )
+
+    for shape, n in log.repeated():
+        logger.warning(
+            "Possible N+1 on %s %s: %d x %s", request.method, request.path, n, shape
+        )
+    for duration, statement in log.slow:
+        logger.warning(
+            "Slow query on %s %s (%.1f ms): %s",
+            request.method,
+            request.path,
+            duration * 1000,
+            statement,
+        )
+
+    return response
+
+
+def _end_request(_exc: BaseException | None) -> None:
+    """Close the request's query log"""
+    log: QueryLog | None = g.pop("query_log", None)
+    if log is not None and log in _open_logs():
+        _open_logs().remove(log)
+
+
+def init_app(app: Flask) -> None:
+    """Register per-request query instrumentation (active when QUERY_STATS_ENABLED)"""
+    install_listeners()
+    app.before_request(_start_request)
+    app.after_request(_report)
+    app.teardown_request(_end_request)
@@ -0,0 +1,336 @@
+"""
+------------------------------------------------------------------------------
+Purpose: Content full-text search
+Description: Ranked search over content title and body, one backend per database
+
+File: backend/src/services/search_service.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T17:00:00+00:00
+Last modified (Git): TBD | Commit: TBD
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+
+Notes:
+- SQLite: FTS5 table content_fts (rowid = content.id), BM25 ranking, title x10
+- PostgreSQL: GIN index on a weighted tsvector expression, ts_rank ranking
+- MySQL/MariaDB: FULLTEXT index on (title, body), natural language mode
+- Indexes are created with the content table (see models/content.py);
+  "flask rebuild-search-index" creates or repopulates them on existing databases
+- Without an index the search falls back to LIKE '%term%' on title and body
+- Statements are built with SQLAlchemy Core; the only raw SQL is the
+  constant index expressions and DDL of models/content.py
+------------------------------------------------------------------------------
+"""
+
+import re
+
+from flask import current_app
+from sqlalchemy import (
+    Select,
+    column,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.dialects.mysql import match
+
+from backend.src.extensions import db
+from backend.src.models.content import (
+    FTS_INDEX,
+    FTS_TABLE,
+    PG_SEARCH_VECTOR,
+    SEARCH_DDL,
+    Content,
+)
+
+# Ranking weights for the FTS5 bm25() columns (title, body)
+SQLITE_BM25_WEIGHTS = (10.0, 1.0)
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+# FTS5 table (rowid = content.id). The column named after the table is
+# FTS5's hidden command column, and the table name itself is what MATCH
+# and bm25() take
+_fts = table(
+    FTS_TABLE, column("rowid"), column("title"), column("body"), column(FTS_TABLE)
+)
+_fts_ref = literal_column(FTS_TABLE)
+
+# Same expression as the GIN index, so PostgreSQL can use it
+_pg_vector = literal_column(f"({PG_SEARCH_VECTOR})")
+
+
+class SearchService:
+    """Full-text search over Content with incremental index maintenance"""
+
+    # ---- Backend detection ----
+
+    @staticmethod
+    def dialect() -> str:
+        """Database dialect name ("mariadb" is reported as "mysql")"""
+        name = db.engine.dialect.name
+        return "mysql" if name == "mariadb" else name
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Whether the full-text index exists in the current database.
+
+        A positive answer is remembered per app; a missing index is checked
+        again on the next call so an index created later (installer,
+        rebuild command) is picked up.
+        """
+        state = current_app.extensions.setdefault("search_index", {})
+        if state.get("available"):
+            return True
+
+        dialect = SearchService.dialect()
+        if dialect not in SEARCH_DDL:
+            return False
+
+        inspector = inspect(db.engine)
+        if dialect == "sqlite":
+            available = inspector.has_table(FTS_TABLE)
+        else:
+            available = any(
+                index["name"] == FTS_INDEX for index in inspector.get_indexes("content")
+            )
+
+        state["available"] = available
+        return available
+
+    # ---- Index maintenance ----
+
+    @staticmethod
+    def index(content: Content) -> None:
+        """
+        Add or refresh one content row in the index.
+
+        Runs in the caller's transaction, after the row is flushed (needs
+        its id). Only SQLite needs this; the other backends index on write.
+        """
+        if SearchService.dialect() != "sqlite" or not SearchService.is_available():
+            return
+
+        db.session.execute(
+            insert(_fts)
+            .prefix_with("OR REPLACE")
+            .values(rowid=content.id, title=content.title, body=content.body)
+        )
+
+    @staticmethod
+    def remove(content_id: int) -> None:
+        """Remove one content row from the index (caller's transaction)"""
+        if SearchService.dialect() != "sqlite" or not SearchService.is_available():
+            return
+
+        db.session.execute(delete(_fts).where(_fts.c.rowid == content_id))
+
+    @staticmethod
+    def rebuild() -> int:
+        """
+        Create the index if missing and repopulate it from the content table.
+
+        Returns:
+            Number of content rows indexed
+        """
+        dialect = SearchService.dialect()
+        if dialect not in SEARCH_DDL:
+            raise RuntimeError(f"Full-text search is not supported on {dialect}")
+
+        create, _drop = SEARCH_DDL[dialect]
+        total = db.session.query(Content.id).count()
+
+        if dialect == "sqlite":
+            db.session.execute(text(create))
+            db.session.execute(delete(_fts))
+            db.session.execute(
+                insert(_fts).from_select(
+                    ["rowid", "title", "body"],
+                    select(Content.id, Content.title, Content.body),
+                )
+            )
+            db.session.execute(insert(_fts).values({FTS_TABLE: "optimize"}))
+        elif dialect == "postgresql":
+            db.session.execute(text(create))
+            db.session.execute(text(f"REINDEX INDEX {FTS_INDEX}"))
+        elif not SearchService.is_available():
+            # FULLTEXT has no IF NOT EXISTS; InnoDB keeps it current on write
+            db.session.execute(text(create))
+
+        db.session.commit()
+        current_app.extensions.setdefault("search_index", {})["available"] = True
+        return total
+
+    # ---- Queries ----
+
+    @staticmethod
+    def search(
+        query: str,
+        content_type: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        with_total: bool = True,
+    ) -> tuple[list[int], int | None]:
+        """
+        Ranked content search over title and body.
+
+        Args:
+            query: User search string (any syntax characters are ignored)
+            content_type: Filter by type (post, page, article)
+            limit: Maximum number of ids to return
+            offset: Number of ranked results to skip
+            with_total: Also run the count query (skip when the caller has
+                it cached)
+
+        Returns:
+            Tuple of (content ids, best match first, total match count or None)
+        """
+        terms = _WORD.findall(query or "")
+        if not terms:
+            return [], 0
+
+        if not SearchService.is_available():
+            return SearchService._search_like(
+                terms, content_type, limit, offset, with_total
+            )
+
+        dialect = SearchService.dialect()
+        if dialect == "sqlite":
+            search = SearchService._search_sqlite
+        elif dialect == "postgresql":
+            search = SearchService._search_postgresql
+        else:
+            search = SearchService._search_mysql
+        return search(terms, content_type, limit, offset, with_total)
+
+    @staticmethod
+    def _run(
+        ids_query: Select,
+        count_query: Select,
+        limit: int,
+        offset: int,
+        with_total: bool,
+    ) -> tuple[list[int], int | None]:
+        """Execute a page query and, if asked, its count query"""
+        ids = list(db.session.scalars(ids_query.limit(limit).offset(offset)))
+        if not with_total:
+            return ids, None
+        total = db.session.scalar(count_query) or 0
+        return ids, int(total)
+
+    @staticmethod
+    def _search_sqlite(
+        terms: list[str],
+        content_type: str | None,
+        limit: int,
+        offset: int,
+        with_total: bool,
+    ) -> tuple[list[int], int | None]:
+        """FTS5 MATCH: every term must match (as a prefix), ranked by BM25"""
+        terms_query = " ".join(f'"{term}"*' for term in terms)
+        where = [_fts_ref.op("MATCH")(terms_query)]
+        if content_type:
+            where.append(Content.type == content_type)
+
+        source = _fts.join(Content, Content.id == _fts.c.rowid)
+        rank = func.bm25(_fts_ref, *SQLITE_BM25_WEIGHTS)
+        return SearchService._run(
+            select(Content.id)
+            .select_from(source)
+            .where(*where)
+            .order_by(rank, Content.id.desc()),
+            select(func.count()).select_from(source).where(*where),
+            limit,
+            offset,
+            with_total,
+        )
+
+    @staticmethod
+    def _search_postgresql(
+        terms: list[str],
+        content_type: str | None,
+        limit: int,
+        offset: int,
+        with_total: bool,
+    ) -> tuple[list[int], int | None]:
+        """tsvector @@ tsquery on the GIN-indexed expression, ranked by ts_rank"""
+        tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        where = [_pg_vector.op("@@")(tsquery)]
+        if content_type:
+            where.append(Content.type == content_type)
+
+        return SearchService._run(
+            select(Content.id)
+            .where(*where)
+            .order_by(func.ts_rank(_pg_vector, tsquery).desc(), Content.id.desc()),
+            select(func.count()).select_from(Content).where(*where),
+            limit,
+            offset,
+            with_total,
+        )
+
+    @staticmethod
+    def _search_mysql(
+        terms: list[str],
+        content_type: str | None,
+        limit: int,
+        offset: int,
+        with_total: bool,
+    ) -> tuple[list[int], int | None]:
+        """FULLTEXT MATCH ... AGAINST in natural language mode (relevance order)"""
+        relevance = match(
+            Content.title, Content.body, against=" ".join(terms)
+        ).in_natural_language_mode()
+        where = [relevance]
+        if content_type:
+            where.append(Content.type == content_type)
+
+        return SearchService._run(
+            select(Content.id)
+            .where(*where)
+            .order_by(relevance.desc(), Content.id.desc()),
+            select(func.count()).select_from(Content).where(*where),
+            limit,
+            offset,
+            with_total,
+        )
+
+    @staticmethod
+    def _search_like(
+        terms: list[str],
+        content_type: str | None,
+        limit: int,
+        offset: int,
+        with_total: bool,
+    ) -> tuple[list[int], int | None]:
+        """Unindexed fallback: every term in title or body, newest first"""
+        query = Content.query.with_entities(Content.id)
+        for term in terms:
+            pattern = f"%{term}%"
+            query = query.filter(
+                or_(Content.title.ilike(pattern), Content.body.ilike(pattern))
+            )
+        if content_type:
+            query = query.filter(Content.type == content_type)
+
+        total = query.count() if with_total else None
+        rows = (
+            query.order_by(Content.created_at.desc()).limit(limit).offset(offset).all()
+        )
+        return [row.id for row in rows], total
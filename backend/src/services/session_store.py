@@ -0,0 +1,564 @@
+"""
+------------------------------------------------------------------------------
+Purpose: Server-side session store
+Description: Flask session interface backed by Redis or an embedded SQLite
+database
+
+File: backend/src/services/session_store.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T23:30:00+00:00
+Last modified (Git): TBD | Commit: TBD
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+
+Notes:
+- Replaces Flask-Session: the cookie only holds a signed random session ID
+- Dirty tracking: a session is written only when its content changed
+  (nested changes need `session.modified = True`, as with Flask's own
+  sessions). Empty sessions are never stored, so anonymous visitors cost
+  nothing
+- Sliding expiry: each request extends an unchanged session's lifetime
+  (PERMANENT_SESSION_LIFETIME), with at most one expiry write per
+  SESSION_TOUCH_INTERVAL seconds
+- Per-user index: sessions record their user (Flask-Login "_user_id", or
+  "user_id" from the 2FA flow), so revoke_user() ends all of a user's sessions
+- Logins get a new session ID (Flask-Login's user_logged_in signal, or
+  regenerate_session() in the 2FA flow) and the old one is deleted, so a
+  session ID planted before login is useless afterwards
+- Redis expires sessions itself. The SQLite store (instance/sessions.db) is
+  purged by a daemon thread every SESSION_PURGE_INTERVAL seconds, one worker
+  per interval; the first run also removes Flask-Session's old files
+- Data is serialized with Flask's tagged JSON (no pickle)
+------------------------------------------------------------------------------
+"""
+
+import logging
+import os
+import secrets
+import shutil
+import threading
+import time
+from typing import Any
+
+from flask import Flask, current_app, session
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSession, SessionInterface
+from flask_login import user_logged_in
+from itsdangerous import BadSignature, Signer
+
+logger = logging.getLogger(__name__)
+
+SESSION_TOUCH_INTERVAL = int(os.getenv("SESSION_TOUCH_INTERVAL", 300))
+SESSION_PURGE_INTERVAL = int(os.getenv("SESSION_PURGE_INTERVAL", 3600))
+SESSION_SQLITE_PATH = os.getenv("SESSION_SQLITE_PATH", "")
+
+_serializer = TaggedJSONSerializer()
+
+
+def session_user_id(data: dict[str, Any]) -> int | None:
+    """User a session belongs to (Flask-Login or 2FA login), if any"""
+    value = dict.get(data, "_user_id") or dict.get(data, "user_id")
+    try:
+        # Flask-Login IDs are "<id>:<session_epoch>" (see PrincipalService)
+        return int(str(value).partition(":")[0]) if value is not None else None
+    except ValueError:
+        return None
+
+
+class ServerSession(SecureCookieSession):
+    """Session whose data lives in a SessionStore (only the ID is in the cookie)"""
+
+    def __init__(
+        self,
+        initial: dict[str, Any] | None = None,
+        sid: str = "",
+        new: bool = False,
+        expires_at: float = 0.0,
+    ):
+        """Initialize session (modified/accessed tracked by SecureCookieSession)"""
+        super().__init__(initial)
+        self.sid = sid
+        self.new = new
+        self.expires_at = expires_at
+        self.loaded_user_id = session_user_id(self)
+        self.previous_sid: str | None = None
+
+    def regenerate(self) -> None:
+        """Move the data to a new session ID; the old one is deleted on save"""
+        if not self.new and self.previous_sid is None:
+            self.previous_sid = self.sid
+        self.sid = secrets.token_urlsafe(32)
+        self.modified = True
+
+
+def regenerate_session() -> None:
+    """Give the current session a new ID (call when privileges change)"""
+    if isinstance(session, ServerSession):
+        session.regenerate()
+
+
+# ---- SQLite Store ----
+
+
+class SQLiteSessionStore:
+    """Sessions in an embedded SQLite database (one row per session)"""
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        path: str,
+        purge_interval: int = SESSION_PURGE_INTERVAL,
+        legacy_dir: str | None = None,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            path: SQLite database file
+            purge_interval: Seconds between purges of expired sessions (0 = off)
+            legacy_dir: Flask-Session file directory removed by the first purge
+        """
+        self.path = path
+        self.purge_interval = purge_interval
+        self.legacy_dir = legacy_dir
+        self._conns = threading.local()
+        self._purger_pid: int | None = None
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def _db(self) -> Any:
+        """Per-thread (and per-process) connection"""
+        conn = getattr(self._conns, "conn", None)
+        if conn is not None and self._conns.pid == os.getpid():
+            return conn
+
+        import sqlite3
+
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "sid TEXT PRIMARY KEY, user_id INTEGER, "
+            "data TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_sessions_user_id ON sessions (user_id)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_sessions_expires_at ON sessions (expires_at)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL)"
+        )
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('purged_at', 0)")
+
+        self._conns.conn = conn
+        self._conns.pid = os.getpid()
+        return conn
+
+    # ---- Sessions ----
+
+    def load(self, sid: str) -> tuple[dict[str, Any], float] | None:
+        """Session data and expiry timestamp, or None if missing or expired"""
+        row = self._db().execute(
+            "SELECT data, expires_at FROM sessions WHERE sid = ? AND expires_at > ?",
+            (sid, time.time()),
+        ).fetchone()
+        return (_serializer.loads(row[0]), row[1]) if row else None
+
+    def save(
+        self,
+        sid: str,
+        data: dict[str, Any],
+        user_id: int | None,
+        ttl: int,
+        previous_user_id: int | None = None,
+    ) -> float:
+        """Write a session (previous_user_id is only needed by index-based stores)"""
+        expires_at = time.time() + ttl
+        self._db().execute(
+            "INSERT OR REPLACE INTO sessions (sid, user_id, data, expires_at) "
+            "VALUES (?, ?, ?, ?)",
+            (sid, user_id, _serializer.dumps(data), expires_at),
+        )
+        return expires_at
+
+    def touch(self, sid: str, ttl: int, user_id: int | None = None) -> float:
+        """Extend a session without rewriting its data"""
+        expires_at = time.time() + ttl
+        self._db().execute(
+            "UPDATE sessions SET expires_at = ? WHERE sid = ?", (expires_at, sid)
+        )
+        return expires_at
+
+    def delete(self, sid: str, user_id: int | None = None) -> None:
+        """Remove one session"""
+        self._db().execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+    # ---- Per-user index ----
+
+    def user_sessions(self, user_id: int) -> list[str]:
+        """IDs of a user's live sessions"""
+        rows = self._db().execute(
+            "SELECT sid FROM sessions WHERE user_id = ? AND expires_at > ?",
+            (user_id, time.time()),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def revoke_user(self, user_id: int) -> int:
+        """
+        End all sessions of a user in one statement.
+
+        Returns:
+            Number of live sessions removed
+        """
+        cursor = self._db().execute(
+            "DELETE FROM sessions WHERE user_id = ? AND expires_at > ?",
+            (user_id, time.time()),
+        )
+        return int(cursor.rowcount)
+
+    # ---- Purge ----
+
+    def purge(self) -> int:
+        """
+        Delete expired sessions (at most once per interval across workers).
+
+        Returns:
+            Number of sessions removed
+        """
+        now = time.time()
+        if self.purge_interval > 0:
+            cursor = self._db().execute(
+                "UPDATE meta SET value = ? WHERE key = 'purged_at' AND value <= ?",
+                (now, now - self.purge_interval),
+            )
+            if cursor.rowcount != 1:
+                return 0
+
+        cursor = self._db().execute(
+            "DELETE FROM sessions WHERE expires_at <= ?", (now,)
+        )
+        return int(cursor.rowcount)
+
+    def start_purger(self) -> None:
+        """Start the purge thread in the current process (fork-safe)"""
+        if self._purger_pid == os.getpid() or self.purge_interval <= 0:
+            return
+
+        self._purger_pid = os.getpid()
+        threading.Thread(
+            target=self._purge_loop, name="session-purger", daemon=True
+        ).start()
+
+    def _purge_loop(self) -> None:
+        """Purge loop (runs in a daemon thread)"""
+        self._remove_legacy_files()
+        pid = os.getpid()
+        while self._purger_pid == pid:
+            try:
+                removed = self.purge()
+                if removed:
+                    logger.info(f"Session purge: {removed} expired session(s) removed")
+            except Exception as e:
+                logger.error(f"Session purge error: {str(e)}")
+            time.sleep(self.purge_interval)
+
+    def _remove_legacy_files(self) -> None:
+        """Delete the file directory written by Flask-Session (no longer read)"""
+        if self.legacy_dir and os.path.isdir(self.legacy_dir):
+            shutil.rmtree(self.legacy_dir, ignore_errors=True)
+            logger.info(
+                f"Session purge: removed legacy session files in {self.legacy_dir}"
+            )
+
+
+# ---- Redis Store ----
+
+
+class RedisSessionStore:
+    """Sessions in Redis (native TTL) with a set of session IDs per user"""
+
+    name = "redis"
+
+    def __init__(self, redis: Any, prefix: str = "xf:"):
+        """Initialize store on a redis.Redis client"""
+        self.redis = redis
+        self.prefix = prefix
+
+    def _key(self, sid: str) -> str:
+        return f"{self.prefix}session:{sid}"
+
+    def _user_key(self, user_id: int) -> str:
+        return f"{self.prefix}session_user:{user_id}"
+
+    # ---- Sessions ----
+
+    def load(self, sid: str) -> tuple[dict[str, Any], float] | None:
+        """Session data and expiry timestamp, or None if missing or expired"""
+        pipe = self.redis.pipeline()
+        pipe.get(self._key(sid))
+        pipe.ttl(self._key(sid))
+        raw, ttl = pipe.execute()
+        if raw is None:
+            return None
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        return _serializer.loads(raw), time.time() + max(ttl, 0)
+
+    def save(
+        self,
+        sid: str,
+        data: dict[str, Any],
+        user_id: int | None,
+        ttl: int,
+        previous_user_id: int | None = None,
+    ) -> float:
+        """Write a session and keep the per-user index in step"""
+        pipe = self.redis.pipeline()
+        pipe.set(self._key(sid), _serializer.dumps(data), ex=ttl)
+        if previous_user_id is not None and previous_user_id != user_id:
+            pipe.srem(self._user_key(previous_user_id), sid)
+        if user_id is not None:
+            pipe.sadd(self._user_key(user_id), sid)
+            # The index lives as long as the user's most recent session
+            pipe.expire(self._user_key(user_id), ttl)
+        pipe.execute()
+        return time.time() + ttl
+
+    def touch(self, sid: str, ttl: int, user_id: int | None = None) -> float:
+        """Extend a session without rewriting its data"""
+        pipe = self.redis.pipeline()
+        pipe.expire(self._key(sid), ttl)
+        if user_id is not None:
+            pipe.expire(self._user_key(user_id), ttl)
+        pipe.execute()
+        return time.time() + ttl
+
+    def delete(self, sid: str, user_id: int | None = None) -> None:
+        """Remove one session"""
+        pipe = self.redis.pipeline()
+        pipe.delete(self._key(sid))
+        if user_id is not None:
+            pipe.srem(self._user_key(user_id), sid)
+        pipe.execute()
+
+    # ---- Per-user index ----
+
+    def _members(self, user_id: int) -> list[str]:
+        """Session IDs in a user's index (live or not)"""
+        members = self.redis.smembers(self._user_key(user_id))
+        return [s.decode() if isinstance(s, bytes) else s for s in members]
+
+    def user_sessions(self, user_id: int) -> list[str]:
+        """IDs of a user's live sessions (expired IDs are pruned from the index)"""
+        sids = self._members(user_id)
+        if not sids:
+            return []
+
+        pipe = self.redis.pipeline()
+        for sid in sids:
+            pipe.exists(self._key(sid))
+        live = [
+            sid for sid, exists in zip(sids, pipe.execute(), strict=True) if exists
+        ]
+
+        stale = set(sids) - set(live)
+        if stale:
+            self.redis.srem(self._user_key(user_id), *stale)
+        return live
+
+    def revoke_user(self, user_id: int) -> int:
+        """
+        End all sessions of a user in one round trip.
+
+        Returns:
+            Number of live sessions removed
+        """
+        sids = self._members(user_id)
+        pipe = self.redis.pipeline()
+        if sids:
+            pipe.delete(*[self._key(sid) for sid in sids])
+        pipe.delete(self._user_key(user_id))
+        results = pipe.execute()
+        return int(results[0]) if sids else 0
+
+    def purge(self) -> int:
+        """Nothing to do: Redis expires sessions itself"""
+        return 0
+
+    def start_purger(self) -> None:
+        """Nothing to do: Redis expires sessions itself"""
+
+
+# ---- Flask Session Interface ----
+
+
+class ServerSessionInterface(SessionInterface):
+    """Flask session interface over a session store"""
+
+    def __init__(self, store: Any):
+        """Initialize interface"""
+        self.store = store
+
+    def _signer(self, app: Flask) -> Signer:
+        return Signer(app.secret_key, salt="xf-session", key_derivation="hmac")
+
+    def open_session(self, app: Flask, request: Any) -> ServerSession | None:
+        """Load the session named by the cookie, or start an empty one"""
+        if not app.secret_key:
+            return None
+
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie:
+            try:
+                sid = self._signer(app).unsign(cookie).decode("utf-8")
+                loaded = self.store.load(sid)
+            except BadSignature:
+                loaded = None
+            except Exception as e:
+                logger.error(f"Session load error: {str(e)}")
+                loaded = None
+
+            if loaded is not None:
+                data, expires_at = loaded
+                return ServerSession(data, sid=sid, expires_at=expires_at)
+
+        return ServerSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app: Flask, session: Any, response: Any) -> None:
+        """Write the session if it changed, otherwise slide its expiry"""
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        # Emptied (logout, clear) or never filled: nothing to keep
+        if not session:
+            if not session.new and session.modified:
+                stored_sid = session.previous_sid or session.sid
+                self._call(self.store.delete, stored_sid, session.loaded_user_id)
+                response.delete_cookie(
+                    name,
+                    domain=domain,
+                    path=path,
+                    secure=self.get_cookie_secure(app),
+                    partitioned=self.get_cookie_partitioned(app),
+                    httponly=self.get_cookie_httponly(app),
+                )
+            return
+
+        ttl = int(app.permanent_session_lifetime.total_seconds())
+        user_id = session_user_id(session)
+
+        if session.previous_sid is not None:
+            self._call(self.store.delete, session.previous_sid, session.loaded_user_id)
+
+        if session.modified or session.new:
+            expires_at = self._call(
+                self.store.save,
+                session.sid,
+                dict(session),
+                user_id,
+                ttl,
+                session.loaded_user_id,
+            )
+        elif session.expires_at - time.time() < ttl - SESSION_TOUCH_INTERVAL:
+            expires_at = self._call(self.store.touch, session.sid, ttl, user_id)
+        else:
+            return
+
+        if expires_at is None:
+            return
+        session.expires_at = expires_at
+
+        if session.modified or session.new or session.permanent:
+            response.set_cookie(
+                name,
+                self._signer(app).sign(session.sid).decode("utf-8"),
+                expires=self.get_expiration_time(app, session),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                partitioned=self.get_cookie_partitioned(app),
+                samesite=self.get_cookie_samesite(app),
+            )
+
+    @staticmethod
+    def _call(fn: Any, *args: Any) -> Any:
+        """Run a store write (errors are logged, never fail the response)"""
+        try:
+            return fn(*args)
+        except Exception as e:
+            logger.error(f"Session store error: {str(e)}")
+            return None
+
+
+# ---- Setup ----
+
+
+_SQLITE_STORES: dict[str, SQLiteSessionStore] = {}
+_SQLITE_STORES_LOCK = threading.Lock()
+
+
+def sqlite_store(path: str, legacy_dir: str | None = None) -> SQLiteSessionStore:
+    """Process-wide store per database file (one purge thread each)"""
+    with _SQLITE_STORES_LOCK:
+        store = _SQLITE_STORES.get(path)
+        if store is None:
+            store = SQLiteSessionStore(path, legacy_dir=legacy_dir)
+            _SQLITE_STORES[path] = store
+        return store
+
+
+def init_app(app: Flask) -> Any:
+    """
+    Install the server-side session interface.
+
+    Redis when the cache runs on Redis (shared across servers), otherwise
+    SQLite in the instance folder (or SESSION_SQLITE_PATH).
+
+    Returns:
+        The session store
+    """
+    from backend.src.services.cache_service import CacheBackend, cache_service
+
+    store: Any
+    if cache_service.backend == CacheBackend.REDIS:
+        store = RedisSessionStore(
+            cache_service.client.redis, prefix=app.config["SESSION_KEY_PREFIX"]
+        )
+    else:
+        path = SESSION_SQLITE_PATH or os.path.join(app.instance_path, "sessions.db")
+        legacy_dir = os.path.join(app.instance_path, "sessions")
+        store = sqlite_store(path, legacy_dir=legacy_dir)
+        store.start_purger()
+
+    app.config["SESSION_TYPE"] = store.name
+    app.session_interface = ServerSessionInterface(store)
+    app.extensions["session_store"] = store
+    user_logged_in.connect(_regenerate_on_login, app)
+    return store
+
+
+def _regenerate_on_login(_sender: Flask, **_extra: Any) -> None:
+    """New session ID on every Flask-Login login (session fixation)"""
+    regenerate_session()
+
+
+def current_store() -> Any:
+    """Session store of the current app"""
+    return current_app.extensions["session_store"]
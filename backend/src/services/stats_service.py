@@ -0,0 +1,106 @@
+"""
+------------------------------------------------------------------------------
+Purpose: Statistics service layer
+Description: Aggregate counts for the admin dashboard and the stats API
+
+File: backend/src/services/stats_service.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T15:00:00+00:00
+Last modified (Git): TBD | Commit: TBD
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+
+Notes:
+- All counts come from one aggregate query (conditional SUM), no rows loaded
+- Cached for STATS_CACHE_TTL seconds (default 30); dropped by user and
+  content writes (UserService.invalidate_cache, ContentService counts).
+  recent_logins_24h is not: logins only show up once the TTL expires
+------------------------------------------------------------------------------
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import case, func, select
+
+from backend.src.extensions import db
+from backend.src.models.content import Content
+from backend.src.models.user import User
+
+
+class StatsService:
+    """Service for application-wide statistics"""
+
+    CACHE_KEY = "stats:overview"
+
+    @staticmethod
+    def get_overview() -> dict[str, int]:
+        """
+        Get user and content counts (cached).
+
+        Returns:
+            Dict with total_users, active_users, admin_users, users_2fa,
+            recent_logins_24h and content_items
+        """
+        from backend.src.services.cache_service import cache_service
+
+        return dict(
+            cache_service.get_or_compute(
+                StatsService.CACHE_KEY,
+                StatsService.compute_overview,
+                ttl=int(os.getenv("STATS_CACHE_TTL", 30)),
+            )
+        )
+
+    @staticmethod
+    def compute_overview() -> dict[str, int]:
+        """
+        Compute the overview counts in a single query.
+
+        Returns:
+            Same dict as get_overview (uncached)
+        """
+        since = datetime.utcnow() - timedelta(days=1)
+
+        def count_if(condition: Any) -> Any:
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        row = db.session.execute(
+            select(
+                func.count(User.id),
+                count_if(User.is_active.is_(True)),
+                count_if(User.is_admin.is_(True)),
+                count_if(User.totp_enabled.is_(True)),
+                count_if(User.last_login > since),
+                select(func.count(Content.id)).scalar_subquery(),
+            )
+        ).one()
+
+        total, active, admins, totp, recent, content = (
+            int(value or 0) for value in row
+        )
+        return {
+            "total_users": total,
+            "active_users": active,
+            "admin_users": admins,
+            "users_2fa": totp,
+            "recent_logins_24h": recent,
+            "content_items": content,
+        }
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop the cached overview (next read recomputes it)"""
+        from backend.src.services.cache_service import cache_service
+
+        cache_service.delete(StatsService.CACHE_KEY)
@@ -23,19 +23,31 @@
 - TOTP-based two-factor authentication
 - QR code generation for easy setup
 - Backup codes generation
+- Backup codes are found by an HMAC lookup (one slow hash per attempt) and
+  consumed with a single-row UPDATE
 ------------------------------------------------------------------------------
 """
 
 import base64
+import hashlib
+import hmac
 import io
 import json
 import secrets
+from datetime import datetime
 
 import pyotp
 import qrcode
-from werkzeug.security import generate_password_hash
+from flask import current_app, has_app_context
+from sqlalchemy import update
 
+from backend.src.extensions import db
+from backend.src.models.backup_code import BackupCode
 from backend.src.models.user import User
+from backend.src.services.password_hasher import password_hasher
+
+# Hex characters of HMAC-SHA256 kept as the backup code lookup (64 bits)
+BACKUP_LOOKUP_LENGTH = 16
 
 
 class TOTPService:
@@ -119,36 +131,107 @@ def verify_code(secret: str, code: str) -> bool:
         except Exception:
             return False
 
+    @staticmethod
+    def _secret_keys() -> list[str]:
+        """SECRET_KEY, then fallbacks (codes indexed before a key rotation)"""
+        if has_app_context():
+            config = current_app.config
+        else:
+            # Codes can be generated outside the app (CLI, tests)
+            from backend.src.config import get_config
+
+            config = {
+                key: getattr(get_config(), key, None)
+                for key in ("SECRET_KEY", "SECRET_KEY_FALLBACKS")
+            }
+        return [config["SECRET_KEY"], *(config.get("SECRET_KEY_FALLBACKS") or [])]
+
+    @staticmethod
+    def backup_code_lookups(code: str) -> list[str]:
+        """
+        Lookup identifiers of a backup code, one per secret key.
+
+        Args:
+            code: Backup code as entered (case-insensitive)
+
+        Returns:
+            Lookups, current key first
+        """
+        message = code.strip().upper().encode()
+        digests = [
+            hmac.new(key.encode(), message, hashlib.sha256).hexdigest()
+            for key in TOTPService._secret_keys()
+        ]
+        return [digest[:BACKUP_LOOKUP_LENGTH] for digest in digests]
+
     @staticmethod
     def generate_backup_codes(count: int = 10) -> tuple[list[str], str]:
         """
         Generate backup codes for 2FA recovery
 
+        Each stored entry is "<lookup>$<password hash>" (see save_backup_codes).
+
         Args:
             count: Number of backup codes to generate
 
         Returns:
             Tuple of (plain codes list, hashed codes JSON string)
         """
-        codes = []
-        hashed_codes = []
+        # Generate 8-character alphanumeric codes
+        codes = [secrets.token_hex(4).upper() for _ in range(count)]
 
-        for _ in range(count):
-            # Generate 8-character alphanumeric code
-            code = secrets.token_hex(4).upper()  # 8 chars
-            codes.append(code)
-            hashed_codes.append(generate_password_hash(code))
+        # Hashed in parallel by the password hashing workers
+        hashed_codes = password_hasher.hash_many(codes)
+        entries = [
+            f"{TOTPService.backup_code_lookups(code)[0]}${hashed}"
+            for code, hashed in zip(codes, hashed_codes, strict=True)
+        ]
 
-        # Store hashed codes as JSON
-        codes_json = json.dumps(hashed_codes)
+        # Stored as JSON until 2FA setup is confirmed
+        codes_json = json.dumps(entries)
 
         return codes, codes_json
 
+    @staticmethod
+    def _split_entry(entry: str) -> tuple[str | None, str]:
+        """Split a stored entry into (lookup, hash); lookup is None for old entries"""
+        lookup, sep, code_hash = entry.partition("$")
+        if sep and len(lookup) == BACKUP_LOOKUP_LENGTH and ":" not in lookup:
+            return lookup, code_hash
+        return None, entry
+
+    @staticmethod
+    def save_backup_codes(user: User, codes_json: str) -> None:
+        """
+        Replace a user's backup codes (one row per code); the caller commits.
+
+        Args:
+            user: User object
+            codes_json: Hashed codes JSON from generate_backup_codes()
+        """
+        BackupCode.query.filter_by(user_id=user.id).delete(synchronize_session=False)
+
+        legacy = []
+        for entry in json.loads(codes_json):
+            lookup, code_hash = TOTPService._split_entry(entry)
+            if lookup is None:
+                legacy.append(code_hash)
+            else:
+                db.session.add(
+                    BackupCode(user_id=user.id, lookup=lookup, code_hash=code_hash)
+                )
+
+        user.backup_codes = json.dumps(legacy) if legacy else None
+
     @staticmethod
     def verify_backup_code(user: User, code: str) -> bool:
         """
         Verify and consume a backup code
 
+        At most one slow hash is computed per attempt: the row is found by its
+        HMAC lookup, then consumed by a conditional UPDATE (a concurrent use
+        of the same code updates nothing). The caller commits.
+
         Args:
             user: User object
             code: Backup code to verify
@@ -156,22 +239,60 @@ def verify_backup_code(user: User, code: str) -> bool:
         Returns:
             True if code is valid and consumed, False otherwise
         """
-        if not user.backup_codes or not code:
+        if not code or not code.strip():
             return False
 
-        try:
-            from werkzeug.security import check_password_hash
+        code = code.strip().upper()
+        lookups = TOTPService.backup_code_lookups(code)
 
-            hashed_codes = json.loads(user.backup_codes)
+        try:
+            row = (
+                BackupCode.query.filter(
+                    BackupCode.user_id == user.id,
+                    BackupCode.lookup.in_(lookups),
+                    BackupCode.used_at.is_(None),
+                )
+                .order_by(BackupCode.id)
+                .first()
+            )
+            if row is not None:
+                if not password_hasher.verify(row.code_hash, code):
+                    return False
+                result = db.session.execute(
+                    update(BackupCode)
+                    .where(BackupCode.id == row.id, BackupCode.used_at.is_(None))
+                    .values(used_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+                return bool(result.rowcount == 1)
+
+            return TOTPService._verify_stored_json(user, code, lookups)
+        except Exception:
+            return False
 
-            # Check if code matches any hashed code
-            for i, hashed_code in enumerate(hashed_codes):
-                if check_password_hash(hashed_code, code.upper()):
-                    # Remove used code
-                    hashed_codes.pop(i)
-                    user.backup_codes = json.dumps(hashed_codes)
-                    return True
+    @staticmethod
+    def _verify_stored_json(user: User, code: str, lookups: list[str]) -> bool:
+        """
+        Verify against codes still stored in users.backup_codes.
 
+        Entries with a lookup need one slow hash; entries written before
+        lookups existed are tried one by one until the user regenerates
+        their codes.
+        """
+        if not user.backup_codes:
             return False
-        except Exception:
-            return False
+
+        entries = json.loads(user.backup_codes)
+        for i, entry in enumerate(entries):
+            lookup, code_hash = TOTPService._split_entry(entry)
+            if lookup is not None and lookup not in lookups:
+                continue
+            if password_hasher.verify(code_hash, code):
+                # Remove used code
+                entries.pop(i)
+                user.backup_codes = json.dumps(entries)
+                return True
+            if lookup is not None:
+                return False
+
+        return False
@@ -25,11 +25,16 @@
 ------------------------------------------------------------------------------
 """
 
+from datetime import datetime
 from typing import Any, cast
 
+from sqlalchemy import and_, or_
+
 from backend.src.extensions import db
 from backend.src.models.preferences import UserPreferences
 from backend.src.models.user import User
+from backend.src.services.stats_service import StatsService
+from backend.src.utils.pagination import clamp_per_page, keyset_page
 
 
 class UserService:
@@ -83,6 +88,7 @@ def create(
             db_session.add(prefs)
             db_session.commit()
 
+            StatsService.invalidate_cache()
             return user
         except Exception:
             db_session.rollback()
@@ -93,24 +99,19 @@ def get_by_id(user_id: int) -> User | None:
         """
         Get user by ID with caching.
 
+        Cached users are detached read-only snapshots without credential
+        columns; load the row with User.query for writes or password checks.
+
         Cache TTL: 300 seconds (5 minutes)
         """
         from backend.src.services.cache_service import cache_service
 
-        # Try cache first
-        cache_key = f"user:id:{user_id}"
-        cached = cache_service.get(cache_key)
-        if cached:
-            return cached
-
-        # Query database
-        user = cast(User | None, User.query.get(user_id))
-
-        # Cache result if found
-        if user:
-            cache_service.set(cache_key, user, ttl=300)
-
-        return user
+        return cast(
+            User | None,
+            cache_service.get_or_compute(
+                f"user:id:{user_id}", lambda: User.query.get(user_id), ttl=300
+            ),
+        )
 
     @staticmethod
     def get_by_username(username: str) -> User | None:
@@ -121,20 +122,14 @@ def get_by_username(username: str) -> User | None:
         """
         from backend.src.services.cache_service import cache_service
 
-        # Try cache first
-        cache_key = f"user:username:{username}"
-        cached = cache_service.get(cache_key)
-        if cached:
-            return cached
-
-        # Query database
-        user = User.get_by_username(username)
-
-        # Cache result if found
-        if user:
-            cache_service.set(cache_key, user, ttl=300)
-
-        return user
+        return cast(
+            User | None,
+            cache_service.get_or_compute(
+                f"user:username:{username}",
+                lambda: User.get_by_username(username),
+                ttl=300,
+            ),
+        )
 
     @staticmethod
     def get_by_email(email: str) -> User | None:
@@ -145,34 +140,53 @@ def get_by_email(email: str) -> User | None:
         """
         from backend.src.services.cache_service import cache_service
 
-        # Try cache first
-        cache_key = f"user:email:{email}"
-        cached = cache_service.get(cache_key)
-        if cached:
-            return cached
-
-        # Query database
-        user = User.get_by_email(email)
-
-        # Cache result if found
-        if user:
-            cache_service.set(cache_key, user, ttl=300)
-
-        return user
+        return cast(
+            User | None,
+            cache_service.get_or_compute(
+                f"user:email:{email}",
+                lambda: User.get_by_email(email),
+                ttl=300,
+            ),
+        )
 
     @staticmethod
     def invalidate_cache(user: User) -> None:
         """
         Invalidate all cache entries for a user.
 
-        Call this after user update/delete operations.
+        Call this after user update/delete operations. The stats overview
+        (user counts) is dropped in the same round trip.
         """
         from backend.src.services.cache_service import cache_service
 
-        cache_service.delete(f"user:id:{user.id}")
-        cache_service.delete(f"user:username:{user.username}")
-        cache_service.delete(f"user:email:{user.email}")
+        cache_service.delete_many(
+            [
+                f"user:id:{user.id}",
+                f"user:username:{user.username}",
+                f"user:email:{user.email}",
+                StatsService.CACHE_KEY,
+            ]
+        )
+
+    @staticmethod
+    def revoke_sessions(user: User) -> int:
+        """
+        End every login of a user.
+
+        Deletes the user's server-side sessions and bumps session_epoch,
+        which also invalidates remember-me cookies (see PrincipalService).
+
+        Args:
+            user: User whose sessions are revoked
+
+        Returns:
+            Number of live sessions deleted
+        """
+        from backend.src.services.session_store import current_store
 
+        user.session_epoch = (user.session_epoch or 0) + 1
+        db.session.commit()
+        return int(current_store().revoke_user(user.id))
 
     @staticmethod
     def get_all(active_only: bool = True) -> list[User]:
@@ -190,6 +204,97 @@ def get_all(active_only: bool = True) -> list[User]:
             query = query.filter_by(is_active=True)
         return cast(list[User], query.all())
 
+    @staticmethod
+    def list_page(
+        per_page: int = 20,
+        after: str | None = None,
+        before: str | None = None,
+        active: bool | None = None,
+        admin: bool | None = None,
+        totp: bool | None = None,
+        locked: bool | None = None,
+        search: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get one page of users, newest first (keyset pagination).
+
+        Filters are applied in SQL; None means "any". The search term is a
+        case-sensitive prefix match on username or email, served by range
+        scans on their indexes.
+
+        Args:
+            per_page: Page size (clamped to 1..100)
+            after: Cursor for the next page (from next_cursor)
+            before: Cursor for the previous page (from prev_cursor)
+            active: Filter on is_active
+            admin: Filter on is_admin
+            totp: Filter on totp_enabled
+            locked: Filter on an active lockout (locked_until in the future)
+            search: Username or email prefix
+
+        Returns:
+            Dict with items (list of User), next_cursor and prev_cursor
+        """
+        query = UserService._filtered(active, admin, totp, locked, search)
+        return keyset_page(
+            query,
+            User.created_at,
+            User.id,
+            clamp_per_page(per_page),
+            after=after,
+            before=before,
+        )
+
+    @staticmethod
+    def count(
+        active: bool | None = None,
+        admin: bool | None = None,
+        totp: bool | None = None,
+        locked: bool | None = None,
+        search: str | None = None,
+    ) -> int:
+        """Number of users matching the list_page() filters"""
+        query = UserService._filtered(active, admin, totp, locked, search)
+        return int(query.order_by(None).count())
+
+    @staticmethod
+    def _filtered(
+        active: bool | None,
+        admin: bool | None,
+        totp: bool | None,
+        locked: bool | None,
+        search: str | None,
+    ) -> Any:
+        """User query with the admin listing filters applied (None = any)"""
+        query = User.query
+        if active is not None:
+            query = query.filter(User.is_active.is_(active))
+        if admin is not None:
+            query = query.filter(User.is_admin.is_(admin))
+        if totp is not None:
+            query = query.filter(User.totp_enabled.is_(totp))
+        if locked is not None:
+            now = datetime.utcnow()
+            if locked:
+                query = query.filter(User.locked_until > now)
+            else:
+                query = query.filter(
+                    or_(User.locked_until.is_(None), User.locked_until <= now)
+                )
+
+        search = (search or "").strip()
+        if search:
+            # Prefix as a range (prefix <= col < successor) rather than LIKE:
+            # each side is an index range scan and the OR combines them
+            upper = search[:-1] + chr(ord(search[-1]) + 1)
+            query = query.filter(
+                or_(
+                    and_(User.username >= search, User.username < upper),
+                    and_(User.email >= search, User.email < upper),
+                )
+            )
+        return query
+
     @staticmethod
     def update(user_id: int, **kwargs: Any) -> User | None:
         """
@@ -207,11 +312,15 @@ def update(user_id: int, **kwargs: Any) -> User | None:
             if not user:
                 return None
 
+            # Drop entries under the old username/email as well
+            UserService.invalidate_cache(user)
+
             for key, value in kwargs.items():
                 if hasattr(user, key) and key != "password_hash":
                     setattr(user, key, value)
 
             db.session.commit()
+            UserService.invalidate_cache(user)
             return cast(User | None, user)
         except Exception:
             db.session.rollback()
@@ -227,6 +336,7 @@ def delete(user_id: int) -> bool:
 
             user.is_active = False
             db.session.commit()
+            UserService.invalidate_cache(user)
             return True
         except Exception:
             db.session.rollback()
@@ -249,6 +359,9 @@ def authenticate(username: str, password: str) -> User | None:
         user = User.get_by_username(username) or User.get_by_email(username)
 
         if user and user.is_active and user.check_password(password):
+            # check_password() may have upgraded an outdated hash
+            if db.session.is_modified(user):
+                db.session.commit()
             return user
         return None
 
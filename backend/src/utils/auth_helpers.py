@@ -28,6 +28,8 @@
 
 from flask import session
 
+from backend.src.services.session_store import regenerate_session
+
 
 def is_authenticated() -> bool:
     """
@@ -51,11 +53,12 @@ def get_current_user_id() -> int | None:
 
 def login_user(user_id: int) -> None:
     """
-    Log in user by setting session
+    Log in user by setting session (under a new session ID)
 
     Args:
         user_id: User ID to log in
     """
+    regenerate_session()
     session["user_id"] = user_id
     session.permanent = True  # Use permanent session (configurable timeout)
 
@@ -0,0 +1,150 @@
+"""
+------------------------------------------------------------------------------
+Purpose: Keyset pagination helpers
+Description: Opaque cursors and seek-method paging on (timestamp, id) columns
+
+File: backend/src/utils/pagination.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T16:00:00+00:00
+Last modified (Git): TBD | Commit: TBD
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+
+Notes:
+- Pages are ordered newest first: (timestamp DESC, id DESC)
+- Each page is one indexed range scan of per_page + 1 rows, whatever its depth
+- Cursors are opaque to clients (urlsafe base64 of [timestamp, id])
+------------------------------------------------------------------------------
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_, or_
+
+MAX_PER_PAGE = 100
+
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """Encode a (timestamp, id) position as an opaque cursor"""
+    raw = json.dumps([timestamp.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> tuple[datetime, int] | None:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a request argument
+
+    Returns:
+        (timestamp, id) tuple, or None if missing or malformed
+    """
+    if not cursor:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, row_id = json.loads(raw)
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (binascii.Error, ValueError, TypeError):
+        return None
+
+
+def clamp_per_page(per_page: int | None, default: int = 20) -> int:
+    """Bound a client-supplied page size to 1..MAX_PER_PAGE"""
+    if not per_page or per_page < 1:
+        return default
+    return min(per_page, MAX_PER_PAGE)
+
+
+def flag_arg(value: str | None) -> bool | None:
+    """Parse a yes/no filter ("1"/"true"/"yes", "0"/"false"/"no"; else any)"""
+    if value is None:
+        return None
+    value = value.strip().lower()
+    if value in ("1", "true", "yes"):
+        return True
+    if value in ("0", "false", "no"):
+        return False
+    return None
+
+
+def keyset_page(
+    query: Any,
+    timestamp_column: Any,
+    id_column: Any,
+    per_page: int,
+    after: str | None = None,
+    before: str | None = None,
+) -> dict[str, Any]:
+    """
+    Fetch one page of `query` with the seek method.
+
+    Args:
+        query: Filtered SQLAlchemy query (no ORDER BY / LIMIT)
+        timestamp_column: Sort column (e.g. Model.created_at)
+        id_column: Tie-breaker column (primary key)
+        per_page: Page size
+        after: Cursor of the last row of the previous page (next page)
+        before: Cursor of the first row of the following page (previous page)
+
+    Returns:
+        Dict with items, next_cursor and prev_cursor (None at either end)
+    """
+    after_key = decode_cursor(after)
+    before_key = decode_cursor(None if after_key else before)
+
+    if before_key:
+        # Walk backwards (ascending), then restore newest-first order
+        timestamp, row_id = before_key
+        query = query.filter(
+            or_(
+                timestamp_column > timestamp,
+                and_(timestamp_column == timestamp, id_column > row_id),
+            )
+        ).order_by(timestamp_column.asc(), id_column.asc())
+    else:
+        if after_key:
+            timestamp, row_id = after_key
+            query = query.filter(
+                or_(
+                    timestamp_column < timestamp,
+                    and_(timestamp_column == timestamp, id_column < row_id),
+                )
+            )
+        query = query.order_by(timestamp_column.desc(), id_column.desc())
+
+    rows = query.limit(per_page + 1).all()
+    has_more = len(rows) > per_page
+    items = rows[:per_page]
+
+    if before_key:
+        items.reverse()
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, after_key is not None
+
+    def cursor_of(row: Any) -> str:
+        return encode_cursor(
+            getattr(row, timestamp_column.key), getattr(row, id_column.key)
+        )
+
+    return {
+        "items": items,
+        "next_cursor": cursor_of(items[-1]) if items and has_next else None,
+        "prev_cursor": cursor_of(items[0]) if items and has_prev else None,
+    }
@@ -25,20 +25,32 @@
 ---
 """
 
-import pytest
+import atexit
 import os
-from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
-import tempfile
+import shutil
 import sys
+import tempfile
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 # Add backend/src to path for module imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from backend.src import create_app, db
-from backend.src.models.user import User
-from backend.src.models.settings import Settings
+# Local cache backends write to ./cache and instance/cache.mmap by default,
+# the SQLite session store to instance/sessions.db, and both are configured
+# on import: point them at a temporary directory before anything imports the app
+_STATE_TMP = tempfile.mkdtemp(prefix="xf-test-state-")
+atexit.register(shutil.rmtree, _STATE_TMP, True)
+os.environ["CACHE_DIR"] = os.path.join(_STATE_TMP, "files")
+os.environ["CACHE_MMAP_PATH"] = os.path.join(_STATE_TMP, "cache.mmap")
+os.environ["SESSION_SQLITE_PATH"] = os.path.join(_STATE_TMP, "sessions.db")
 
+# Imported after the environment above is set, hence the E402 exemptions
+from backend.src import create_app, db  # noqa: E402
+from backend.src.models.settings import Settings  # noqa: E402
+from backend.src.models.user import User  # noqa: E402
 
 # ============================================================================
 # PYTEST CONFIGURATION
@@ -465,6 +477,34 @@ def _assert():
     return _assert
 
 
+@pytest.fixture
+def max_queries():
+    """Assert a block runs at most N SQL statements (and no N+1 pattern).
+
+    Usage:
+        def test_dashboard(admin_client, max_queries):
+            with max_queries(8):
+                admin_client.get("/admin/")
+
+    Pass n_plus_one=False to allow repeated statements.
+    """
+    from contextlib import contextmanager
+
+    from backend.src.services.query_stats import count_queries
+
+    @contextmanager
+    def _max_queries(limit, n_plus_one=True):
+        with count_queries() as log:
+            yield log
+
+        statements = "\n".join(f"  {statement}" for statement in log.statements)
+        assert log.count <= limit, f"{log.count} queries (max {limit}):\n{statements}"
+        if n_plus_one:
+            assert not log.repeated(), f"Repeated statements (N+1): {log.repeated()}"
+
+    return _max_queries
+
+
 @pytest.fixture
 def create_user_with_state(_db):
     """Factory fixture for creating users with specific states.
@@ -21,22 +21,68 @@
 - 15+ test cases
 """
 
-import pytest
-import os
 import json
+import multiprocessing
+import os
 import time
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import MagicMock, Mock, patch
 
+import pytest
+from sqlalchemy.orm.exc import DetachedInstanceError
+
+from backend.src.models.admin_history import AdminHistory
+from backend.src.models.content import Content
+from backend.src.models.user import User
+from backend.src.services.cache_codec import (
+    JsonCodec,
+    ReadOnlySnapshotError,
+    get_codec,
+)
+from backend.src.services.cache_metrics import CacheMetrics, namespace_of
 from backend.src.services.cache_service import (
-    CacheService,
     CacheBackend,
-    RedisCache,
+    CacheService,
+    CircuitBreaker,
     FilesystemCache,
+    GenerationInvalidator,
+    LocalCache,
     MemoryCache,
+    MmapCache,
+    RedisCache,
 )
 
 
+def _local_service(backend: str, tmp_path: Path) -> CacheService:
+    """CacheService forced onto one of the local backends"""
+    if backend == "mmap":
+        pytest.importorskip("fcntl")
+
+    env = {
+        "CACHE_DIR": str(tmp_path / "files"),
+        "CACHE_MMAP_PATH": str(tmp_path / "cache.mmap"),
+        "CACHE_FS_SWEEP_INTERVAL": "0",
+    }
+    with (
+        patch.dict(os.environ, env),
+        patch.object(
+            CacheService, "_detect_backend", return_value=CacheBackend(backend)
+        ),
+    ):
+        return CacheService()
+
+
+def _attach_mmap(env: dict, ready, done) -> None:
+    """Child process: map the shared file, then hold it until `done`"""
+    with patch.dict(os.environ, env):
+        cache = MmapCache()
+    ready.set()
+    done.wait(10)
+    # Keep the mapping (and its attach lock) alive until released
+    cache.get("key")
+
+
 # ---- CacheService Backend Detection Tests ----
 
 
@@ -51,17 +97,36 @@ def test_backend_detection_redis(self):
 
     def test_backend_detection_filesystem(self):
         """Test Filesystem fallback when Redis unavailable"""
-        with patch.object(CacheService, '_redis_available', return_value=False):
-            with patch.object(CacheService, '_filesystem_writable', return_value=True):
-                service = CacheService()
-                assert service.backend == CacheBackend.FILESYSTEM
+        with (
+            patch.object(CacheService, '_redis_available', return_value=False),
+            patch.object(CacheService, '_mmap_available', return_value=False),
+            patch.object(CacheService, '_filesystem_writable', return_value=True),
+        ):
+            service = CacheService()
+            assert service.backend == CacheBackend.FILESYSTEM
+
+    def test_backend_detection_mmap(self, tmp_path):
+        """Test Mmap is preferred over plain files when Redis is unavailable"""
+        pytest.importorskip("fcntl")
+        env = {"CACHE_MMAP_PATH": str(tmp_path / "cache.mmap")}
+        with (
+            patch.dict(os.environ, env),
+            patch.object(CacheService, '_redis_available', return_value=False),
+        ):
+            service = CacheService()
+
+        assert service.backend == CacheBackend.MMAP
+        assert isinstance(service.client, MmapCache)
 
     def test_backend_detection_memory(self):
         """Test Memory fallback when neither Redis nor Filesystem available"""
-        with patch.object(CacheService, '_redis_available', return_value=False):
-            with patch.object(CacheService, '_filesystem_writable', return_value=False):
-                service = CacheService()
-                assert service.backend == CacheBackend.MEMORY
+        with (
+            patch.object(CacheService, '_redis_available', return_value=False),
+            patch.object(CacheService, '_mmap_available', return_value=False),
+            patch.object(CacheService, '_filesystem_writable', return_value=False),
+        ):
+            service = CacheService()
+            assert service.backend == CacheBackend.MEMORY
 
     def test_redis_available_true(self):
         """Test Redis availability check when available"""
@@ -133,7 +198,12 @@ def test_get_info(self):
 
         assert "backend" in info
         assert "info" in info
-        assert info["backend"] in [CacheBackend.REDIS, CacheBackend.FILESYSTEM, CacheBackend.MEMORY]
+        assert info["backend"] in [
+            CacheBackend.REDIS,
+            CacheBackend.MMAP,
+            CacheBackend.FILESYSTEM,
+            CacheBackend.MEMORY,
+        ]
 
 
 # ---- Redis Connection Testing ----
@@ -267,6 +337,135 @@ def test_redis_flush(self, mock_redis):
         mock_redis.flushdb.assert_called_once()
 
 
+class TestRedisCircuitBreaker:
+    """Test Redis pooling, timeouts and circuit breaker"""
+
+    @pytest.fixture
+    def mock_redis(self):
+        """Mock Redis client"""
+        with patch('redis.Redis') as mock:
+            yield mock.return_value
+
+    @pytest.fixture
+    def cache(self, mock_redis):
+        """RedisCache whose breaker opens after 3 errors (probe thread disabled)"""
+        with patch.dict(os.environ, {"CACHE_BREAKER_THRESHOLD": "3"}):
+            cache = RedisCache()
+        with patch.object(CircuitBreaker, "_start_probe"):
+            yield cache
+
+    def test_shared_blocking_pool(self):
+        """Test every client uses one bounded pool with socket timeouts"""
+        import redis
+
+        from backend.src.services.cache_service import redis_pool
+
+        with patch('redis.Redis') as mock:
+            RedisCache()
+            RedisCache()
+
+        pools = [call.kwargs["connection_pool"] for call in mock.call_args_list]
+        assert pools[0] is pools[1] is redis_pool()
+        assert isinstance(pools[0], redis.BlockingConnectionPool)
+        assert pools[0].connection_kwargs["socket_timeout"] > 0
+
+    def test_breaker_opens_after_threshold(self, cache, mock_redis):
+        """Test consecutive connection errors short-circuit Redis"""
+        import redis
+
+        mock_redis.get.side_effect = redis.ConnectionError("down")
+        for _ in range(3):
+            assert cache.get("k") is None
+
+        assert cache.breaker.is_open
+        cache.get("k")
+        assert mock_redis.get.call_count == 3
+
+    def test_command_errors_do_not_trip(self, cache, mock_redis):
+        """Test non-availability errors leave the breaker closed"""
+        import redis
+
+        mock_redis.get.side_effect = redis.ResponseError("WRONGTYPE")
+        for _ in range(5):
+            cache.get("k")
+
+        assert not cache.breaker.is_open
+
+    def test_success_resets_failure_count(self, cache, mock_redis):
+        """Test only consecutive errors count"""
+        import redis
+
+        mock_redis.get.side_effect = [redis.TimeoutError(), redis.TimeoutError(), None]
+        for _ in range(3):
+            cache.get("k")
+
+        assert cache.breaker.failures == 0
+        assert not cache.breaker.is_open
+
+    def test_memory_fallback_while_open(self, cache, mock_redis):
+        """Test values are served in-process while Redis is down"""
+        for _ in range(3):
+            cache.breaker.record_failure(Exception("down"))
+
+        cache.set("k", {"a": 1})
+        assert cache.get("k") == {"a": 1}
+        assert cache.acquire_lock("k", timeout=1) == ""
+        mock_redis.setex.assert_not_called()
+        assert cache.get_info()["breaker"]["state"] == "open"
+
+    def test_recovery_drops_keys_written_during_outage(self, cache, mock_redis):
+        """Test stale Redis copies are deleted before the breaker closes"""
+        for _ in range(3):
+            cache.breaker.record_failure(Exception("down"))
+        cache.set("user:id:1", {"a": 1})
+        cache.delete("content:id:2")
+
+        assert cache._recover() is True
+
+        mock_redis.delete.assert_called_once()
+        assert set(mock_redis.delete.call_args.args) == {"user:id:1", "content:id:2"}
+        assert cache.fallback.get("user:id:1") is None
+
+    def test_recovery_drops_keys_whose_write_failed(self, cache, mock_redis):
+        """Test a failed SETEX/pipeline leaves its keys marked for recovery"""
+        import redis
+
+        mock_redis.setex.side_effect = redis.ConnectionError("down")
+        mock_redis.pipeline.return_value.execute.side_effect = redis.TimeoutError()
+        cache.set("user:id:1", {"a": 2})
+        cache.set_many({"user:id:2": {"b": 2}})
+
+        assert cache._recover() is True
+
+        assert set(mock_redis.delete.call_args.args) == {"user:id:1", "user:id:2"}
+
+    def test_recovery_flushes_after_outage_flush(self, cache, mock_redis):
+        """Test a flush during the outage is replayed on recovery"""
+        for _ in range(3):
+            cache.breaker.record_failure(Exception("down"))
+        cache.flush()
+
+        cache._recover()
+
+        mock_redis.flushdb.assert_called_once()
+
+    def test_background_probe_closes_breaker(self):
+        """Test the probe thread closes the breaker once the probe succeeds"""
+        probe = Mock(side_effect=[False, True])
+        breaker = CircuitBreaker(probe, threshold=1, cooldown=0.01)
+
+        breaker.record_failure(Exception("down"))
+        assert not breaker.allow()
+
+        deadline = time.time() + 2
+        while breaker.is_open and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert breaker.allow()
+        assert probe.call_count == 2
+        assert breaker.trips == 1
+
+
 # ---- Filesystem Backend Tests ----
 
 
@@ -325,6 +524,228 @@ def test_filesystem_ttl_expiry(self, cache):
         assert cache.get("expiring_key") is None
 
 
+class TestFilesystemSharding:
+    """Test sharded layout, index and sweeper of FilesystemCache"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """FilesystemCache without the background sweeper thread"""
+        with patch.dict(
+            os.environ,
+            {"CACHE_DIR": str(tmp_path), "CACHE_FS_SWEEP_INTERVAL": "0"},
+        ):
+            yield FilesystemCache()
+
+    def test_entries_are_sharded(self, cache, tmp_path):
+        """Test entries land in hash-prefixed subdirectories"""
+        cache.set("key", "value")
+
+        path = cache._key_to_path("key")
+        assert path.parent.parent == tmp_path
+        assert path.parent.name == path.name[:2]
+        assert path.exists()
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_write_is_atomic(self, cache):
+        """Test no temp file survives a write, even a failing one"""
+        cache.set("key", "v1")
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            cache.set("key", "v2")
+
+        assert cache.get("key") == "v1"
+        assert not list(cache._key_to_path("key").parent.glob("*.tmp"))
+
+    def test_info_comes_from_index(self, cache):
+        """Test get_info counts entries without scanning directories"""
+        cache.set_many({"a": 1, "b": 2, "c": 3})
+        cache.delete("b")
+
+        with patch.object(Path, "glob", side_effect=AssertionError("scan")):
+            info = cache.get_info()
+
+        assert info["entries"] == 2
+        assert info["size_bytes"] > 0
+
+    def test_sweep_removes_expired(self, cache):
+        """Test the sweeper deletes expired files never read again"""
+        cache.set("old", "x", ttl=-1)
+        cache.set("new", "y", ttl=300)
+
+        stats = cache.sweep(force=True)
+
+        assert stats["expired"] == 1
+        assert not cache._key_to_path("old").exists()
+        assert cache.get("new") == "y"
+
+    def test_sweep_evicts_least_recently_used(self, cache):
+        """Test eviction above the entry cap drops the coldest entries"""
+        for i in range(10):
+            cache.set(f"k{i}", i)
+            time.sleep(0.001)
+        cache.get("k0")  # k0 becomes the most recently used
+        cache.max_entries = 5
+
+        stats = cache.sweep(force=True)
+
+        assert stats["evicted"] == 6  # down to 90% of the cap
+        assert cache.get("k0") == 0
+        assert cache.get("k1") is None
+        assert cache.get_info()["entries"] == 4
+
+    def test_sweep_lease_single_worker(self, cache, tmp_path):
+        """Test only one worker sweeps per interval"""
+        with patch.dict(
+            os.environ,
+            {"CACHE_DIR": str(tmp_path), "CACHE_FS_SWEEP_INTERVAL": "60"},
+        ):
+            first = FilesystemCache()
+            second = FilesystemCache()
+
+        assert first.sweep() is not None
+        assert second.sweep() is None
+
+    def test_flush_clears_shards_and_legacy_files(self, cache, tmp_path):
+        """Test flush removes sharded and pre-sharding flat files"""
+        cache.set("key", "value")
+        (tmp_path / ("0" * 64 + ".json")).write_text("{}")
+
+        cache.flush()
+
+        assert cache.get("key") is None
+        assert not list(tmp_path.glob("*.json"))
+        assert cache.get_info()["entries"] == 0
+
+
+class TestMmapCache:
+    """Test MmapCache shared hash-table backend"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Small MmapCache in a temp file"""
+        pytest.importorskip("fcntl")
+        env = {
+            "CACHE_MMAP_PATH": str(tmp_path / "cache.mmap"),
+            "CACHE_MMAP_SLOTS": "64",
+            "CACHE_MMAP_SLOT_SIZE": "512",
+        }
+        with patch.dict(os.environ, env):
+            yield MmapCache()
+
+    def test_mmap_set_get_delete(self, cache):
+        """Test basic operations"""
+        cache.set("key", {"data": [1, 2]})
+        assert cache.get("key") == {"data": [1, 2]}
+
+        cache.delete("key")
+        assert cache.get("key") is None
+
+    def test_mmap_shared_between_instances(self, cache, tmp_path):
+        """Test a second mapping (another worker) sees the same entries"""
+        cache.set("key", "value")
+
+        with patch.dict(
+            os.environ,
+            {
+                "CACHE_MMAP_PATH": str(tmp_path / "cache.mmap"),
+                "CACHE_MMAP_SLOTS": "64",
+                "CACHE_MMAP_SLOT_SIZE": "512",
+            },
+        ):
+            other = MmapCache()
+
+        assert other.get("key") == "value"
+        other.delete("key")
+        assert cache.get("key") is None
+
+    def test_mmap_ttl_expiry(self, cache):
+        """Test expired slots are not returned"""
+        cache.set("key", "value", ttl=-1)
+        assert cache.get("key") is None
+
+    def test_mmap_oversized_value_skipped(self, cache):
+        """Test values larger than a slot are not cached"""
+        cache.set("key", "x" * 1000)
+        assert cache.get("key") is None
+
+    def test_mmap_oversized_value_drops_previous(self, cache):
+        """Test an oversized update does not leave the old value behind"""
+        cache.set("key", "small")
+        cache.set("key", "x" * 10000)
+
+        assert cache.get("key") is None
+        assert cache.get_info()["entries"] == 0
+
+    def test_mmap_evicts_within_set(self, cache):
+        """Test a full table evicts slots instead of growing"""
+        for i in range(200):
+            cache.set(f"k{i}", i)
+
+        info = cache.get_info()
+        assert info["entries"] <= info["slots"] == 64
+        assert info["evictions"] > 0
+        assert cache.get("k199") == 199
+
+    def test_mmap_geometry_change_reinitializes(self, cache, tmp_path):
+        """Test a file with another layout is reset, not misread"""
+        cache.set("key", "value")
+
+        with patch.dict(
+            os.environ,
+            {
+                "CACHE_MMAP_PATH": str(tmp_path / "cache.mmap"),
+                "CACHE_MMAP_SLOTS": "128",
+                "CACHE_MMAP_SLOT_SIZE": "512",
+            },
+        ):
+            resized = MmapCache()
+
+        assert resized.get("key") is None
+        assert resized.get_info()["slots"] == 128
+        # Replaced, not truncated: the old mapping stays readable
+        assert cache.get("key") == "value"
+
+    def test_mmap_geometry_change_refused_while_in_use(self, cache, tmp_path):
+        """Test a file attached by another process is not replaced under it"""
+        env = {
+            "CACHE_MMAP_PATH": str(tmp_path / "cache.mmap"),
+            "CACHE_MMAP_SLOTS": "64",
+            "CACHE_MMAP_SLOT_SIZE": "512",
+        }
+        context = multiprocessing.get_context("fork")
+        ready, done = context.Event(), context.Event()
+        holder = context.Process(target=_attach_mmap, args=(env, ready, done))
+        holder.start()
+        try:
+            assert ready.wait(10)
+            env["CACHE_MMAP_SLOTS"] = "128"
+            with patch.dict(os.environ, env), pytest.raises(RuntimeError):
+                MmapCache()
+        finally:
+            done.set()
+            holder.join(10)
+
+        assert cache.get_info()["slots"] == 64
+
+    def test_mmap_flush(self, cache):
+        """Test flush empties every slot"""
+        cache.set_many({"a": 1, "b": 2})
+        cache.flush()
+
+        assert cache.get_many(["a", "b"]) == {}
+        assert cache.get_info()["entries"] == 0
+
+    def test_mmap_flush_locks_each_set(self, cache):
+        """Test flush clears each set under its exclusive lock"""
+        with patch.object(cache, "_locked", wraps=cache._locked) as locked:
+            cache.flush()
+
+        assert [call.args[0] for call in locked.call_args_list] == list(
+            range(cache.groups)
+        )
+        assert all(call.kwargs["exclusive"] for call in locked.call_args_list)
+
+
 # ---- Memory Backend Tests ----
 
 
@@ -391,3 +812,791 @@ def test_memory_info(self, cache):
         assert info["entries"] == 2
         assert "warning" in info
 
+
+
+class TestMemoryCacheBounded:
+    """Test MemoryCache limits, eviction policies, reaper and stats"""
+
+    def _cache(self, **env):
+        """MemoryCache with env overrides (no reaper thread)"""
+        env = {"CACHE_MEMORY_REAP_INTERVAL": "0", **env}
+        with patch.dict(os.environ, env):
+            return MemoryCache()
+
+    def test_lru_eviction_by_entries(self):
+        """Test least recently used entry is evicted when full"""
+        cache = self._cache(CACHE_MEMORY_MAX_ENTRIES="2")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_info()["evictions"] == 1
+
+    def test_lfu_eviction_keeps_hot_keys(self):
+        """Test least frequently used entry is evicted under LFU"""
+        cache = self._cache(CACHE_MEMORY_MAX_ENTRIES="2", CACHE_MEMORY_POLICY="lfu")
+        cache.set("hot", 1)
+        cache.set("cold", 2)
+        for _ in range(3):
+            cache.get("hot")
+        cache.get("cold")
+        cache.set("new", 3)
+
+        assert cache.get("cold") is None
+        assert cache.get("hot") == 1
+        assert cache.get_info()["policy"] == "lfu"
+
+    def test_eviction_by_bytes(self):
+        """Test total encoded size stays under max bytes"""
+        cache = self._cache(CACHE_MEMORY_MAX_BYTES="200")
+        for i in range(10):
+            cache.set(f"k{i}", "x" * 40)
+
+        info = cache.get_info()
+        assert info["size_bytes"] <= 200
+        assert info["evictions"] > 0
+        assert cache.get("k9") == "x" * 40
+
+    def test_reaper_removes_unread_expired_entries(self):
+        """Test expired entries are reclaimed without being read"""
+        cache = self._cache()
+        cache.set("old", 1, ttl=-1)
+        cache.set("old", 2, ttl=-1)  # stale heap item must be skipped
+        cache.set("live", 3, ttl=300)
+
+        assert cache.reap() == 1
+        info = cache.get_info()
+        assert info["entries"] == 1
+        assert info["expirations"] == 1
+
+    def test_stats(self):
+        """Test hit/miss/set counters and hit ratio"""
+        cache = self._cache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        info = cache.get_info()
+        assert (info["hits"], info["misses"], info["sets"]) == (1, 1, 1)
+        assert info["hit_ratio"] == 0.5
+
+    def test_thread_safety(self):
+        """Test concurrent writers keep size accounting consistent"""
+        import threading
+
+        cache = self._cache(CACHE_MEMORY_MAX_ENTRIES="50")
+
+        def writer(n):
+            for i in range(200):
+                cache.set(f"{n}:{i % 80}", i)
+                cache.get(f"{n}:{(i * 7) % 80}")
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.get_info()
+        assert info["entries"] == 50
+        assert info["size_bytes"] == sum(entry[2] for entry in cache._entries.values())
+
+
+# ---- Local (L1) Tier Tests ----
+
+
+class TestLocalCache:
+    """Test LocalCache (in-process LRU tier)"""
+
+    def test_local_set_get(self):
+        """Test setting and getting value"""
+        cache = LocalCache()
+        cache.set("key", {"data": "value"})
+
+        assert cache.get("key") == {"data": "value"}
+        assert cache.get("missing") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_local_lru_eviction_by_entries(self):
+        """Test least recently used entry is evicted when full"""
+        cache = LocalCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_local_eviction_by_bytes(self):
+        """Test size limit evicts entries and rejects oversized values"""
+        cache = LocalCache(max_bytes=50)
+        cache.set("a", "x" * 30)
+        cache.set("b", "y" * 30)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == "y" * 30
+
+        cache.set("huge", "z" * 100)
+        assert cache.get("huge") is None
+        assert cache.get_info()["size_bytes"] <= 50
+
+    def test_local_ttl_capped(self):
+        """Test entries expire after the L1 ttl even with longer backend ttl"""
+        cache = LocalCache(ttl=1)
+        cache.set("key", "value", ttl=300)
+
+        assert cache.get("key") == "value"
+        time.sleep(1.1)
+        assert cache.get("key") is None
+
+    def test_local_info(self):
+        """Test L1 statistics"""
+        cache = LocalCache()
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("other")
+
+        info = cache.get_info()
+
+        assert info["type"] == "local"
+        assert info["entries"] == 1
+        assert info["hit_ratio"] == 0.5
+
+
+class TestCacheServiceLocalTier:
+    """Test CacheService with the L1 tier enabled"""
+
+    @pytest.fixture
+    def services(self, tmp_path):
+        """Two services (simulated workers) sharing one filesystem cache"""
+        env = {"CACHE_DIR": str(tmp_path), "CACHE_L1_ENABLED": "true"}
+        with (
+            patch.dict(os.environ, env),
+            patch.object(CacheService, "_redis_available", return_value=False),
+            patch.object(CacheService, "_mmap_available", return_value=False),
+        ):
+            yield CacheService(), CacheService()
+
+    def test_l1_disabled_by_default(self):
+        """Test L1 tier is opt-in"""
+        with patch.dict(os.environ, {"CACHE_L1_ENABLED": "false"}):
+            service = CacheService()
+
+        assert service.local is None
+
+    def test_l1_serves_repeated_reads(self, services):
+        """Test second read is served from L1 without touching the backend"""
+        service, _ = services
+        service.set("user:id:1", {"id": 1})
+
+        assert service.get("user:id:1") == {"id": 1}
+        with patch.object(service.client, "get") as backend_get:
+            assert service.get("user:id:1") == {"id": 1}
+            backend_get.assert_not_called()
+
+        assert service.get_info()["local"]["hits"] == 1
+
+    def test_l1_delete_invalidates_other_workers(self, services):
+        """Test a delete in one worker drops the entry from another worker's L1"""
+        worker_a, worker_b = services
+        worker_a.set("user:id:1", {"id": 1})
+        assert worker_b.get("user:id:1") == {"id": 1}
+
+        worker_a.delete("user:id:1")
+
+        assert worker_b.get("user:id:1") is None
+
+    def test_l1_overwrite_invalidates_other_workers(self, services):
+        """Test set and set_many drop the old value from another worker's L1"""
+        worker_a, worker_b = services
+        worker_a.set("user:id:1", {"id": 1})
+        worker_a.set("user:id:2", {"id": 2})
+        assert worker_b.get("user:id:1") == {"id": 1}
+        assert worker_b.get("user:id:2") == {"id": 2}
+
+        worker_a.set("user:id:1", {"id": 1, "v": 2})
+        assert worker_b.get("user:id:1") == {"id": 1, "v": 2}
+
+        worker_a.set_many({"user:id:2": {"id": 2, "v": 2}})
+        assert worker_b.get("user:id:2") == {"id": 2, "v": 2}
+
+    def test_generation_invalidator_detects_bump(self, tmp_path):
+        """Test generation change clears the local tier"""
+        local = LocalCache()
+        invalidator = GenerationInvalidator(tmp_path, local)
+        local.set("key", "value")
+
+        GenerationInvalidator(tmp_path, LocalCache()).publish(["key"])
+        invalidator.sync()
+
+        assert local.get("key") is None
+
+    def test_l1_hit_survives_other_workers_fill(self, services):
+        """Test a get_or_compute fill elsewhere leaves other L1 entries alone"""
+        worker_a, worker_b = services
+        worker_a.set("user:id:1", {"id": 1})
+        assert worker_b.get("user:id:1") == {"id": 1}
+
+        worker_a.get_or_compute("user:id:2", lambda: {"id": 2})
+        worker_a.tag_versions(["content"])
+
+        with patch.object(worker_b.client, "get") as backend_get:
+            assert worker_b.get("user:id:1") == {"id": 1}
+            backend_get.assert_not_called()
+
+    def test_l1_writer_keeps_its_own_entries(self, services):
+        """Test a worker's own overwrite only drops the key it wrote"""
+        worker_a, _ = services
+        worker_a.set("user:id:1", {"id": 1})
+        assert worker_a.get("user:id:1") == {"id": 1}
+
+        worker_a.set("user:id:2", {"id": 2})
+
+        with patch.object(worker_a.client, "get") as backend_get:
+            assert worker_a.get("user:id:1") == {"id": 1}
+            backend_get.assert_not_called()
+
+    def test_generation_publish_detects_concurrent_bump(self, tmp_path):
+        """Test a writer still drops L1 when another worker bumped first"""
+        local = LocalCache()
+        invalidator = GenerationInvalidator(tmp_path, local)
+        invalidator.publish(["key"])
+        local.set("key", "value")
+
+        GenerationInvalidator(tmp_path, LocalCache()).publish(["other"])
+        invalidator.publish(["key2"])
+
+        assert local.get("key") is None
+
+    def test_generation_file_is_truncated(self, tmp_path):
+        """Test the generation file stays bounded and rotation clears L1"""
+        local = LocalCache()
+        invalidator = GenerationInvalidator(tmp_path, local)
+        invalidator.MAX_SIZE = 3
+        invalidator.publish(None)
+        invalidator.publish(None)
+        local.set("key", "value")
+
+        invalidator.publish(None)
+
+        assert invalidator.path.stat().st_size == 0
+        assert local.get("key") is None
+
+
+# ---- Batched Multi-Key API Tests ----
+
+
+class TestBatchedAPI:
+    """Test get_many / set_many / delete_many on every backend"""
+
+    @pytest.fixture(params=["memory", "filesystem"])
+    def cache(self, request, tmp_path):
+        """Local backends sharing the same contract"""
+        if request.param == "memory":
+            return MemoryCache()
+        with patch.dict(os.environ, {"CACHE_DIR": str(tmp_path)}):
+            return FilesystemCache()
+
+    def test_set_get_delete_many(self, cache):
+        """Test round trip of several keys"""
+        cache.set_many({"a": 1, "b": {"x": 2}}, ttl=300)
+
+        assert cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": {"x": 2}}
+
+        cache.delete_many(["a", "missing"])
+
+        assert cache.get_many(["a", "b"]) == {"b": {"x": 2}}
+
+    def test_get_many_skips_expired(self, cache):
+        """Test expired entries are not returned"""
+        cache.set_many({"a": 1}, ttl=-1)
+
+        assert cache.get_many(["a"]) == {}
+
+    def test_redis_get_many_uses_mget(self):
+        """Test RedisCache.get_many maps onto a single MGET"""
+        with patch('redis.Redis') as mock:
+            mock.return_value.mget.return_value = ['{"id": 1}', None]
+
+            cache = RedisCache()
+            result = cache.get_many(["a", "b"])
+
+        mock.return_value.mget.assert_called_once_with(["a", "b"])
+        assert result == {"a": {"id": 1}}
+
+    def test_redis_set_many_pipelined(self):
+        """Test RedisCache.set_many uses one pipeline of SETEX"""
+        with patch('redis.Redis') as mock:
+            pipe = mock.return_value.pipeline.return_value
+
+            cache = RedisCache()
+            cache.set_many({"a": 1, "b": 2}, ttl=60)
+
+        assert pipe.setex.call_count == 2
+        pipe.execute.assert_called_once()
+
+    def test_redis_delete_many_single_del(self):
+        """Test RedisCache.delete_many issues a single DEL"""
+        with patch('redis.Redis') as mock:
+            cache = RedisCache()
+            cache.delete_many(["a", "b", "c"])
+
+        mock.return_value.delete.assert_called_once_with("a", "b", "c")
+
+    def test_service_get_many_with_local_tier(self, tmp_path):
+        """Test CacheService.get_many fills L1 and only fetches L1 misses"""
+        env = {"CACHE_DIR": str(tmp_path), "CACHE_L1_ENABLED": "true"}
+        with (
+            patch.dict(os.environ, env),
+            patch.object(CacheService, "_redis_available", return_value=False),
+            patch.object(CacheService, "_mmap_available", return_value=False),
+        ):
+            service = CacheService()
+
+        service.set_many({"a": 1, "b": 2})
+        assert service.get_many(["a", "b"]) == {"a": 1, "b": 2}
+
+        with patch.object(service.client, "get_many", return_value={}) as backend:
+            assert service.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+            backend.assert_called_once_with(["c"])
+
+
+# ---- Tag Invalidation Tests ----
+
+
+class TestTagInvalidation:
+    """Test versioned-namespace tag invalidation"""
+
+    @pytest.fixture(params=["memory", "filesystem", "mmap"])
+    def service(self, request, tmp_path):
+        """CacheService on each local backend"""
+        yield _local_service(request.param, tmp_path)
+
+    def test_tagged_set_get(self, service):
+        """Test tagged entries read back with the same tags"""
+        service.set("content:all:1", {"ids": [1]}, tags=["content"])
+
+        assert service.get("content:all:1", tags=["content"]) == {"ids": [1]}
+        assert service.get("content:all:1") is None
+
+    def test_invalidate_tags_drops_all_tagged_entries(self, service):
+        """Test one call drops every entry under the tag only"""
+        service.set("content:all:1", "page1", tags=["content"])
+        service.set("content:all:2", "page2", tags=["content"])
+        service.set("user:id:1", "user")
+
+        service.invalidate_tags(["content"])
+
+        assert service.get("content:all:1", tags=["content"]) is None
+        assert service.get("content:all:2", tags=["content"]) is None
+        assert service.get("user:id:1") == "user"
+
+    def test_invalidate_is_constant_time(self, service):
+        """Test invalidation touches only the tag key, never scans"""
+        for page in range(50):
+            service.set(f"content:all:{page}", page, tags=["content"])
+
+        with patch.object(service.client, "delete_many") as delete_many:
+            service.invalidate_tags(["content"])
+
+        delete_many.assert_called_once_with(["tag:content"])
+
+
+# ---- Codec & Model Snapshot Tests ----
+
+
+class TestCacheCodec:
+    """Test value codecs and ORM model rehydration"""
+
+    @pytest.fixture
+    def user(self):
+        """Transient user with credentials set"""
+        user = User(
+            id=7,
+            username="alice",
+            email="alice@example.com",
+            is_admin=True,
+            created_at=datetime(2025, 1, 2, 3, 4, 5),
+        )
+        user.set_password("secret123")
+        # Dummy value written by this test, not a credential
+        user.totp_secret = "BASE32SECRET"  # noqa: S105
+        return user
+
+    def test_json_round_trip(self):
+        """Test primitives and datetimes survive a round trip"""
+        codec = JsonCodec()
+        value = {"a": [1, 2.5, None, True], "when": datetime(2025, 1, 1, 12, 0)}
+
+        assert codec.loads(codec.dumps(value)) == value
+
+    def test_legacy_json_payloads_decode(self):
+        """Test plain JSON written by older releases is still readable"""
+        codec = get_codec()
+
+        assert codec.loads('{"data": "value"}') == {"data": "value"}
+        assert codec.loads(b'{"data": "value"}') == {"data": "value"}
+
+    def test_user_rehydrated_as_snapshot(self, user):
+        """Test cached user comes back as a User without credentials"""
+        codec = JsonCodec()
+        payload = codec.dumps(user)
+        snapshot = codec.loads(payload)
+
+        assert b"secret123" not in payload
+        assert b"BASE32SECRET" not in payload
+        assert isinstance(snapshot, User)
+        assert snapshot.username == "alice"
+        assert snapshot.is_admin is True
+        assert snapshot.created_at == datetime(2025, 1, 2, 3, 4, 5)
+        with pytest.raises(DetachedInstanceError):
+            _ = snapshot.password_hash
+
+    def test_snapshot_is_read_only(self, user):
+        """Test snapshots reject writes and session attachment"""
+        codec = JsonCodec()
+        snapshot = codec.loads(codec.dumps(user))
+
+        with pytest.raises(ReadOnlySnapshotError):
+            snapshot.username = "mallory"
+
+        from sqlalchemy.orm import Session
+
+        with pytest.raises(ReadOnlySnapshotError):
+            Session().add(snapshot)
+
+        # Live instances are unaffected
+        user.username = "bob"
+        assert user.username == "bob"
+
+    def test_content_snapshot_includes_author(self, user):
+        """Test content author relation is cached alongside the row"""
+        codec = JsonCodec()
+        content = Content(id=3, title="Hello", body="World", author=user)
+
+        snapshot = codec.loads(codec.dumps(content))
+
+        assert isinstance(snapshot, Content)
+        assert snapshot.title == "Hello"
+        assert isinstance(snapshot.author, User)
+        assert snapshot.author.username == "alice"
+
+    def test_unregistered_model_not_cached(self):
+        """Test models outside the registry are skipped, never half-cached"""
+        cache = MemoryCache(JsonCodec())
+        cache.set("history:1", AdminHistory(admin_id=1, action="x"))
+
+        assert cache.get("history:1") is None
+
+    @pytest.mark.parametrize("backend", ["memory", "filesystem"])
+    def test_backends_store_users(self, backend, user, tmp_path):
+        """Test users are now cacheable on every backend"""
+        with patch.dict(os.environ, {"CACHE_DIR": str(tmp_path)}):
+            cache = MemoryCache() if backend == "memory" else FilesystemCache()
+
+        cache.set("user:id:7", user)
+        cached = cache.get("user:id:7")
+
+        assert isinstance(cached, User)
+        assert cached.email == "alice@example.com"
+
+    def test_msgpack_round_trip(self, user):
+        """Test binary codec when msgpack is installed"""
+        pytest.importorskip("msgpack")
+        codec = get_codec("msgpack")
+        value = {"user": user, "when": datetime(2025, 1, 1), "raw": b"\x00\x01"}
+
+        payload = codec.dumps(value)
+        decoded = JsonCodec().loads(payload)
+
+        assert payload[:1] == b"\x01"
+        assert decoded["user"].username == "alice"
+        assert decoded["when"] == datetime(2025, 1, 1)
+        assert decoded["raw"] == b"\x00\x01"
+
+    def test_json_codec_forced(self):
+        """Test CACHE_CODEC=json selects the JSON codec"""
+        with patch.dict(os.environ, {"CACHE_CODEC": "json"}):
+            assert get_codec().name == "json"
+
+
+# ---- Read-Through / Stampede Protection Tests ----
+
+
+class TestGetOrCompute:
+    """Test get_or_compute single-flight and early refresh"""
+
+    @pytest.fixture(params=["memory", "filesystem", "mmap"])
+    def service(self, request, tmp_path):
+        """CacheService on each local backend"""
+        yield _local_service(request.param, tmp_path)
+
+    def test_computes_once_then_serves_cache(self, service):
+        """Test value is computed on miss and served from cache afterwards"""
+        fn = Mock(return_value={"id": 1})
+
+        assert service.get_or_compute("user:id:1", fn, ttl=60) == {"id": 1}
+        assert service.get_or_compute("user:id:1", fn, ttl=60) == {"id": 1}
+        fn.assert_called_once()
+
+    def test_none_is_not_cached(self, service):
+        """Test missing rows are looked up again next time"""
+        fn = Mock(return_value=None)
+
+        service.get_or_compute("user:id:404", fn)
+        service.get_or_compute("user:id:404", fn)
+
+        assert fn.call_count == 2
+
+    def test_concurrent_misses_compute_once(self, service):
+        """Test a burst of threads on a cold key triggers a single compute"""
+        import threading
+
+        calls = []
+
+        def slow_query():
+            calls.append(1)
+            time.sleep(0.2)
+            return "row"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(service.get_or_compute("hot", slow_query))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == ["row"] * 8
+
+    def test_early_refresh_near_expiry(self, service):
+        """Test an entry close to expiry may be refreshed before it expires"""
+        service.get_or_compute("page", lambda: "old", ttl=60)
+        entry = service._get_entry("page")
+        entry["delta"] = 120.0
+        service.set("page", entry, ttl=60)
+
+        with patch("random.random", return_value=0.99):
+            assert service.get_or_compute("page", lambda: "new", ttl=60) == "new"
+
+    def test_early_refresh_skipped_when_lock_held(self, service):
+        """Test callers keep the current value while another worker refreshes"""
+        service.get_or_compute("page", lambda: "old", ttl=60)
+        entry = service._get_entry("page")
+        entry["delta"] = 120.0
+        service.set("page", entry, ttl=60)
+
+        fn = Mock(return_value="new")
+        with (
+            patch.object(service.client, "acquire_lock", return_value=None),
+            patch("random.random", return_value=0.99),
+        ):
+            assert service.get_or_compute("page", fn, ttl=60) == "old"
+
+        fn.assert_not_called()
+
+    def test_filesystem_lock_exclusive_and_stale_takeover(self, tmp_path):
+        """Test lock files exclude other workers until they go stale"""
+        with patch.dict(os.environ, {"CACHE_DIR": str(tmp_path)}):
+            cache = FilesystemCache()
+
+        token = cache.acquire_lock("k", timeout=10)
+        assert token
+        assert cache.acquire_lock("k", timeout=10) is None
+
+        # Abandoned by a crashed worker
+        assert cache.acquire_lock("k", timeout=0) not in (None, "")
+
+        cache.release_lock("k", token)  # stale token: must not release
+        assert cache.acquire_lock("k", timeout=10) is None
+
+    def test_redis_lock_uses_set_nx(self):
+        """Test Redis compute lock maps onto SET NX PX"""
+        with patch('redis.Redis') as mock:
+            mock.return_value.set.return_value = True
+            cache = RedisCache()
+            token = cache.acquire_lock("k", timeout=2)
+
+        mock.return_value.set.assert_called_once_with(
+            "lock:k", token, nx=True, px=2000
+        )
+
+
+class TestCounters:
+    """Test atomic fixed-window counters"""
+
+    @pytest.fixture(params=["memory", "filesystem", "mmap"])
+    def service(self, request, tmp_path):
+        """CacheService on each local backend"""
+        yield _local_service(request.param, tmp_path)
+
+    def test_concurrent_increments_are_all_counted(self, service):
+        """Test increments from many threads never overwrite each other"""
+        import threading
+
+        def hammer():
+            for _ in range(25):
+                service.incr("login:attempts:1", ttl=60)
+
+        threads = [threading.Thread(target=hammer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert service.counter("login:attempts:1") == 100
+        assert service.incr("login:attempts:1", 5, ttl=60) == 105
+        assert service.counter("login:attempts:2") == 0
+
+    def test_window_is_fixed(self, service):
+        """Test later increments do not extend the window"""
+        assert service.incr("c", ttl=60) == 1
+        start = time.time()
+
+        clock = "backend.src.services.cache_service.time.time"
+        with patch(clock, return_value=start + 59):
+            assert service.incr("c", ttl=60) == 2
+        with patch(clock, return_value=start + 61):
+            assert service.counter("c") == 0
+            assert service.incr("c", ttl=60) == 1
+
+    def test_redis_uses_incrby(self):
+        """Test Redis counts server-side in one script call"""
+        with patch('redis.Redis') as mock:
+            mock.return_value.eval.return_value = 3
+            mock.return_value.get.return_value = b"3"
+            cache = RedisCache()
+            service = CacheService.__new__(CacheService)
+            service.client, service.metrics = cache, CacheMetrics()
+
+            assert service.incr("login:attempts:1", ttl=900) == 3
+            assert service.counter("login:attempts:1") == 3
+
+        args = mock.return_value.eval.call_args[0]
+        assert "incrby" in args[0]
+        assert args[1:] == (1, "login:attempts:1", 1, 900)
+
+
+class TestCacheMetrics:
+    """Test per-namespace cache metrics"""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        return _local_service("memory", tmp_path)
+
+    def test_namespace_of(self):
+        """Test namespace is the key prefix before the first colon"""
+        assert namespace_of("user:id:1") == "user"
+        assert namespace_of("content:all:post|content=ab12") == "content"
+        assert namespace_of("plain") == "default"
+
+    def test_hits_misses_and_sets_counted(self, service):
+        """Test get/set are counted per namespace with a hit ratio"""
+        service.set("user:id:1", {"a": 1})
+        service.get("user:id:1")
+        service.get("user:id:1")
+        service.get("user:id:2")
+        service.get_many(["content:id:1"])
+
+        metrics = service.get_metrics()
+        assert metrics["user"]["sets"] == 1
+        assert metrics["user"]["hits"] == 2
+        assert metrics["user"]["misses"] == 1
+        assert metrics["user"]["hit_ratio"] == pytest.approx(2 / 3, abs=1e-3)
+        assert metrics["user"]["latency"]["get"]["count"] == 3
+        assert metrics["content"]["misses"] == 1
+
+    def test_get_or_compute_counts_computes(self, service):
+        """Test read-through misses record a compute and its latency"""
+        service.get_or_compute("stats:dashboard", lambda: 42, ttl=60)
+        service.get_or_compute("stats:dashboard", lambda: 42, ttl=60)
+
+        metrics = service.get_metrics()["stats"]
+        assert metrics["computes"] == 1
+        assert metrics["hits"] >= 1
+        assert metrics["latency"]["compute"]["count"] == 1
+
+    @pytest.mark.parametrize("backend", ["memory", "filesystem", "mmap"])
+    def test_serialization_failures_counted(self, backend, tmp_path):
+        """Test non-serializable values are counted and logged, not cached"""
+        service = _local_service(backend, tmp_path)
+
+        with patch.object(service.client.logger, "warning") as warning:
+            service.set("user:obj", object())
+
+        assert service.get("user:obj") is None
+        assert service.get_metrics()["user"]["serialization_failures"] == 1
+        warning.assert_called_once()
+
+    @pytest.mark.parametrize("backend", ["memory", "filesystem", "mmap"])
+    def test_serialization_failure_drops_previous_value(self, backend, tmp_path):
+        """Test a value that cannot be encoded does not keep the stale one"""
+        service = _local_service(backend, tmp_path)
+        service.set("user:obj", {"v": 1})
+        service.set_many({"user:a": 1, "user:b": 2})
+
+        service.set("user:obj", object())
+        service.set_many({"user:a": object(), "user:b": 3})
+
+        assert service.get("user:obj") is None
+        assert service.get_many(["user:a", "user:b"]) == {"user:b": 3}
+
+    def test_redis_set_serialization_failure_counted(self):
+        """Test RedisCache.set no longer swallows encode errors silently"""
+        with patch('redis.Redis') as mock:
+            cache = RedisCache()
+            cache.metrics = CacheMetrics(enabled=True)
+            cache.set("user:obj", object())
+
+        mock.return_value.setex.assert_not_called()
+        mock.return_value.delete.assert_called_once_with("user:obj")
+        assert cache.metrics.snapshot()["user"]["serialization_failures"] == 1
+
+    def test_namespace_cardinality_capped(self):
+        """Test unexpected prefixes are folded into "other" past the cap"""
+        metrics = CacheMetrics(enabled=True)
+        for index in range(CacheMetrics.MAX_NAMESPACES + 10):
+            metrics.incr(f"ns{index}:key", "hits")
+
+        snapshot = metrics.snapshot()
+        assert len(snapshot) == CacheMetrics.MAX_NAMESPACES + 1
+        assert snapshot["other"]["hits"] == 10
+
+    def test_disabled_metrics_record_nothing(self):
+        """Test CACHE_METRICS_ENABLED=false turns recording off"""
+        with patch.dict(os.environ, {"CACHE_METRICS_ENABLED": "false"}):
+            metrics = CacheMetrics()
+        metrics.incr("user:id:1", "hits")
+        metrics.observe("user:id:1", "get", 0.001)
+        assert metrics.snapshot() == {}
+
+    def test_render_prometheus(self):
+        """Test Prometheus text exposition (counters, ratio, histogram)"""
+        metrics = CacheMetrics(enabled=True)
+        metrics.incr("user:id:1", "hits", 3)
+        metrics.incr("user:id:2", "misses")
+        metrics.observe("user:id:1", "get", 0.0003)
+        metrics.observe("user:id:1", "get", 2.0)
+
+        text = metrics.render_prometheus()
+        assert 'xf_cache_hits_total{namespace="user"} 3' in text
+        assert 'xf_cache_hit_ratio{namespace="user"} 0.750000' in text
+        assert "# TYPE xf_cache_operation_duration_seconds histogram" in text
+        labels = 'namespace="user",operation="get"'
+        bucket = "xf_cache_operation_duration_seconds_bucket"
+        assert f'{bucket}{{{labels},le="0.0005"}} 1' in text
+        assert f'{bucket}{{{labels},le="+Inf"}} 2' in text
+        assert f"xf_cache_operation_duration_seconds_count{{{labels}}} 2" in text
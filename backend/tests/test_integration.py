@@ -26,6 +26,7 @@
 from backend.src.models.user import User
 from backend.src.models.settings import Settings
 from backend.src.extensions import db
+from backend.src.services.login_tracker import login_tracker
 from datetime import datetime, timedelta
 
 
@@ -110,17 +111,16 @@ def test_failed_login_increments_attempts(self, client, app):
             db.session.add(user)
             db.session.commit()
 
-            initial_attempts = user.login_attempts
+            initial_attempts = login_tracker.attempts(user.id)
 
             # Failed login
-            client.post('/auth/login', data={
+            client.post('/auth/login', json={
                 'username': 'locktest',
                 'password': 'WrongPassword'
             })
 
-            # Refresh user from database
-            db.session.refresh(user)
-            assert user.login_attempts > initial_attempts
+            # Counted in the cache until the account locks
+            assert login_tracker.attempts(user.id) > initial_attempts
 
 
 class TestEmailVerificationIntegration:
@@ -0,0 +1,196 @@
+"""
+Purpose: Tests for login bookkeeping
+Description: Cache counters, lockout without per-failure writes, buffered last_login
+
+File: backend/tests/test_login_tracker.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T23:55:00+00:00
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+"""
+
+import pytest
+
+from backend.src.app import create_app, db
+from backend.src.models.user import User
+from backend.src.services import login_tracker as tracker_module
+from backend.src.services.cache_service import cache_service
+from backend.src.services.login_tracker import login_tracker
+from backend.src.services.query_stats import count_queries
+from backend.src.services.rate_limiter import limiter
+from backend.src.services.user_service import UserService
+
+
+@pytest.fixture
+def app(monkeypatch):
+    """Create application for testing; logins stay buffered until flush()"""
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    cache_service.flush()
+    monkeypatch.setattr(login_tracker, "_start_flusher", lambda: None)
+    # Lockout needs more tries than the login limit
+    monkeypatch.setattr(limiter, "enabled", False)
+    login_tracker._pending.clear()
+
+    with app.app_context():
+        db.create_all()
+        UserService.create("member", "member@example.com", "password123")
+
+    # Requests run outside an app context (see test_principal)
+    yield app
+
+    login_tracker._pending.clear()
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def users_writes(log):
+    """Statements of a log that write the users table"""
+    return [
+        statement
+        for statement in log.statements
+        if statement.startswith("UPDATE users")
+    ]
+
+
+def post_login(client, password):
+    """POST the JSON login form"""
+    return client.post(
+        "/auth/login", json={"username": "member", "password": password}
+    )
+
+
+# ---- Failed logins ----
+
+
+def test_failures_lock_account_with_one_write(app):
+    """Test failures are counted in the cache and only the lockout hits the row"""
+    client = app.test_client()
+
+    with count_queries() as log:
+        for _ in range(tracker_module.LOGIN_MAX_ATTEMPTS - 1):
+            assert post_login(client, "wrong").status_code == 401
+    assert users_writes(log) == []
+    with app.app_context():
+        user = User.get_by_username("member")
+        assert login_tracker.attempts(user.id) == tracker_module.LOGIN_MAX_ATTEMPTS - 1
+
+    with count_queries() as log:
+        assert post_login(client, "wrong").status_code == 401
+    assert len(users_writes(log)) == 1
+
+    with app.app_context():
+        user = User.get_by_username("member")
+        assert user.is_locked()
+        assert user.login_attempts == tracker_module.LOGIN_MAX_ATTEMPTS
+        assert login_tracker.attempts(user.id) == 0
+
+    response = post_login(client, "password123")
+    assert response.status_code == 403
+    assert "verrouillé" in response.get_json()["error"]
+
+
+# ---- Successful logins ----
+
+
+def test_last_login_is_written_behind(app):
+    """Test logins update nothing in the request and flush in one batch"""
+    client = app.test_client()
+    post_login(client, "wrong")
+
+    with count_queries() as log:
+        assert post_login(client, "password123").status_code == 200
+    assert users_writes(log) == []
+
+    with app.app_context():
+        user_id = User.get_by_username("member").id
+        assert login_tracker.attempts(user_id) == 0
+        assert db.session.get(User, user_id).last_login is None
+
+        with count_queries() as log:
+            assert login_tracker.flush() == 1
+        assert len(users_writes(log)) == 1
+
+        db.session.expire_all()
+        user = db.session.get(User, user_id)
+        assert user.last_login is not None
+        assert user.last_login_ip == "127.0.0.1"
+        assert user.login_attempts == 0
+
+
+def test_flush_batches_users_and_clears_lock(app):
+    """Test one flush writes every buffered user, lockouts included"""
+    with app.app_context():
+        other = UserService.create("other", "other@example.com", "password123")
+        member = User.get_by_username("member")
+        member.login_attempts = 5
+        db.session.commit()
+
+        login_tracker.record_login(member.id, "10.0.0.1")
+        login_tracker.record_login(other.id)
+        login_tracker.record_login(member.id, "10.0.0.2")
+
+        assert login_tracker.flush() == 2
+        assert login_tracker.flush() == 0
+
+        db.session.expire_all()
+        assert db.session.get(User, member.id).last_login_ip == "10.0.0.2"
+        assert db.session.get(User, member.id).login_attempts == 0
+        assert db.session.get(User, other.id).last_login is not None
+
+
+def test_flush_keeps_lockout_recorded_after_login(app):
+    """Test a buffered login does not unlock an account locked since"""
+    with app.app_context():
+        member = User.get_by_username("member")
+        login_tracker.record_login(member.id, "10.0.0.1")
+
+        for _ in range(tracker_module.LOGIN_MAX_ATTEMPTS):
+            login_tracker.record_failure(member)
+        assert member.is_locked()
+
+        assert login_tracker.flush() == 1
+
+        db.session.expire_all()
+        member = db.session.get(User, member.id)
+        assert member.last_login_ip == "10.0.0.1"
+        assert member.is_locked()
+        assert member.login_attempts == tracker_module.LOGIN_MAX_ATTEMPTS
+
+
+def test_flush_leaves_the_request_session_alone(app):
+    """Test a flush in an app context does not commit the caller's session"""
+    with app.app_context():
+        member = User.get_by_username("member")
+        login_tracker.record_login(member.id, "10.0.0.1")
+        member.username = "renamed"
+
+        assert login_tracker.flush() == 1
+
+        db.session.rollback()
+        member = db.session.get(User, member.id)
+        assert member.username == "member"
+        assert member.last_login_ip == "10.0.0.1"
+
+
+def test_inline_write_without_interval(app, monkeypatch):
+    """Test LAST_LOGIN_FLUSH_INTERVAL=0 writes during the login"""
+    monkeypatch.setattr(login_tracker, "interval", 0)
+    client = app.test_client()
+
+    assert post_login(client, "password123").status_code == 200
+
+    with app.app_context():
+        assert User.get_by_username("member").last_login is not None
+        assert login_tracker._pending == {}
@@ -0,0 +1,193 @@
+"""
+Purpose: Tests for the password hashing service
+Description: Process pool hashing, cost normalization, rehash on login,
+    benchmark command
+
+File: backend/tests/test_password_hasher.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T21:00:00+00:00
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+"""
+
+import os
+import time
+
+import pytest
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, generate_password_hash
+
+from backend.src.app import create_app, db
+from backend.src.models.user import User
+from backend.src.services.cache_service import cache_service
+from backend.src.services.password_hasher import (
+    PasswordHasher,
+    _warm_up,
+    normalize_method,
+    password_hasher,
+)
+from backend.src.services.totp_service import TOTPService
+from backend.src.services.user_service import UserService
+
+CHEAP_METHOD = "pbkdf2:sha256:1000"
+
+
+@pytest.fixture
+def app():
+    """Create application for testing"""
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    cache_service.flush()
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def hasher():
+    """Hasher with its own two-process pool"""
+    hasher = PasswordHasher(method=CHEAP_METHOD, workers=2)
+    hasher.start()
+    yield hasher
+    hasher.shutdown()
+
+
+def test_normalize_method_spells_out_defaults():
+    """Test bare method names compare equal to the parameters werkzeug stores"""
+    assert normalize_method("scrypt") == "scrypt:32768:8:1"
+    assert normalize_method("pbkdf2") == f"pbkdf2:sha256:{DEFAULT_PBKDF2_ITERATIONS}"
+    assert (
+        normalize_method("pbkdf2:sha512")
+        == f"pbkdf2:sha512:{DEFAULT_PBKDF2_ITERATIONS}"
+    )
+    assert normalize_method("scrypt:16384:8:1") == "scrypt:16384:8:1"
+
+
+def test_pool_hashes_off_process(hasher):
+    """Test hashing runs in worker processes and verifies in this one"""
+    assert hasher._pool is not None
+    assert hasher._run(_warm_up) != os.getpid()
+
+    pwhash = hasher.hash("secret")
+    assert pwhash.startswith(CHEAP_METHOD + "$")
+    assert hasher.verify(pwhash, "secret")
+    assert not hasher.verify(pwhash, "wrong")
+
+    hashes = hasher.hash_many(["a", "b", "c"])
+    assert all(hasher.verify(h, v) for h, v in zip(hashes, "abc", strict=True))
+
+
+def _sleep_then_pid(seconds):
+    """Slow job reporting the process it ran in"""
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def test_timeout_falls_back_inline(monkeypatch):
+    """Test a job the pool does not finish in time is run in this process"""
+    hasher = PasswordHasher(method=CHEAP_METHOD, workers=1)
+    hasher.start()
+    try:
+        hasher.timeout = 0.05
+        assert hasher._run(_sleep_then_pid, 0.3) == os.getpid()
+
+        # The pool stays in use once the late job is done
+        hasher.timeout = 5
+        assert hasher._run(_warm_up) != os.getpid()
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork()")
+def test_forked_child_starts_its_own_pool(hasher):
+    """Test a pool inherited through fork is replaced instead of hanging"""
+    parent_pool = hasher._pool
+    pid = os.fork()
+    if pid == 0:  # Child: exit code reports the outcome
+        ok = False
+        try:
+            ok = hasher.verify(hasher.hash("secret"), "secret")
+            ok = ok and hasher._pool is not parent_pool and hasher._pid == os.getpid()
+            hasher.shutdown()
+        finally:
+            os._exit(0 if ok else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert hasher._pool is parent_pool
+
+
+def test_inline_without_workers():
+    """Test workers=0 hashes in the calling thread"""
+    hasher = PasswordHasher(method=CHEAP_METHOD, workers=0)
+
+    assert hasher.start() is False
+    assert hasher.verify(hasher.hash("secret"), "secret")
+
+
+def test_needs_rehash(hasher):
+    """Test hashes made with another method or cost are flagged"""
+    assert not hasher.needs_rehash(hasher.hash("secret"))
+    for method in ("pbkdf2:sha256:2000", "scrypt:16384:8:1"):
+        assert hasher.needs_rehash(generate_password_hash("secret", method=method))
+
+
+def test_login_rehashes_outdated_hash(app, monkeypatch):
+    """Test a successful login upgrades a hash made with an old cost"""
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+        user.password_hash = generate_password_hash("password123", method=CHEAP_METHOD)
+        db.session.commit()
+
+        assert UserService.authenticate("testuser", "wrong") is None
+        assert db.session.get(User, user.id).password_hash.startswith(CHEAP_METHOD)
+
+        assert UserService.authenticate("testuser", "password123") is not None
+        db.session.expire_all()
+        stored = db.session.get(User, user.id).password_hash
+        assert stored.startswith(password_hasher.method + "$")
+        assert db.session.get(User, user.id).check_password("password123")
+
+
+def test_backup_codes_hashed_by_pool(app):
+    """Test backup codes hashed in a batch still verify one by one"""
+    with app.app_context():
+        codes, codes_json = TOTPService.generate_backup_codes(count=3)
+        user = User(username="u", email="u@example.com", backup_codes=codes_json)
+
+        assert TOTPService.verify_backup_code(user, codes[1].lower())
+        assert not TOTPService.verify_backup_code(user, codes[1])
+
+
+def test_benchmark_command(app, monkeypatch):
+    """Test the benchmark recommends a method under the target latency"""
+    from backend.src.cli import password
+
+    monkeypatch.setattr(
+        password, "SCRYPT_CANDIDATES", ["scrypt:1024:8:1", "scrypt:2048:8:1"]
+    )
+    monkeypatch.setattr(password, "PBKDF2_CANDIDATES", [CHEAP_METHOD])
+
+    result = app.test_cli_runner().invoke(
+        args=["benchmark-password-hash", "--target-ms", "1000", "--rounds", "1"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "PASSWORD_HASH_METHOD=scrypt:2048:8:1" in result.output
+
+    result = app.test_cli_runner().invoke(
+        args=["benchmark-password-hash", "--target-ms", "0", "--rounds", "1"]
+    )
+    assert result.exit_code != 0
@@ -0,0 +1,178 @@
+"""
+Purpose: Tests for the session principal
+Description: Lean user loader, auth_version invalidation, admin/auth decorators
+
+File: backend/tests/test_principal.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T23:00:00+00:00
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+"""
+
+import pytest
+from flask import jsonify
+from flask_login import current_user
+
+from backend.src.app import create_app, db
+from backend.src.decorators import require_admin, require_authenticated
+from backend.src.models.user import User
+from backend.src.services.cache_service import cache_service
+from backend.src.services.principal_service import (
+    SESSION_KEY,
+    Principal,
+    PrincipalService,
+)
+from backend.src.services.query_stats import count_queries
+from backend.src.services.user_service import UserService
+
+
+@pytest.fixture
+def app():
+    """Create application for testing, with an admin and a member"""
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    cache_service.flush()
+
+    @app.route("/_test/whoami")
+    @require_authenticated
+    def whoami():
+        return jsonify(
+            id=current_user.id,
+            username=current_user.username,
+            role=current_user.role,
+        )
+
+    @app.route("/_test/admin-only")
+    @require_admin
+    def admin_only():
+        return jsonify(ok=True)
+
+    with app.app_context():
+        db.create_all()
+        UserService.create("boss", "boss@example.com", "password123", is_admin=True)
+        UserService.create("member", "member@example.com", "password123")
+
+    # Requests run outside an app context: one pushed here would share
+    # flask.g (and Flask-Login's cached user) across requests
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def login(app, username):
+    """Client logged in through the JSON login route"""
+    client = app.test_client()
+    response = client.post(
+        "/auth/login", json={"username": username, "password": "password123"}
+    )
+    assert response.status_code == 200, response.get_json()
+    return client
+
+
+def users_queries(log):
+    """Statements of a log that read the users table"""
+    return [statement for statement in log.statements if "FROM users" in statement]
+
+
+def test_authenticated_requests_skip_users_table(app):
+    """Test only the first request after login reads the principal columns"""
+    client = login(app, "member")
+
+    with count_queries() as first:
+        assert client.get("/_test/whoami").get_json()["username"] == "member"
+    assert len(users_queries(first)) == 1
+    assert "password_hash" not in users_queries(first)[0]
+
+    with count_queries() as log:
+        for _ in range(3):
+            assert client.get("/_test/whoami").get_json() == {
+                "id": 2,
+                "username": "member",
+                "role": "member",
+            }
+    assert users_queries(log) == []
+
+
+def test_role_change_reloads_principal(app):
+    """Test a committed role change applies on the next request"""
+    client = login(app, "member")
+    assert client.get("/_test/admin-only").status_code == 403
+
+    with app.app_context():
+        user = User.get_by_username("member")
+        version = user.auth_version
+        user.is_admin = True
+        db.session.commit()
+        assert user.auth_version == version + 1
+
+    with count_queries() as log:
+        assert client.get("/_test/admin-only").status_code == 200
+    assert len(users_queries(log)) == 1
+
+
+def test_unrelated_update_keeps_version(app):
+    """Test updates outside the principal fields do not invalidate sessions"""
+    with app.app_context():
+        user = User.get_by_username("member")
+        version = user.auth_version
+        user.last_login_ip = "127.0.0.1"
+        db.session.commit()
+
+        assert user.auth_version == version
+
+
+def test_deactivated_user_is_logged_out(app):
+    """Test deactivation ends existing sessions"""
+    client = login(app, "member")
+    assert client.get("/_test/whoami").status_code == 200
+
+    with app.app_context():
+        User.get_by_username("member").is_active = False
+        db.session.commit()
+
+    assert client.get("/_test/whoami").status_code == 401
+
+
+def test_admin_decorator_checks_session_user(app):
+    """Test admin routes need a logged-in admin, not just an admin account"""
+    assert app.test_client().get("/_test/admin-only").status_code == 403
+    assert login(app, "boss").get("/_test/admin-only").status_code == 200
+
+
+def test_logout_forgets_principal(app):
+    """Test the cached principal leaves the session on logout"""
+    client = login(app, "member")
+    client.get("/_test/whoami")
+    with client.session_transaction() as sess:
+        assert sess[SESSION_KEY]["username"] == "member"
+
+    client.post("/auth/logout", json={})
+
+    with client.session_transaction() as sess:
+        assert SESSION_KEY not in sess
+    assert client.get("/_test/whoami").status_code == 401
+
+
+def test_principal_falls_back_to_user_row(app):
+    """Test attributes outside the principal load the full row"""
+    with app.app_context():
+        user = User.get_by_username("member")
+        principal = Principal(
+            user.id, user.username, user.role, False, True, user.auth_version
+        )
+
+        assert principal.email == "member@example.com"
+        assert principal == user
+        assert PrincipalService.version_key(user.id) == f"principal:version:{user.id}"
@@ -0,0 +1,364 @@
+"""
+Purpose: Query-plan regression tests for hot queries
+Description: EXPLAIN the statements issued by services and check they use their index
+
+File: backend/tests/test_query_plans.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T18:00:00+00:00
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+Notes:
+- Statements are captured from the real service calls (do_orm_execute), then
+  compiled for each database and EXPLAINed on a scratch schema
+- SQLite always runs; PostgreSQL and MySQL run when TEST_POSTGRES_URL /
+  TEST_MYSQL_URL point to a disposable database (tables are created and dropped)
+"""
+
+import importlib.util
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+
+from backend.src.app import create_app, db
+from backend.src.models.admin_history import AdminHistory
+from backend.src.models.content import Content
+from backend.src.models.user import User
+from backend.src.services.admin_service import AdminService
+from backend.src.services.cache_service import cache_service
+from backend.src.services.content_service import ContentService
+from backend.src.services.user_service import UserService
+from backend.src.utils.pagination import encode_cursor
+
+SERVER_URLS = {
+    "postgresql": "TEST_POSTGRES_URL",
+    "mysql": "TEST_MYSQL_URL",
+}
+
+CURSOR = encode_cursor(datetime(2026, 1, 1), 1000)
+
+# (name, service call, statement marker, expected index, ordered by the index)
+HOT_QUERIES = [
+    (
+        "content_by_type_status",
+        lambda: ContentService.list_page(content_type="post", status="published"),
+        "LIMIT",
+        "ix_content_type_status_created_at",
+        True,
+    ),
+    (
+        "content_by_type_status_next_page",
+        lambda: ContentService.list_page(
+            content_type="post", status="published", after=CURSOR
+        ),
+        "LIMIT",
+        "ix_content_type_status_created_at",
+        True,
+    ),
+    (
+        "content_by_status",
+        lambda: ContentService.list_page(status="published"),
+        "LIMIT",
+        "ix_content_status_created_at",
+        True,
+    ),
+    (
+        "content_by_author",
+        lambda: ContentService.get_by_author(1),
+        "LIMIT",
+        "ix_content_author_created_at",
+        True,
+    ),
+    (
+        "content_count_by_type_status",
+        lambda: ContentService.count(content_type="post", status="published"),
+        "count(",
+        "ix_content_type_status_created_at",
+        False,
+    ),
+    (
+        "users_page",
+        lambda: UserService.list_page(active=True),
+        "LIMIT",
+        "ix_users_created_at_id",
+        True,
+    ),
+    (
+        "users_search",
+        lambda: UserService.list_page(search="user1"),
+        "LIMIT",
+        "ix_users_username",
+        False,
+    ),
+    (
+        "users_search_count",
+        lambda: UserService.count(search="user1"),
+        "count(",
+        "ix_users_email",
+        False,
+    ),
+    (
+        "admin_history_recent",
+        lambda: AdminService.get_history(),
+        "LIMIT",
+        "ix_admin_history_timestamp",
+        True,
+    ),
+    (
+        "admin_history_by_admin",
+        lambda: AdminService.get_history(admin_id=1),
+        "LIMIT",
+        "ix_admin_history_admin_timestamp",
+        True,
+    ),
+]
+
+
+@pytest.fixture
+def app():
+    """Create application for testing"""
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    cache_service.flush()
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture(params=["sqlite", "postgresql", "mysql"])
+def plan_engine(request):
+    """Scratch database with the application schema"""
+    if request.param == "sqlite":
+        engine = create_engine("sqlite://")
+    else:
+        url = os.getenv(SERVER_URLS[request.param])
+        if not url:
+            pytest.skip(f"{SERVER_URLS[request.param]} not set")
+        engine = create_engine(url)
+
+    db.metadata.create_all(engine)
+    if request.param != "sqlite":
+        _seed(engine)
+    yield engine
+    db.metadata.drop_all(engine)
+    engine.dispose()
+
+
+def _seed(engine):
+    """Give server planners realistic row counts and statistics"""
+    now = datetime(2026, 1, 1)
+    with engine.begin() as connection:
+        connection.execute(
+            User.__table__.insert(),
+            [
+                {
+                    "username": f"user{i}",
+                    "email": f"user{i}@example.com",
+                    "password_hash": "x",
+                    "created_at": now - timedelta(minutes=i),
+                }
+                for i in range(500)
+            ],
+        )
+        connection.execute(
+            Content.__table__.insert(),
+            [
+                {
+                    "title": f"Post {i}",
+                    "body": "Body",
+                    "author_id": i % 50 + 1,
+                    "type": ("post", "page", "article")[i % 3],
+                    "status": ("draft", "published", "archived")[i % 3 - 1],
+                    "created_at": now - timedelta(minutes=i),
+                }
+                for i in range(5000)
+            ],
+        )
+        connection.execute(
+            AdminHistory.__table__.insert(),
+            [
+                {
+                    "admin_id": i % 5 + 1,
+                    "action": "user_update",
+                    "timestamp": now - timedelta(minutes=i),
+                }
+                for i in range(2000)
+            ],
+        )
+
+        if engine.dialect.name == "postgresql":
+            connection.execute(text("ANALYZE"))
+        else:
+            connection.execute(text("ANALYZE TABLE users, content, admin_history"))
+
+
+def _capture(call, marker):
+    """Run a service call and return the first ORM statement containing `marker`"""
+    statements = []
+
+    def before_orm_execute(orm_execute_state):
+        statements.append(orm_execute_state.statement)
+
+    cache_service.flush()
+    event.listen(db.session, "do_orm_execute", before_orm_execute)
+    try:
+        call()
+    finally:
+        event.remove(db.session, "do_orm_execute", before_orm_execute)
+
+    sqlite_dialect = db.engine.dialect
+    for statement in statements:
+        if marker in str(statement.compile(dialect=sqlite_dialect)):
+            return statement
+    raise AssertionError(
+        f"No statement with {marker!r} among {len(statements)} executed"
+    )
+
+
+def _walk(node):
+    """Yield every dict nested in a JSON plan"""
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            yield from _walk(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _walk(value)
+
+
+def _explain(engine, statement):
+    """
+    EXPLAIN one statement on `engine`.
+
+    Returns:
+        (set of index names used, whether rows are sorted outside an index)
+    """
+    sql = str(
+        statement.compile(
+            dialect=engine.dialect, compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    with engine.connect() as connection:
+        if engine.dialect.name == "sqlite":
+            rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+            details = [row[3] for row in rows]
+            indexes = {
+                word
+                for detail in details
+                for word in detail.replace("(", " ").split()
+                if word.startswith("ix_")
+            }
+            sorted_outside_index = any(
+                "TEMP B-TREE FOR" in detail and "ORDER BY" in detail
+                for detail in details
+            )
+            return indexes, sorted_outside_index
+
+        if engine.dialect.name == "postgresql":
+            # Tiny tables favour sequential scans; we check the index is usable
+            connection.exec_driver_sql("SET enable_seqscan = off")
+            plan = connection.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {sql}"
+            ).scalar()
+            nodes = list(_walk(plan if isinstance(plan, list) else json.loads(plan)))
+            return (
+                {node["Index Name"] for node in nodes if "Index Name" in node},
+                any(node.get("Node Type") == "Sort" for node in nodes),
+            )
+
+        plan = json.loads(
+            connection.exec_driver_sql(f"EXPLAIN FORMAT=JSON {sql}").scalar()
+        )
+        nodes = list(_walk(plan))
+        return (
+            {node["key"] for node in nodes if isinstance(node.get("key"), str)},
+            any(node.get("using_filesort") for node in nodes),
+        )
+
+
+class TestHotQueryPlans:
+    """Each hot query must be served by its index (and ordered by it)"""
+
+    @pytest.mark.parametrize(
+        "name,call,marker,index,ordered",
+        HOT_QUERIES,
+        ids=[query[0] for query in HOT_QUERIES],
+    )
+    def test_uses_index(self, app, plan_engine, name, call, marker, index, ordered):
+        """Test the statement behind a hot query uses the expected index"""
+        statement = _capture(call, marker)
+
+        indexes, sorted_outside_index = _explain(plan_engine, statement)
+
+        used = sorted(indexes) or "no index"
+        assert index in indexes, f"{name}: expected {index}, plan used {used}"
+        if ordered:
+            assert not sorted_outside_index, f"{name}: rows sorted after the scan"
+
+
+class TestCompositeIndexMigration:
+    """Test the composite index migration on a database created before it"""
+
+    def _migration(self):
+        """Load the migration module from migrations/versions"""
+        versions = Path(__file__).resolve().parents[2] / "migrations" / "versions"
+        path = next(versions.glob("*_composite_indexes_for_hot_queries.py"))
+        spec = importlib.util.spec_from_file_location("composite_indexes", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_upgrade_and_downgrade(self):
+        """Test upgrade swaps single-column indexes for composites, and back"""
+        from alembic.migration import MigrationContext
+        from alembic.operations import Operations
+
+        migration = self._migration()
+        engine = create_engine("sqlite://")
+        db.metadata.create_all(engine)
+
+        with engine.begin() as connection:
+            # Pre-migration layout
+            for name, _table, _columns in migration.COMPOSITE_INDEXES:
+                connection.exec_driver_sql(f"DROP INDEX {name}")
+            for name, table, columns in migration.REDUNDANT_INDEXES:
+                connection.exec_driver_sql(
+                    f"CREATE INDEX {name} ON {table} ({', '.join(columns)})"
+                )
+
+            with Operations.context(MigrationContext.configure(connection)):
+                migration.upgrade()
+                content_indexes = {
+                    ix["name"] for ix in inspect(connection).get_indexes("content")
+                }
+                assert "ix_content_type_status_created_at" in content_indexes
+                assert "ix_content_type" not in content_indexes
+
+                # Idempotent on databases created by db.create_all()
+                migration.upgrade()
+
+                migration.downgrade()
+                content_indexes = {
+                    ix["name"] for ix in inspect(connection).get_indexes("content")
+                }
+                assert "ix_content_type" in content_indexes
+                assert "ix_content_type_status_created_at" not in content_indexes
+
+        engine.dispose()
@@ -0,0 +1,150 @@
+"""
+Purpose: Tests for SQL query instrumentation
+Description: Statement counts, Server-Timing header, N+1 and slow-query logs,
+    max_queries fixture
+
+File: backend/tests/test_query_stats.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T20:00:00+00:00
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+"""
+
+import logging
+
+import pytest
+from flask import jsonify
+
+from backend.src.app import create_app, db
+from backend.src.models.content import Content
+from backend.src.services import query_stats
+from backend.src.services.cache_service import cache_service
+from backend.src.services.query_stats import count_queries, statement_shape
+from backend.src.services.user_service import UserService
+
+AUTHORS = 6
+
+
+@pytest.fixture
+def app():
+    """Create application for testing, with one post per author"""
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app.config["QUERY_STATS_ENABLED"] = True
+    cache_service.flush()
+
+    @app.route("/_test/authors")
+    def authors():
+        # Lazy-loads each post's author: one SELECT per row
+        items = Content.query.order_by(Content.id).all()
+        return jsonify([item.author.username for item in items])
+
+    with app.app_context():
+        db.create_all()
+        for i in range(AUTHORS):
+            user = UserService.create(
+                f"author{i}", f"author{i}@example.com", "password123"
+            )
+            db.session.add(Content(title=f"Post {i}", body="Body", author_id=user.id))
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    """Test client"""
+    return app.test_client()
+
+
+def test_statement_shape_collapses_parameters():
+    """Test IN lists and literals do not make statements look different"""
+    assert statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?)") == statement_shape(
+        "SELECT * FROM t WHERE id IN (?, ?)"
+    )
+    assert (
+        statement_shape("SELECT * FROM t WHERE id = 1 LIMIT 10")
+        == "SELECT * FROM t WHERE id = ? LIMIT ?"
+    )
+    assert statement_shape("SELECT 'a''b'") == "SELECT ?"
+
+
+def test_count_queries(app):
+    """Test statements are counted and timed inside the block only"""
+    with app.app_context():
+        with count_queries() as log:
+            Content.query.all()
+            Content.query.count()
+        Content.query.all()
+
+        assert log.count == 2
+        assert log.duration > 0
+        assert len(log.shapes) == 2
+
+
+def test_server_timing_header(client):
+    """Test responses carry db time and statement count when enabled"""
+    response = client.get("/_test/authors")
+
+    header = response.headers["Server-Timing"]
+    assert header.startswith("db;dur=")
+    assert f'desc="{1 + AUTHORS} queries"' in header
+    assert "app;dur=" in header
+
+
+def test_server_timing_disabled(app, client):
+    """Test instrumentation stays off unless QUERY_STATS_ENABLED"""
+    app.config["QUERY_STATS_ENABLED"] = False
+
+    assert "Server-Timing" not in client.get("/_test/authors").headers
+
+
+def test_n_plus_one_logged(client, caplog):
+    """Test a statement repeated once per row is reported"""
+    with caplog.at_level(logging.WARNING, logger=query_stats.__name__):
+        client.get("/_test/authors")
+
+    warnings = [
+        record.getMessage()
+        for record in caplog.records
+        if "N+1" in record.getMessage()
+    ]
+    assert len(warnings) == 1
+    assert f"/_test/authors: {AUTHORS} x SELECT" in warnings[0]
+
+
+def test_slow_queries_logged(client, caplog, monkeypatch):
+    """Test statements over SLOW_QUERY_MS are sampled into the log"""
+    monkeypatch.setattr(query_stats, "SLOW_QUERY_MS", 0.0)
+
+    with caplog.at_level(logging.WARNING, logger=query_stats.__name__):
+        client.get("/_test/authors")
+
+    slow = [record for record in caplog.records if "Slow query" in record.getMessage()]
+    assert len(slow) == query_stats.SLOW_QUERY_SAMPLES
+
+
+def test_max_queries_fixture(client, max_queries):
+    """Test the fixture passes within budget and fails on excess or N+1"""
+    with max_queries(2):
+        client.get("/api/data/stats")
+
+    with (
+        pytest.raises(AssertionError, match="queries \\(max 1\\)"),
+        max_queries(1),
+    ):
+        client.get("/_test/authors")
+
+    with pytest.raises(AssertionError, match="N\\+1"), max_queries(50):
+        client.get("/_test/authors")
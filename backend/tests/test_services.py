@@ -24,8 +24,10 @@
 import pytest
 
 from backend.src.app import create_app, db
+from backend.src.services.cache_service import cache_service
 from backend.src.services.content_service import ContentService
 from backend.src.services.preferences_service import PreferencesService
+from backend.src.services.stats_service import StatsService
 from backend.src.services.user_service import UserService
 
 
@@ -36,6 +38,9 @@ def app():
     app.config["TESTING"] = True
     app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
 
+    # Cached pages/rows from a previous test must not leak into this one
+    cache_service.flush()
+
     with app.app_context():
         db.create_all()
         yield app
@@ -141,6 +146,116 @@ def test_user_service_delete(app):
         assert not deleted_user.is_active
 
 
+def test_user_service_get_by_id_served_from_cache(app):
+    """Test repeated lookups return a cached read-only snapshot"""
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+
+        first = UserService.get_by_id(user.id)
+        second = UserService.get_by_id(user.id)
+
+        assert first.username == second.username == "testuser"
+        assert second.__dict__.get("_cache_snapshot") is True
+
+
+def test_user_service_update_invalidates_cache(app):
+    """Test cached lookups see updates immediately"""
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+        UserService.get_by_username("testuser")
+
+        UserService.update(user.id, username="renamed")
+
+        assert UserService.get_by_username("testuser") is None
+        assert UserService.get_by_id(user.id).username == "renamed"
+
+
+def _create_users(count):
+    """Create users sharing one created_at, so pages rely on the id tie-breaker"""
+    from datetime import datetime
+
+    created_at = datetime(2026, 1, 1, 12, 0, 0)
+    users = [
+        UserService.create(f"user{i:02d}", f"user{i:02d}@example.com", "pw")
+        for i in range(count)
+    ]
+    for user in users:
+        user.created_at = created_at
+    db.session.commit()
+    return users
+
+
+def test_user_service_list_page_walks_all_users(app):
+    """Test keyset pages cover every user once, forward and backward"""
+    with app.app_context():
+        users = _create_users(7)
+
+        seen = []
+        pages = []
+        cursor = None
+        while True:
+            page = UserService.list_page(per_page=3, after=cursor)
+            pages.append(page)
+            seen.extend(user.id for user in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == sorted((user.id for user in users), reverse=True)
+        assert [len(page["items"]) for page in pages] == [3, 3, 1]
+        assert pages[0]["prev_cursor"] is None
+
+        back = UserService.list_page(per_page=3, before=pages[2]["prev_cursor"])
+        assert [u.id for u in back["items"]] == [u.id for u in pages[1]["items"]]
+        back = UserService.list_page(per_page=3, before=back["prev_cursor"])
+        assert [u.id for u in back["items"]] == [u.id for u in pages[0]["items"]]
+        assert back["prev_cursor"] is None
+
+
+def test_user_service_list_page_filters_in_sql(app):
+    """Test active/admin/2FA/locked filters and prefix search"""
+    from datetime import datetime, timedelta
+
+    with app.app_context():
+        alice, bob, carol, admin = _create_users(4)
+        alice.username, alice.email = "alice", "alice@example.com"
+        bob.is_active = False
+        carol.totp_enabled = True
+        carol.locked_until = datetime.utcnow() + timedelta(minutes=5)
+        admin.is_admin = True
+        db.session.commit()
+
+        def ids(**kwargs):
+            return {user.id for user in UserService.list_page(**kwargs)["items"]}
+
+        assert ids(active=False) == {bob.id}
+        assert ids(admin=True) == {admin.id}
+        assert ids(totp=True) == {carol.id}
+        assert ids(locked=True) == {carol.id}
+        assert ids(locked=False) == {alice.id, bob.id, admin.id}
+        assert ids(search="ali") == {alice.id}
+        assert ids(search="user0") == {bob.id, carol.id, admin.id}
+        assert ids(search="%") == set()
+        assert ids(search="alice@") == {alice.id}
+        assert ids(search="user0_") == set()
+
+        # Counts use the same filters (header of the admin list)
+        assert UserService.count() == 4
+        assert UserService.count(locked=False) == 3
+        assert UserService.count(active=True, search="user0") == 2
+
+
+def test_user_service_list_page_bad_cursor_is_first_page(app):
+    """Test a malformed cursor falls back to the first page"""
+    with app.app_context():
+        _create_users(2)
+
+        page = UserService.list_page(per_page=1, after="not-a-cursor")
+
+        assert page["items"][0].username == "user01"
+        assert page["next_cursor"] is not None
+
+
 # ---- PreferencesService Tests ----
 
 
@@ -263,6 +378,62 @@ def test_content_service_search(app):
         assert items[0].title == "Python Tutorial"
 
 
+def test_content_service_search_ranks_title_over_body(app):
+    """Test full-text search covers the body and ranks title matches first"""
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+
+        body_only = ContentService.create(
+            "Cooking", "A note on caching strategies", user.id
+        )
+        in_title = ContentService.create("Caching in Flask", "Intro", user.id)
+        ContentService.create(
+            "Unrelated", "Nothing here", user.id, content_type="page"
+        )
+
+        items, total = ContentService.search("cach")
+
+        assert total == 2
+        assert [item.id for item in items] == [in_title.id, body_only.id]
+        assert ContentService.search("cach", content_type="page") == ([], 0)
+        assert ContentService.search('"*) OR (') == ([], 0)
+
+
+def test_content_service_search_index_follows_writes(app):
+    """Test create/update/delete keep the index current"""
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+        content = ContentService.create("Draft", "First body", user.id)
+
+        ContentService.update(content.id, body="Rewritten about databases")
+        assert ContentService.search("first")[1] == 0
+        assert ContentService.search("databases")[1] == 1
+
+        ContentService.delete(content.id)
+        assert ContentService.search("databases")[1] == 0
+
+
+def test_search_rebuild_command(app):
+    """Test the rebuild command repopulates a missing or stale index"""
+    from sqlalchemy import text
+
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+        ContentService.create("Indexed later", "Body", user.id)
+        db.session.execute(text("DROP TABLE content_fts"))
+        db.session.commit()
+        app.extensions.pop("search_index", None)
+
+        # Without an index, search falls back to LIKE
+        assert ContentService.search("later")[1] == 1
+
+        result = app.test_cli_runner().invoke(args=["rebuild-search-index"])
+
+        assert result.exit_code == 0
+        assert "1" in result.output
+        assert ContentService.search("later")[1] == 1
+
+
 def test_content_service_get_by_author(app):
     """Test getting content by author"""
     with app.app_context():
@@ -277,3 +448,259 @@ def test_content_service_get_by_author(app):
 
         assert total == 2
         assert all(item.author_id == user1.id for item in items)
+
+
+def test_content_service_get_all_cached_page(app):
+    """Test cached listing page is re-hydrated into Content objects"""
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+
+        for i in range(3):
+            ContentService.create(f"Post {i}", f"Body {i}", user.id)
+
+        first_items, first_total = ContentService.get_all(page=1, per_page=2)
+        items, total = ContentService.get_all(page=1, per_page=2)
+
+        assert total == first_total == 3
+        assert [item.id for item in items] == [item.id for item in first_items]
+        assert all(item.author.username == "testuser" for item in items)
+
+
+def test_content_service_create_invalidates_cached_pages(app):
+    """Test creating content drops cached listing pages"""
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+        ContentService.create("Post 1", "Body 1", user.id)
+
+        _, total_before = ContentService.get_all()
+        ContentService.create("Post 2", "Body 2", user.id)
+        items, total = ContentService.get_all()
+
+        assert total_before == 1
+        assert total == 2
+        assert len(items) == 2
+
+
+def _count_selects(app):
+    """Collect SELECT COUNT statements run against the app's engine"""
+    from sqlalchemy import event
+
+    statements = []
+
+    def before_execute(conn, cursor, statement, *args):
+        if "count(" in statement.lower():
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_execute)
+    return statements, lambda: event.remove(
+        db.engine, "before_cursor_execute", before_execute
+    )
+
+
+def test_content_service_list_page_cursors(app):
+    """Test keyset pages walk all content newest first, with cursors both ways"""
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+        created = [
+            ContentService.create(f"Post {i}", f"Body {i}", user.id) for i in range(5)
+        ]
+        ContentService.create("Page", "Body", user.id, content_type="page")
+
+        first = ContentService.list_page(content_type="post", per_page=2)
+        second = ContentService.list_page(
+            content_type="post", per_page=2, after=first["next_cursor"]
+        )
+        third = ContentService.list_page(
+            content_type="post", per_page=2, after=second["next_cursor"]
+        )
+
+        pages = (first, second, third)
+        walked = [item.id for page in pages for item in page["items"]]
+        assert walked == [content.id for content in reversed(created)]
+        assert third["next_cursor"] is None
+        assert first["total"] == 5
+
+        back = ContentService.list_page(
+            content_type="post", per_page=2, before=second["prev_cursor"]
+        )
+        assert [item.id for item in back["items"]] == [
+            item.id for item in first["items"]
+        ]
+
+
+def test_content_service_counts_follow_writes(app):
+    """Test cached counts are dropped by writes and recounted once"""
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+        post = ContentService.create("Post", "Body", user.id)
+        assert ContentService.count() == 1
+        assert ContentService.count(status="draft") == 1
+        assert ContentService.count(author_id=user.id) == 1
+
+        ContentService.create("Another", "Body", user.id)
+        ContentService.publish(post.id)
+        counts = (
+            ContentService.count(),
+            ContentService.count(status="draft"),
+            ContentService.count(author_id=user.id),
+        )
+        ContentService.delete(post.id)
+        after_delete = ContentService.count()
+
+        statements, stop = _count_selects(app)
+        try:
+            cached = (ContentService.count(), ContentService.count(status="draft"))
+        finally:
+            stop()
+
+        assert counts == (2, 1, 2)
+        assert after_delete == 1
+        assert cached == (1, 1)
+        assert statements == []
+
+
+def test_content_service_search_count_cached(app):
+    """Test search totals are cached until content changes"""
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+        ContentService.create("Python Tutorial", "Learn Python", user.id)
+
+        assert ContentService.search("python")[1] == 1
+        statements, stop = _count_selects(app)
+        try:
+            assert ContentService.search("Python")[1] == 1
+        finally:
+            stop()
+        assert statements == []
+
+        ContentService.create("Python Tips", "More", user.id)
+        assert ContentService.search("python")[1] == 2
+
+
+def test_content_excerpt_maintained_on_write(app):
+    """Test the stored excerpt follows body on create and update"""
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+        post = ContentService.create("Post", "x" * 250, user.id)
+        assert post.excerpt == "x" * 200 + "..."
+
+        ContentService.update(post.id, body="Short body")
+        assert db.session.get(type(post), post.id).excerpt == "Short body"
+
+
+def test_content_list_views_defer_body(app):
+    """Test list queries leave body unloaded; detail views still get it"""
+    from sqlalchemy import event
+
+    with app.app_context():
+        user = UserService.create("testuser", "test@example.com", "password123")
+        post_id = ContentService.create("Post", "Long body " * 100, user.id).id
+        author_id = user.id
+        db.session.expunge_all()
+        cache_service.flush()
+
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            if "FROM content" in statement:
+                statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", before_execute)
+        try:
+            items, _total = ContentService.get_all()
+            page = ContentService.list_page()
+            by_author, _total = ContentService.get_by_author(author_id)
+            listed = items[0].to_dict()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", before_execute)
+
+        assert len(page["items"]) == len(by_author) == 1
+        assert statements and not any("content.body" in sql for sql in statements)
+        assert listed["excerpt"] == ("Long body " * 20) + "..."
+        assert listed["author"]["username"] == "testuser"
+
+        db.session.expunge_all()
+        cache_service.flush()
+        detail = ContentService.get_by_id(post_id).to_dict(include_body=True)
+        assert detail["body"] == "Long body " * 100
+
+
+# ---- StatsService Tests ----
+
+
+def test_stats_service_overview_counts(app):
+    """Test overview counts computed by the aggregate query"""
+    from datetime import datetime, timedelta
+
+    with app.app_context():
+        admin = UserService.create(
+            "admin", "admin@example.com", "admin123", is_admin=True
+        )
+        user = UserService.create("alice", "alice@example.com", "password123")
+        inactive = UserService.create("bob", "bob@example.com", "password123")
+
+        inactive.is_active = False
+        user.totp_enabled = True
+        user.last_login = datetime.utcnow()
+        admin.last_login = datetime.utcnow() - timedelta(days=3)
+        db.session.commit()
+        ContentService.create("Post", "Body", user.id)
+
+        assert StatsService.compute_overview() == {
+            "total_users": 3,
+            "active_users": 2,
+            "admin_users": 1,
+            "users_2fa": 1,
+            "recent_logins_24h": 1,
+            "content_items": 1,
+        }
+
+
+def test_stats_service_single_query_and_cached(app):
+    """Test the overview runs one query, then is served from cache"""
+    from sqlalchemy import event
+
+    with app.app_context():
+        UserService.create("alice", "alice@example.com", "password123")
+        statements = []
+
+        def before_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", before_execute)
+        try:
+            first = StatsService.get_overview()
+            second = StatsService.get_overview()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", before_execute)
+
+        assert first == second
+        assert first["total_users"] == 1
+        assert len(statements) == 1
+
+
+def test_stats_service_dropped_by_user_and_content_writes(app):
+    """Test user/content writes refresh the cached overview"""
+    with app.app_context():
+        alice = UserService.create("alice", "alice@example.com", "password123")
+        assert StatsService.get_overview()["total_users"] == 1
+
+        bob = UserService.create("bob", "bob@example.com", "password123")
+        assert StatsService.get_overview()["total_users"] == 2
+
+        UserService.update(bob.id, is_admin=True)
+        assert StatsService.get_overview()["admin_users"] == 1
+
+        ContentService.create("Post", "Body", alice.id)
+        assert StatsService.get_overview()["content_items"] == 1
+
+
+def test_api_stats_uses_stats_service(client):
+    """Test /api/data/stats reports real counts"""
+    with client.application.app_context():
+        UserService.create("alice", "alice@example.com", "password123")
+
+    data = client.get("/api/data/stats").get_json()
+
+    assert data["stats"]["users_total"] == 1
+    assert data["stats"]["content_items"] == 0
@@ -0,0 +1,309 @@
+"""
+Purpose: Tests for the server-side session store
+Description: SQLite/Redis stores, dirty tracking, sliding expiry, purge, revoke-all
+
+File: backend/tests/test_session_store.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T23:30:00+00:00
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+"""
+
+import time
+import uuid
+
+import pytest
+from flask import jsonify, render_template_string, session
+
+from backend.src.app import create_app, db
+from backend.src.decorators import require_authenticated
+from backend.src.models.admin_history import AdminHistory
+from backend.src.models.user import User
+from backend.src.routes import auth_2fa
+from backend.src.services import session_store
+from backend.src.services.cache_service import cache_service
+from backend.src.services.session_store import (
+    RedisSessionStore,
+    ServerSessionInterface,
+    SQLiteSessionStore,
+    session_user_id,
+)
+from backend.src.services.user_service import UserService
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def store(request, tmp_path):
+    """Each store implementation (Redis only when a server is reachable)"""
+    if request.param == "sqlite":
+        yield SQLiteSessionStore(str(tmp_path / "sessions.db"), purge_interval=0)
+        return
+
+    redis = pytest.importorskip("redis")
+    client = redis.Redis(socket_connect_timeout=0.2)
+    try:
+        client.ping()
+    except redis.RedisError:
+        pytest.skip("Redis server not available")
+    prefix = f"test:{uuid.uuid4().hex}:"
+    yield RedisSessionStore(client, prefix=prefix)
+    for key in client.scan_iter(f"{prefix}*"):
+        client.delete(key)
+
+
+@pytest.fixture
+def app(tmp_path):
+    """Create application on a temporary SQLite session store"""
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    cache_service.flush()
+
+    store = SQLiteSessionStore(str(tmp_path / "sessions.db"), purge_interval=0)
+    app.session_interface = ServerSessionInterface(store)
+    app.extensions["session_store"] = store
+
+    @app.route("/_test/lang")
+    def lang():
+        return render_template_string("{{ lang }}")
+
+    @app.route("/_test/whoami")
+    @require_authenticated
+    def whoami():
+        return jsonify(user_id=session_user_id(dict(session)))
+
+    @app.route("/_test/visit")
+    def visit():
+        session["visited"] = True
+        return jsonify(visited=True)
+
+    @app.route("/_test/login-2fa/<int:user_id>")
+    def login_2fa(user_id):
+        auth_2fa.login_user(user_id)
+        return jsonify(user_id=user_id)
+
+    with app.app_context():
+        db.create_all()
+        UserService.create("boss", "boss@example.com", "password123", is_admin=True)
+        UserService.create("member", "member@example.com", "password123")
+
+    # Requests run outside an app context (see test_principal)
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def login(app, username):
+    """Client logged in through the JSON login route"""
+    client = app.test_client()
+    response = client.post(
+        "/auth/login", json={"username": username, "password": "password123"}
+    )
+    assert response.status_code == 200, response.get_json()
+    return client
+
+
+def session_id(app, client):
+    """Session ID held by a client's cookie"""
+    cookie = client.get_cookie(app.config["SESSION_COOKIE_NAME"])
+    return app.session_interface._signer(app).unsign(cookie.value).decode()
+
+
+def count_writes(store, monkeypatch):
+    """Count save() and touch() calls on a store"""
+    calls = {"save": 0, "touch": 0}
+    for name in calls:
+        original = getattr(store, name)
+
+        def wrapper(*args, _name=name, _original=original, **kwargs):
+            calls[_name] += 1
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(store, name, wrapper)
+    return calls
+
+
+# ---- Stores ----
+
+
+def test_store_roundtrip(store):
+    """Test data survives a save/load and touch slides the expiry"""
+    payload = {"lang": "fr", "pair": (1, 2), "raw": b"\x00"}
+    expires_at = store.save("sid-1", payload, 7, ttl=60)
+
+    data, loaded_expiry = store.load("sid-1")
+    assert data == payload
+    assert loaded_expiry == pytest.approx(expires_at, abs=2)
+
+    assert store.touch("sid-1", 3600) > expires_at
+    assert store.load("sid-1")[1] > expires_at + 3000
+
+    store.delete("sid-1", 7)
+    assert store.load("sid-1") is None
+
+
+def test_store_revoke_user(store):
+    """Test one call removes every session of a user and only those"""
+    store.save("a", {"_user_id": "1:0"}, 1, ttl=60)
+    store.save("b", {"_user_id": "1:0"}, 1, ttl=60)
+    store.save("c", {"_user_id": "2:0"}, 2, ttl=60)
+
+    assert sorted(store.user_sessions(1)) == ["a", "b"]
+    assert store.revoke_user(1) == 2
+
+    assert store.user_sessions(1) == []
+    assert store.load("a") is None
+    assert store.load("c") is not None
+
+
+def test_store_index_follows_login_change(store):
+    """Test a session logged in as another user leaves the first user's index"""
+    store.save("a", {"_user_id": "1:0"}, 1, ttl=60)
+    store.save("a", {"_user_id": "2:0"}, 2, ttl=60, previous_user_id=1)
+
+    assert store.user_sessions(1) == []
+    assert store.user_sessions(2) == ["a"]
+    assert store.revoke_user(1) == 0
+    assert store.load("a") is not None
+
+
+def test_sqlite_purge(tmp_path):
+    """Test expired rows are purged, once per interval across workers"""
+    store = SQLiteSessionStore(str(tmp_path / "sessions.db"), purge_interval=3600)
+    store.save("old", {"x": 1}, None, ttl=-1)
+    store.save("live", {"x": 1}, None, ttl=60)
+
+    assert store.load("old") is None
+    assert store.purge() == 1
+    store.save("old", {"x": 1}, None, ttl=-1)
+    assert store.purge() == 0  # Lease taken for this interval
+
+    count = store._db().execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+    assert count == 2
+
+
+def test_sqlite_removes_legacy_files(tmp_path):
+    """Test Flask-Session's file directory is removed"""
+    legacy = tmp_path / "sessions"
+    legacy.mkdir()
+    (legacy / "2029f1ab").write_bytes(b"legacy")
+
+    store = SQLiteSessionStore(str(tmp_path / "sessions.db"), legacy_dir=str(legacy))
+    store._remove_legacy_files()
+
+    assert not legacy.exists()
+
+
+def test_session_user_id():
+    """Test both login flows are indexed by user ID"""
+    assert session_user_id({"_user_id": "5:2"}) == 5
+    assert session_user_id({"user_id": 6}) == 6
+    assert session_user_id({"lang": "fr"}) is None
+
+
+# ---- Session interface ----
+
+
+def test_anonymous_views_store_nothing(app):
+    """Test language detection alone does not create a session"""
+    client = app.test_client()
+    response = client.get("/_test/lang", headers={"Accept-Language": "fr-FR,fr;q=0.9"})
+
+    assert response.status_code == 200
+    assert "Set-Cookie" not in response.headers
+    rows = app.session_interface.store._db().execute("SELECT COUNT(*) FROM sessions")
+    assert rows.fetchone()[0] == 0
+
+
+def test_unchanged_sessions_are_not_rewritten(app, monkeypatch):
+    """Test only changes write, and expiry slides at most once per interval"""
+    client = login(app, "member")
+    writes = count_writes(app.session_interface.store, monkeypatch)
+
+    for _ in range(3):
+        assert client.get("/_test/whoami").status_code == 200
+    assert writes == {"save": 1, "touch": 0}  # First request caches the principal
+
+    monkeypatch.setattr(session_store, "SESSION_TOUCH_INTERVAL", -1)
+    store = app.session_interface.store
+    before = store.load(store.user_sessions(2)[0])[1]
+    time.sleep(0.01)
+    client.get("/_test/whoami")
+
+    assert writes == {"save": 1, "touch": 1}
+    assert store.load(store.user_sessions(2)[0])[1] > before
+
+
+def test_logout_deletes_session_from_index(app):
+    """Test a logged-out session no longer counts for the user"""
+    client = login(app, "member")
+    assert len(app.session_interface.store.user_sessions(2)) == 1
+
+    client.post("/auth/logout", json={})
+
+    assert app.session_interface.store.user_sessions(2) == []
+
+
+@pytest.mark.parametrize("flow", ["password", "2fa"])
+def test_login_issues_new_session_id(app, flow):
+    """Test a session ID known before login is dropped (session fixation)"""
+    client = app.test_client()
+    client.get("/_test/visit")
+    planted = session_id(app, client)
+    store = app.session_interface.store
+
+    if flow == "password":
+        response = client.post(
+            "/auth/login", json={"username": "member", "password": "password123"}
+        )
+    else:
+        response = client.get("/_test/login-2fa/2")
+    assert response.status_code == 200
+
+    sid = session_id(app, client)
+    assert sid != planted
+    assert store.load(planted) is None
+    assert store.load(sid)[0]["visited"] is True
+    assert store.user_sessions(2) == [sid]
+
+    # A client still holding the planted cookie is not logged in
+    attacker = app.test_client()
+    attacker.set_cookie(
+        app.config["SESSION_COOKIE_NAME"],
+        app.session_interface._signer(app).sign(planted).decode(),
+    )
+    assert attacker.get("/_test/whoami").status_code == 401
+
+
+def test_admin_revokes_all_sessions(app):
+    """Test revocation logs a user out everywhere, remember-me cookie included"""
+    laptop, phone = login(app, "member"), login(app, "member")
+    store = app.session_interface.store
+    assert len(store.user_sessions(2)) == 2
+
+    response = login(app, "boss").post("/admin/users/2/sessions/revoke")
+
+    assert response.status_code == 302
+    assert store.user_sessions(2) == []
+    with app.app_context():
+        assert db.session.get(User, 2).session_epoch == 1
+        entry = AdminHistory.query.filter_by(action="user_sessions_revoked").one()
+        assert (entry.target_type, entry.target_id) == ("user", 2)
+        assert entry.to_dict()["details"] == {"username": "member", "revoked": 2}
+
+    # The remember-me cookie still holds the old epoch
+    assert laptop.get_cookie("remember_token") is not None
+    assert laptop.get("/_test/whoami").status_code == 401
+    assert phone.get("/_test/whoami").status_code == 401
+
+    assert login(app, "member").get("/_test/whoami").get_json() == {"user_id": 2}
@@ -0,0 +1,270 @@
+"""
+Purpose: Tests for the Settings snapshot cache
+Description: Snapshot reads, change-version invalidation across workers
+
+File: backend/tests/test_settings_cache.py | Repository: X-Filamenta-Python
+Created: 2026-10-18T14:00:00+00:00
+
+Distributed by: XAREMA | Coder: AleGabMar
+App version: 0.1.0-Beta | File version: 0.1.0
+
+License: AGPL-3.0-or-later
+SPDX-License-Identifier: AGPL-3.0-or-later
+
+Copyright (c) 2025 XAREMA. All rights reserved.
+
+Metadata:
+- Status: Stable
+- Classification: Internal
+Notes:
+- Other workers are simulated by bumping the shared cache tag directly
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from backend.src.app import create_app, db
+from backend.src.models.settings import Settings
+from backend.src.services.cache_service import cache_service
+
+
+@pytest.fixture
+def app():
+    """Create application for testing"""
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    cache_service.flush()
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def _count_queries(app):
+    """Collect SQL statements run against the app's engine"""
+    statements = []
+
+    def before_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_execute)
+    return statements, lambda: event.remove(
+        db.engine, "before_cursor_execute", before_execute
+    )
+
+
+class TestSettingsSnapshot:
+    """Test Settings reads served from the per-app snapshot"""
+
+    def test_reads_are_dict_lookups(self, app):
+        """Test repeated reads run no SQL once the snapshot is loaded"""
+        Settings.set("smtp_host", "mail.example.com")
+        Settings.set("smtp_password", "s3cret")
+        Settings.get("smtp_host")
+
+        statements, stop = _count_queries(app)
+        try:
+            for _ in range(10):
+                assert Settings.get("smtp_host") == "mail.example.com"
+                assert Settings.get("smtp_password") == "s3cret"
+                assert Settings.get("missing", "default") == "default"
+        finally:
+            stop()
+
+        assert statements == []
+
+    def test_set_visible_immediately(self, app):
+        """Test the writing worker sees its own commit at once"""
+        Settings.set("site_name", "Before")
+        assert Settings.get("site_name") == "Before"
+
+        Settings.set("site_name", "After")
+        assert Settings.get("site_name") == "After"
+
+    def test_direct_orm_commit_invalidates(self, app):
+        """Test writes bypassing Settings.set still invalidate the snapshot"""
+        Settings.set("site_name", "Before")
+        assert Settings.get("site_name") == "Before"
+
+        row = Settings.query.filter_by(key="site_name").first()
+        row.set_value("After")
+        db.session.commit()
+        assert Settings.get("site_name") == "After"
+
+        Settings.query.delete()
+        db.session.commit()
+        assert Settings.get("site_name") is None
+
+    def test_rollback_discards_snapshot(self, app):
+        """Test values flushed then rolled back are never served"""
+        Settings.set("site_name", "Committed")
+
+        row = Settings.query.filter_by(key="site_name").first()
+        row.set_value("Uncommitted")
+        db.session.flush()
+        db.session.rollback()
+
+        assert Settings.get("site_name") == "Committed"
+
+    def test_other_worker_change_detected(self, app):
+        """Test a version bump from another worker triggers a reload"""
+        Settings.set("site_name", "Before")
+        assert Settings.get("site_name") == "Before"
+
+        # Another worker commits: the row changes and the tag is bumped,
+        # but this process' generation counter does not move
+        with db.engine.begin() as connection:
+            connection.execute(
+                Settings.__table__.update()
+                .where(Settings.__table__.c.key == "site_name")
+                .values(value="After")
+            )
+        assert Settings.get("site_name") == "Before"
+
+        cache_service.invalidate_tags([Settings.CACHE_TAG])
+        with patch.object(Settings, "SNAPSHOT_CHECK_INTERVAL", 0):
+            assert Settings.get("site_name") == "After"
+
+    def test_returned_containers_are_copies(self, app):
+        """Test callers cannot mutate the shared snapshot"""
+        Settings.set("allowed_hosts", ["a.example.com"])
+
+        Settings.get("allowed_hosts").append("evil.example.com")
+        Settings.get_all()["allowed_hosts"].append("evil.example.com")
+
+        assert Settings.get("allowed_hosts") == ["a.example.com"]
+
+
+class TestSettingsSetMany:
+    """Test bulk settings writes"""
+
+    def test_single_select_and_commit(self, app):
+        """Test set_many issues one SELECT, one commit and one version bump"""
+        Settings.set("smtp_host", "old.example.com")
+
+        statements, stop = _count_queries(app)
+        try:
+            with patch.object(
+                Settings, "invalidate_snapshot", wraps=Settings.invalidate_snapshot
+            ) as invalidate:
+                Settings.set_many(
+                    {
+                        "smtp_host": "new.example.com",
+                        "smtp_port": "587",
+                        "smtp_password": "s3cret",
+                        "site_name": "Bulk",
+                    }
+                )
+        finally:
+            stop()
+
+        selects = [
+            sql for sql in statements if sql.lstrip().upper().startswith("SELECT")
+        ]
+        assert len(selects) == 1
+        assert invalidate.call_count == 1
+        assert Settings.get("smtp_host") == "new.example.com"
+        assert Settings.get("smtp_password") == "s3cret"
+        assert Settings.query.filter_by(key="smtp_password").first().encrypted is True
+
+    def test_unchanged_values_not_written(self, app):
+        """Test saving an unchanged form writes nothing and keeps the snapshot"""
+        values = {"site_name": "Same", "registration_enabled": True, "smtp_user": "bob"}
+        Settings.set_many(values)
+
+        statements, stop = _count_queries(app)
+        try:
+            with patch.object(Settings, "invalidate_snapshot") as invalidate:
+                Settings.set_many(values)
+        finally:
+            stop()
+
+        assert not [
+            sql for sql in statements if sql.lstrip().upper().startswith("UPDATE")
+        ]
+        invalidate.assert_not_called()
+
+    def test_init_defaults_keeps_existing_values(self, app):
+        """Test init_defaults only creates missing keys"""
+        Settings.set("site_name", "Custom")
+
+        Settings.init_defaults()
+        Settings.init_defaults()
+
+        assert Settings.get("site_name") == "Custom"
+        assert Settings.get("smtp_host") == Settings.DEFAULTS["smtp_host"]["value"]
+        assert Settings.query.count() == len(Settings.DEFAULTS)
+
+
+class TestSettingsEncryption:
+    """Test the cached cipher and key rotation"""
+
+    def test_cipher_cached_per_key(self, app):
+        """Test the cipher is built once per SECRET_KEY and follows key changes"""
+        first = Settings._get_fernet_key(app)
+        assert Settings._get_fernet_key(app) is first
+
+        with patch.dict(app.config, {"SECRET_KEY": "another-secret-key-for-tests"}):
+            assert Settings._get_fernet_key(app) is not first
+
+    def test_decode_rows_single_cipher_lookup(self, app):
+        """Test batch decoding resolves the cipher once"""
+        Settings.set_many(
+            {"smtp_user": "bob", "smtp_password": "s3cret", "site_name": "X"}
+        )
+        rows = Settings.query.all()
+
+        with patch.object(
+            Settings, "_get_fernet_key", wraps=Settings._get_fernet_key
+        ) as get_cipher:
+            values = Settings.decode_rows(rows, app)
+
+        assert get_cipher.call_count == 1
+        assert values["smtp_user"] == "bob"
+        # Dummy value written by this test, not a credential
+        assert values["smtp_password"] == "s3cret"  # noqa: S105
+
+    def test_rotation_with_fallback_key(self, app):
+        """Test values stay readable during rotation and move to the new key"""
+        Settings.set("smtp_password", "s3cret")
+        old_key = app.config["SECRET_KEY"]
+        new_key = "rotated-secret-key-for-tests-0123456789"
+
+        with patch.dict(
+            app.config, {"SECRET_KEY": new_key, "SECRET_KEY_FALLBACKS": [old_key]}
+        ):
+            assert Settings.rotate_encryption() == 1
+            assert Settings.get("smtp_password") == "s3cret"
+
+        config = {"SECRET_KEY": new_key, "SECRET_KEY_FALLBACKS": []}
+        with patch.dict(app.config, config):
+            assert Settings.get("smtp_password") == "s3cret"
+
+    def test_rotation_without_old_key_writes_nothing(self, app):
+        """Test rotation aborts atomically when a value cannot be decrypted"""
+        from cryptography.fernet import InvalidToken
+
+        Settings.set("smtp_password", "s3cret")
+        stored = Settings.query.filter_by(key="smtp_password").first().value
+
+        with (
+            patch.dict(app.config, {"SECRET_KEY": "unrelated-key-0123456789abcdefgh"}),
+            pytest.raises(InvalidToken),
+        ):
+            Settings.rotate_encryption()
+
+        assert Settings.query.filter_by(key="smtp_password").first().value == stored
+
+    def test_rotate_command(self, app):
+        """Test the rotate-settings-key CLI command"""
+        Settings.set("smtp_password", "s3cret")
+
+        result = app.test_cli_runner().invoke(args=["rotate-settings-key"])
+
+        assert result.exit_code == 0
+        assert "1" in result.output
@@ -30,6 +30,7 @@
 import re
 
 import pyotp
+import pytest
 
 
 def test_generate_secret():  # type: ignore[no-untyped-def]
@@ -256,3 +257,126 @@ def test_verify_backup_code_no_codes(app):  # type: ignore[no-untyped-def]
 
         db.session.delete(user)
         db.session.commit()
+
+
+# ---- Indexed backup codes ----
+
+
+@pytest.fixture
+def backup_app():  # type: ignore[no-untyped-def]
+    """Application with an in-memory database and a user with saved backup codes"""
+    from backend.src.app import create_app
+    from backend.src.extensions import db
+    from backend.src.services.cache_service import cache_service
+    from backend.src.services.totp_service import TOTPService
+    from backend.src.services.user_service import UserService
+
+    app = create_app()
+    app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    cache_service.flush()
+
+    with app.app_context():
+        db.create_all()
+        user = UserService.create("backup", "backup@example.com", "password123")
+        codes, codes_json = TOTPService.generate_backup_codes(count=5)
+        user.enable_2fa(TOTPService.generate_secret())
+        TOTPService.save_backup_codes(user, codes_json)
+        db.session.commit()
+        app.backup_user, app.backup_codes_plain = user, codes
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def slow_hashes(monkeypatch):  # type: ignore[no-untyped-def]
+    """Count slow hash verifications"""
+    from backend.src.services import totp_service
+
+    calls = []
+    verify = totp_service.password_hasher.verify
+
+    def counting_verify(pwhash, password):  # type: ignore[no-untyped-def]
+        calls.append(pwhash)
+        return verify(pwhash, password)
+
+    monkeypatch.setattr(totp_service.password_hasher, "verify", counting_verify)
+    return calls
+
+
+def test_saved_backup_codes_are_rows(backup_app):  # type: ignore[no-untyped-def]
+    """Test saved codes move from the JSON column to one row each"""
+    from backend.src.models.backup_code import BackupCode
+
+    user = backup_app.backup_user
+    assert user.backup_codes is None
+    assert BackupCode.query.filter_by(user_id=user.id).count() == 5
+
+
+def test_backup_code_at_most_one_slow_hash(backup_app, slow_hashes):  # type: ignore[no-untyped-def]
+    """Test a wrong code costs no slow hash and a right one costs exactly one"""
+    from backend.src.services.totp_service import TOTPService
+
+    user, codes = backup_app.backup_user, backup_app.backup_codes_plain
+
+    assert TOTPService.verify_backup_code(user, "DEADBEEF") is False
+    assert slow_hashes == []
+
+    assert TOTPService.verify_backup_code(user, codes[3].lower()) is True
+    assert len(slow_hashes) == 1
+
+
+def test_backup_code_consumed_once(backup_app):  # type: ignore[no-untyped-def]
+    """Test a code is consumed by one row update, even if used twice at once"""
+    from sqlalchemy import update
+
+    from backend.src.extensions import db
+    from backend.src.models.backup_code import BackupCode
+    from backend.src.services.totp_service import TOTPService
+
+    user, codes = backup_app.backup_user, backup_app.backup_codes_plain
+
+    assert TOTPService.verify_backup_code(user, codes[0]) is True
+    db.session.commit()
+    assert TOTPService.verify_backup_code(user, codes[0]) is False
+    assert BackupCode.query.filter(BackupCode.used_at.isnot(None)).count() == 1
+
+    # Another request consumes codes[1] between our lookup and our update
+    original_execute = db.session.execute
+
+    def racing_execute(statement, *args, **kwargs):  # type: ignore[no-untyped-def]
+        if getattr(statement, "is_update", False):
+            original_execute(update(BackupCode).values(used_at=db.func.now()))
+        return original_execute(statement, *args, **kwargs)
+
+    db.session.execute = racing_execute
+    try:
+        assert TOTPService.verify_backup_code(user, codes[1]) is False
+    finally:
+        del db.session.execute
+
+
+def test_backup_code_survives_key_rotation(backup_app):  # type: ignore[no-untyped-def]
+    """Test codes indexed with a previous SECRET_KEY are still found"""
+    from backend.src.services.totp_service import TOTPService
+
+    user, codes = backup_app.backup_user, backup_app.backup_codes_plain
+    old_key = backup_app.config["SECRET_KEY"]
+    # Dummy value written by this test, not a credential
+    backup_app.config["SECRET_KEY"] = "rotated-key"  # noqa: S105
+    backup_app.config["SECRET_KEY_FALLBACKS"] = [old_key]
+
+    assert TOTPService.verify_backup_code(user, codes[2]) is True
+
+
+def test_disable_2fa_deletes_backup_codes(backup_app):  # type: ignore[no-untyped-def]
+    """Test disabling 2FA removes the stored codes"""
+    from backend.src.extensions import db
+    from backend.src.models.backup_code import BackupCode
+
+    user = backup_app.backup_user
+    user.disable_2fa()
+    db.session.commit()
+
+    assert BackupCode.query.filter_by(user_id=user.id).count() == 0
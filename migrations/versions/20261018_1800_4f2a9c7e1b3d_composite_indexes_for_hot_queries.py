@@ -0,0 +1,71 @@
+"""composite indexes for hot queries
+
+Listings filter on type/status/author and order by (created_at, id); the
+admin history is read per admin, newest first. Single-column indexes that
+became a prefix of a composite index are dropped.
+
+Databases created with db.create_all() after this change already have the
+new indexes; existing ones are detected and skipped.
+
+Revision ID: 4f2a9c7e1b3d
+Revises:
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f2a9c7e1b3d'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns)
+COMPOSITE_INDEXES = [
+    ("ix_users_created_at_id", "users", ["created_at", "id"]),
+    ("ix_content_created_at_id", "content", ["created_at", "id"]),
+    ("ix_content_type_status_created_at", "content", ["type", "status", "created_at", "id"]),
+    ("ix_content_status_created_at", "content", ["status", "created_at", "id"]),
+    ("ix_content_author_created_at", "content", ["author_id", "created_at", "id"]),
+    ("ix_admin_history_admin_timestamp", "admin_history", ["admin_id", "timestamp"]),
+]
+
+# Covered by the leading columns of a composite index above
+REDUNDANT_INDEXES = [
+    ("ix_content_type", "content", ["type"]),
+    ("ix_content_status", "content", ["status"]),
+    ("ix_content_author_id", "content", ["author_id"]),
+]
+
+
+def _existing_indexes(table: str) -> set[str]:
+    """Names of the indexes currently defined on `table`"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return set()
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    # Create first: MySQL needs an index on author_id for the foreign key
+    for name, table, columns in COMPOSITE_INDEXES:
+        if name not in _existing_indexes(table):
+            op.create_index(name, table, columns)
+
+    for name, table, _columns in REDUNDANT_INDEXES:
+        if name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, columns in REDUNDANT_INDEXES:
+        if name not in _existing_indexes(table):
+            op.create_index(name, table, columns)
+
+    for name, table, _columns in reversed(COMPOSITE_INDEXES):
+        if name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,80 @@
+"""content excerpt
+
+Listings only show the first 200 characters of each body; the excerpt is now
+stored (kept in sync by the model on every body assignment) so list queries
+can leave the body column unloaded. Existing rows are backfilled in batches.
+
+Databases created with db.create_all() after this change already have the
+column; it is detected and skipped.
+
+Revision ID: 8c1e5d2a7f64
+Revises: 4f2a9c7e1b3d
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1e5d2a7f64'
+down_revision: Union[str, None] = '4f2a9c7e1b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+EXCERPT_LENGTH = 200
+BATCH_SIZE = 500
+
+
+def _has_column(table: str, column: str) -> bool:
+    """Whether `table` already has `column`"""
+    inspector = sa.inspect(op.get_bind())
+    return column in {col["name"] for col in inspector.get_columns(table)}
+
+
+def _excerpt(body: str | None) -> str:
+    """Same rule as models.content.make_excerpt (frozen for this revision)"""
+    body = body or ""
+    return body[:EXCERPT_LENGTH] + "..." if len(body) > EXCERPT_LENGTH else body
+
+
+def upgrade() -> None:
+    if not _has_column('content', 'excerpt'):
+        op.add_column(
+            'content',
+            sa.Column('excerpt', sa.String(length=EXCERPT_LENGTH + 3), nullable=True),
+        )
+
+    # Backfill in Python: string concatenation is not portable across dialects
+    bind = op.get_bind()
+    content = sa.table(
+        'content',
+        sa.column('id', sa.Integer),
+        sa.column('body', sa.Text),
+        sa.column('excerpt', sa.String),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(content.c.id, content.c.body)
+            .where(content.c.id > last_id, content.c.excerpt.is_(None))
+            .order_by(content.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            content.update()
+            .where(content.c.id == sa.bindparam('row_id'))
+            .values(excerpt=sa.bindparam('row_excerpt')),
+            [{'row_id': row.id, 'row_excerpt': _excerpt(row.body)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    if _has_column('content', 'excerpt'):
+        with op.batch_alter_table('content') as batch_op:
+            batch_op.drop_column('excerpt')
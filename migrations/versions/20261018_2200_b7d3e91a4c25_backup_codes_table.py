@@ -0,0 +1,50 @@
+"""backup codes table
+
+2FA backup codes move from the users.backup_codes JSON array to one row per
+code, found by an HMAC lookup and consumed by a single-row UPDATE.
+
+Codes already stored in users.backup_codes cannot be indexed (only their
+hashes are known); they keep working from the JSON column until the user
+sets up 2FA again.
+
+Revision ID: b7d3e91a4c25
+Revises: 8c1e5d2a7f64
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e91a4c25'
+down_revision: Union[str, None] = '8c1e5d2a7f64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table('backup_codes'):
+        return
+
+    op.create_table(
+        'backup_codes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('lookup', sa.String(length=32), nullable=False),
+        sa.Column('code_hash', sa.String(length=255), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('used_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_backup_codes_user_lookup', 'backup_codes', ['user_id', 'lookup'])
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('backup_codes'):
+        return
+
+    op.drop_index('ix_backup_codes_user_lookup', table_name='backup_codes')
+    op.drop_table('backup_codes')
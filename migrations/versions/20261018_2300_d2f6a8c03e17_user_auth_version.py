@@ -0,0 +1,45 @@
+"""user auth version
+
+users.auth_version is bumped whenever a user's username, role, admin flag,
+active flag or password changes. Sessions cache the user's principal and only
+reload it from the database when this version moves.
+
+Databases created with db.create_all() after this change already have the
+column; it is detected and skipped.
+
+Revision ID: d2f6a8c03e17
+Revises: b7d3e91a4c25
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f6a8c03e17'
+down_revision: Union[str, None] = 'b7d3e91a4c25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    """Whether `table` already has `column`"""
+    inspector = sa.inspect(op.get_bind())
+    return column in {col["name"] for col in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    if _has_column('users', 'auth_version'):
+        return
+
+    op.add_column('users', sa.Column('auth_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    if not _has_column('users', 'auth_version'):
+        return
+
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('auth_version')
@@ -0,0 +1,45 @@
+"""user session epoch
+
+users.session_epoch is part of the ID Flask-Login stores in sessions and
+remember-me cookies ("<id>:<epoch>"). Revoking a user's sessions bumps it, so
+logins made before the revocation no longer load.
+
+Databases created with db.create_all() after this change already have the
+column; it is detected and skipped.
+
+Revision ID: 5e9b1c7d4a20
+Revises: d2f6a8c03e17
+Create Date: 2026-10-18 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e9b1c7d4a20'
+down_revision: Union[str, None] = 'd2f6a8c03e17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    """Whether `table` already has `column`"""
+    inspector = sa.inspect(op.get_bind())
+    return column in {col["name"] for col in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    if _has_column('users', 'session_epoch'):
+        return
+
+    op.add_column('users', sa.Column('session_epoch', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    if not _has_column('users', 'session_epoch'):
+        return
+
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('session_epoch')